@@ -65,6 +65,27 @@ class env(_generic._env):
 
     ASSEMBLIT_ANALYSIS_DB_QUERY_INDEX : `Optional[str]` = "run_id"
         The name of the query-index of the analysis-database.
+
+    ASSEMBLIT_DB_PROFILE : `Optional[str]` = "default"
+        The name of the database performance profile, `default`, `concurrent` or `bulk-load`.
+
+    ASSEMBLIT_DB_POOL_SIZE : `Optional[int]` = 10
+        The maximum number of open connections to each database, shared across sessions.
+
+    ASSEMBLIT_DATASET_ENGINE : `Optional[str]` = "sqlite"
+        The name of the dataset storage engine, `sqlite` or `parquet`.
+
+    ASSEMBLIT_DB_CACHE_SIZE : `Optional[float]` = 0
+        The capacity of the database read cache in megabytes. The cache is disabled when `0`.
+
+    ASSEMBLIT_DB_SLOW_QUERY_MS : `Optional[float]` = 0
+        The slow-query log threshold in milliseconds. The slow-query log is disabled when `0`.
+
+    ASSEMBLIT_DB_WRITER : `Optional[bool]` = False
+        `True` or `False`, whether writes are serialized by a single background writer per database.
+
+    ASSEMBLIT_ANALYTICS_ENGINE : `Optional[str]` = "pandas"
+        The name of the dataset analytical engine, `pandas` or `duckdb`.
     """
 
     # [required]
@@ -89,3 +110,12 @@ class env(_generic._env):
     # Analysis db settings
     ASSEMBLIT_ANALYSIS_DB_NAME: Optional[str] = field(default="analysis")
     ASSEMBLIT_ANALYSIS_DB_QUERY_INDEX: Optional[str] = field(default="run_id")
+
+    # Db performance settings
+    ASSEMBLIT_DB_PROFILE: Optional[str] = field(default="default")
+    ASSEMBLIT_DB_POOL_SIZE: Optional[int] = field(default=10)
+    ASSEMBLIT_DATASET_ENGINE: Optional[str] = field(default="sqlite")
+    ASSEMBLIT_DB_CACHE_SIZE: Optional[float] = field(default=0)
+    ASSEMBLIT_DB_SLOW_QUERY_MS: Optional[float] = field(default=0)
+    ASSEMBLIT_DB_WRITER: Optional[bool] = field(default=False)
+    ASSEMBLIT_ANALYTICS_ENGINE: Optional[str] = field(default="pandas")
@@ -10,6 +10,7 @@ import assemblit
 from assemblit import _app
 from assemblit.toolkit import _yaml, content
 from assemblit._orchestrator import layer
+from assemblit._database import _analytics, _pool, _profiles, _storage
 
 
 # Define abstracted web-application function(s)
@@ -32,7 +33,14 @@ def load_app_environment(
     data_db_name: Union[str, None] = 'data',
     data_db_query_index: Union[str, None] = 'dataset_id',
     analysis_db_name: Union[str, None] = 'analysis',
-    analysis_db_query_index: Union[str, None] = 'run_id'
+    analysis_db_query_index: Union[str, None] = 'run_id',
+    db_profile: Union[str, None] = 'default',
+    db_pool_size: Union[str, None] = '10',
+    dataset_engine: Union[str, None] = 'sqlite',
+    db_cache_size: Union[str, None] = '0',
+    db_slow_query_ms: Union[str, None] = '0',
+    db_writer: Union[str, None] = 'False',
+    analytics_engine: Union[str, None] = 'pandas'
 ) -> Tuple[
         str,
         str,
@@ -44,9 +52,18 @@ def load_app_environment(
         str,
         Union[str, os.PathLike],
         int,
-        Union[bool, None],
+        Union[str, None],
+        Union[str, None],
+        bool,
         Union[str, os.PathLike, None],
         Union[str, None],
+        Union[int, None],
+        Union[str, None],
+        Union[float, None],
+        Union[float, None],
+        bool,
+        Union[str, None],
+        Union[str, None],
         Union[str, None],
         Union[str, None],
         Union[str, None],
@@ -73,8 +90,17 @@ def load_app_environment(
     - `GITHUB_BRANCH_NAME`
     - `ROOT_DIR`
     - `CLIENT_PORT`
+    - `AUTH_NAME`
+    - `AUTH_QUERY_INDEX`
     - `REQUIRE_AUTHENTICATION`
     - `DB_DIR`
+    - `DB_PROFILE`
+    - `DB_POOL_SIZE`
+    - `DATASET_ENGINE`
+    - `DB_CACHE_SIZE`
+    - `DB_SLOW_QUERY_MS`
+    - `DB_WRITER`
+    - `ANALYTICS_ENGINE`
     - `USERS_DB_NAME`
     - `USERS_DB_QUERY_INDEX`
     - `SESSIONS_DB_NAME`
@@ -149,6 +175,27 @@ def load_app_environment(
 
     analysis_db_query_index : Optional[`str`] = "run_id"
         The name of the query-index of the analysis-database.
+
+    db_profile : Optional[`str`] = "default"
+        The name of the database performance profile, `default`, `concurrent` or `bulk-load`.
+
+    db_pool_size : Optional[`str`] = "10"
+        The maximum number of open connections to each database, shared across sessions.
+
+    dataset_engine : Optional[`str`] = "sqlite"
+        The name of the dataset storage engine, `sqlite` or `parquet`.
+
+    db_cache_size : Optional[`str`] = "0"
+        The capacity of the database read cache in megabytes. The cache is disabled when `0`.
+
+    db_slow_query_ms : Optional[`str`] = "0"
+        The slow-query log threshold in milliseconds. The slow-query log is disabled when `0`.
+
+    db_writer : Optional[`str`] = "False"
+        `True` or `False`, whether writes are serialized by a single background writer per database.
+
+    analytics_engine : Optional[`str`] = "pandas"
+        The name of the dataset analytical engine, `pandas` or `duckdb`.
     """
 
     # Validate the web-application type
@@ -175,7 +222,14 @@ def load_app_environment(
             ASSEMBLIT_DATA_DB_NAME=data_db_name,
             ASSEMBLIT_DATA_DB_QUERY_INDEX=data_db_query_index,
             ASSEMBLIT_ANALYSIS_DB_NAME=analysis_db_name,
-            ASSEMBLIT_ANALYSIS_DB_QUERY_INDEX=analysis_db_query_index
+            ASSEMBLIT_ANALYSIS_DB_QUERY_INDEX=analysis_db_query_index,
+            ASSEMBLIT_DB_PROFILE=db_profile or _profiles.DEFAULT,
+            ASSEMBLIT_DB_POOL_SIZE=utils.as_type(db_pool_size or _pool.DEFAULT_MAX_SIZE, return_dtype='int'),
+            ASSEMBLIT_DATASET_ENGINE=dataset_engine or _storage.DEFAULT,
+            ASSEMBLIT_DB_CACHE_SIZE=utils.as_type(db_cache_size or 0, return_dtype='float'),
+            ASSEMBLIT_DB_SLOW_QUERY_MS=utils.as_type(db_slow_query_ms or 0, return_dtype='float'),
+            ASSEMBLIT_DB_WRITER=utils.as_type(db_writer or 'False', return_dtype='bool'),
+            ASSEMBLIT_ANALYTICS_ENGINE=analytics_engine or _analytics.DEFAULT
         )
 
         # Validate the port-configuration settings
@@ -184,6 +238,51 @@ def load_app_environment(
             port=application.ASSEMBLIT_CLIENT_PORT
         )
 
+        # Validate the database profile
+        application.ASSEMBLIT_DB_PROFILE = _yaml.validate_type(
+            env='database profile',
+            type_=application.ASSEMBLIT_DB_PROFILE,
+            supported_types=list(_profiles.PROFILES)
+        )
+
+        # Validate the dataset storage engine
+        application.ASSEMBLIT_DATASET_ENGINE = _yaml.validate_type(
+            env='dataset storage engine',
+            type_=application.ASSEMBLIT_DATASET_ENGINE,
+            supported_types=list(_storage.ENGINES)
+        )
+
+        # Validate the dataset analytical engine
+        application.ASSEMBLIT_ANALYTICS_ENGINE = _yaml.validate_type(
+            env='dataset analytical engine',
+            type_=application.ASSEMBLIT_ANALYTICS_ENGINE,
+            supported_types=list(_analytics.ENGINES)
+        )
+
+        # Validate the database pool size
+        if application.ASSEMBLIT_DB_POOL_SIZE < 1:
+            raise ValueError(
+                'Invalid database pool size {%s}. The pool size must be a positive number of connections.' % (
+                    application.ASSEMBLIT_DB_POOL_SIZE
+                )
+            )
+
+        # Validate the database read cache capacity
+        if application.ASSEMBLIT_DB_CACHE_SIZE < 0:
+            raise ValueError(
+                'Invalid database cache size {%s}. The cache size must be a non-negative number of megabytes.' % (
+                    application.ASSEMBLIT_DB_CACHE_SIZE
+                )
+            )
+
+        # Validate the slow-query log threshold
+        if application.ASSEMBLIT_DB_SLOW_QUERY_MS < 0:
+            raise ValueError(
+                'Invalid slow-query threshold {%s}. The threshold must be a non-negative number of milliseconds.' % (
+                    application.ASSEMBLIT_DB_SLOW_QUERY_MS
+                )
+            )
+
         # Construct session-state defaults
         session_state_defaults = _construct_session_state_defaults(
             root_dir=application.ASSEMBLIT_DIR,
@@ -243,6 +342,13 @@ def load_app_environment(
             auth_query_index,
             application.ASSEMBLIT_REQUIRE_AUTHENTICATION,
             os.path.abspath(os.path.join(application.ASSEMBLIT_DIR, 'db')),
+            application.ASSEMBLIT_DB_PROFILE,
+            application.ASSEMBLIT_DB_POOL_SIZE,
+            application.ASSEMBLIT_DATASET_ENGINE,
+            application.ASSEMBLIT_DB_CACHE_SIZE,
+            application.ASSEMBLIT_DB_SLOW_QUERY_MS,
+            application.ASSEMBLIT_DB_WRITER,
+            application.ASSEMBLIT_ANALYTICS_ENGINE,
             application.ASSEMBLIT_USERS_DB_NAME,
             application.ASSEMBLIT_USERS_DB_QUERY_INDEX,
             application.ASSEMBLIT_SESSIONS_DB_NAME,
@@ -306,6 +412,13 @@ def load_app_environment(
             auth_query_index,
             False,  # Require authentication
             None,  # Database directory
+            None,  # Database profile
+            None,  # Database pool size
+            None,  # Dataset storage engine
+            None,  # Database read cache capacity
+            None,  # Slow-query log threshold
+            False,  # Single-writer
+            None,  # Dataset analytical engine
             None,  # Users db name
             None,  # Users db query-index
             None,  # Sessions db name
@@ -1,7 +1,10 @@
 """ Datatype adapters and converters """
 
+from typing import Any, ClassVar, List
 import sqlite3
 import datetime
+import numpy as np
+import pandas as pd
 
 
 # Define sqlite datatype adapter(s) and converter(s)
@@ -10,10 +13,35 @@ class Sqlite():
 
     Additional supported datatypes,
         - `datetime.datetime`
+        - `datetime.date`
         - `datetime.timedelta`
+        - `pandas.Timestamp`
+        - `numpy` boolean, integer and floating-point scalars
 
+    Values of these datatypes are bound to statements natively, and columns declared as
+    `BOOLEAN`, `DATETIME` or `TIMEDELTA` are converted back when they are selected.
     """
 
+    # Define the datatypes with a registered adapter
+    TYPES: ClassVar[List[type]] = [
+        datetime.datetime,
+        datetime.date,
+        datetime.timedelta,
+        pd.Timestamp,
+        np.bool_,
+        np.int8,
+        np.int16,
+        np.int32,
+        np.int64,
+        np.uint8,
+        np.uint16,
+        np.uint32,
+        np.uint64,
+        np.float16,
+        np.float32,
+        np.float64
+    ]
+
     # Datetime
     def adapt_datetime(dt: datetime.datetime):
         """ Adapts `datetime.datetime` as a `str`.
@@ -26,14 +54,29 @@ class Sqlite():
         return dt.strftime("%Y-%m-%d %H:%M:%S")
 
     def convert_datetime(object: bytes):
-        """ Converts a sqlite value stored as `str` to 'datetime.datetime`.
+        """ Converts a sqlite value stored as `str` to 'datetime.datetime`. Values that are not
+        ISO-formatted date-times are returned as `str`.
 
         Parameters
         ----------
         object : `bytes`
             Represents a bytes encoded `str`.
         """
-        return datetime.datetime.strptime(object.decode(), "%Y-%m-%d %H:%M:%S")
+        try:
+            return datetime.datetime.fromisoformat(object.decode())
+        except ValueError:
+            return object.decode()
+
+    # Date
+    def adapt_date(d: datetime.date):
+        """ Adapts `datetime.date` as a `str`.
+
+        Parameters
+        ----------
+        d : `datetime.date`
+            Date object.
+        """
+        return d.isoformat()
 
     # Timedelta
     def adapt_timedelta(td: datetime.timedelta):
@@ -56,14 +99,63 @@ class Sqlite():
         """
         return datetime.timedelta(seconds=float(object.decode()))
 
+    # Boolean
+    def convert_boolean(object: bytes):
+        """ Converts a sqlite value stored as `int`, or as `str` by earlier versions, to `bool`.
+
+        Parameters
+        ----------
+        object : `bytes`
+            Represents a bytes encoded `int` or `str`.
+        """
+        return object.decode().strip().upper() not in ['0', '0.0', 'FALSE', '']
+
+    # Numpy
+    def adapt_numpy(value: np.generic):
+        """ Adapts a `numpy` scalar as its python 'built-in' value.
+
+        Parameters
+        ----------
+        value : `np.generic`
+            Numpy scalar object.
+        """
+        return value.item()
+
+    def adapt(value: Any) -> Any:
+        """ Returns `value` when it can be bound to a statement natively, otherwise the value as a `str`.
+
+        Parameters
+        ----------
+        value : `Any`
+            The value to bind.
+        """
+        if value is pd.NaT:
+            return None
+        elif value is None or isinstance(value, (int, float, str, bytes)) or type(value) in Sqlite.TYPES:
+            return value
+        else:
+            return '%s' % (value)
+
     def register():
         """ Registers all object adapters and converters.
         """
 
         # Register datetime
         sqlite3.register_adapter(datetime.datetime, Sqlite.adapt_datetime)
+        sqlite3.register_adapter(pd.Timestamp, Sqlite.adapt_datetime)
         sqlite3.register_converter('DATETIME', Sqlite.convert_datetime)
 
+        # Register date
+        sqlite3.register_adapter(datetime.date, Sqlite.adapt_date)
+
         # Register timedelta
         sqlite3.register_adapter(datetime.timedelta, Sqlite.adapt_timedelta)
         sqlite3.register_converter('TIMEDELTA', Sqlite.convert_timedelta)
+
+        # Register boolean
+        sqlite3.register_converter('BOOLEAN', Sqlite.convert_boolean)
+
+        # Register numpy scalars
+        for numpy_type in Sqlite.TYPES:
+            if issubclass(numpy_type, np.generic):
+                sqlite3.register_adapter(numpy_type, Sqlite.adapt_numpy)
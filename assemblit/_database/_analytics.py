@@ -0,0 +1,407 @@
+""" Dataset analytical engines
+
+Pluggable engines that aggregate and describe stored datasets for the data-review
+summary report. The engine is selected within '/.assemblit/config.yaml' via the
+`ASSEMBLIT_ANALYTICS_ENGINE` environment variable.
+
+- `pandas`: compiles the time-series aggregation into a group-by query executed by the
+    storage engine, or reads the referenced columns of the dataset into a `pandas.DataFrame`
+    and aggregates it with `assemblit.toolkit.aggregator`.
+- `duckdb`: executes the group-by, descriptive statistics and time-series aggregation
+    with an embedded, multi-threaded `duckdb` database directly over the stored dataset,
+    either a `sqlite` table or a Parquet file, and returns only the aggregated result.
+    Requires `duckdb`. The `sqlite` extension of `duckdb` is installed and loaded once,
+    when the engine starts, rather than downloaded on first use, so `sqlite` datasets
+    cannot be scanned offline unless the extension is already installed.
+
+Requests that an engine cannot execute raise `Unsupported`, and are answered by the
+`pandas` engine instead.
+"""
+
+from __future__ import annotations
+import os
+import threading
+from typing import Dict, List, Type, Union
+import pandas as pd
+from assemblit.toolkit import aggregator
+from assemblit._database import _generic, _storage
+from assemblit._database._storage import quote
+
+try:
+    import duckdb
+except ImportError:  # pragma: no cover
+    duckdb = None
+
+# Define the environment variable that selects the engine
+ENVIRONMENT_VARIABLE: str = 'ASSEMBLIT_ANALYTICS_ENGINE'
+DEFAULT: str = 'pandas'
+
+
+# Define the dataset analytical engine `class`
+class Engine():
+    """ A `class` that represents a dataset analytical engine of the `data` database. """
+
+    name: str = ''
+
+    def __init__(
+        self,
+        Database: _generic.Connection
+    ):
+        """ Initializes an instance of the dataset analytical engine `class`.
+
+        Parameters
+        ----------
+        Database : `_generic.Connection`
+            Connection to the data database.
+        """
+
+        # Assign class variables
+        self.Database: _generic.Connection = Database
+
+    def aggregate(
+        self,
+        location: str,
+        datetime: Union[list, None] = None,
+        dimension: Union[list, None] = None,
+        metrics: Union[list, None] = None,
+        aggrules: Union[list, None] = None
+    ) -> pd.DataFrame:
+        """ Groups a dataset by `dimension` and/or `datetime`, aggregates `metrics` with `aggrules` and
+        returns the result as a `pd.DataFrame`, equivalent to `assemblit.toolkit.aggregator.agg_df`.
+
+        Parameters
+        ----------
+        location : `str`
+            Physical location of the dataset.
+        datetime : `Union[list, None]`
+            Ordered list of the date-time columns and their formats.
+        dimension : `Union[list, None]`
+            Ordered list of categorical columns to group the records.
+        metrics : `Union[list, None]`
+            Ordered list of numeric columns to summarize by `aggrules`.
+        aggrules : `Union[list, None]`
+            Ordered list of aggregation rules that determine the aggregation of the `metrics`.
+        """
+        raise NotImplementedError
+
+    def describe(
+        self,
+        location: str,
+        dimension: Union[list, None] = None,
+        metrics: Union[list, None] = None,
+        aggrules: Union[list, None] = None
+    ) -> pd.DataFrame:
+        """ Groups a dataset by `dimension`, calculates descriptive statistics and returns the result as a
+        `pd.DataFrame`, equivalent to `assemblit.toolkit.aggregator.describe_df`.
+
+        Parameters
+        ----------
+        location : `str`
+            Physical location of the dataset.
+        dimension : `Union[list, None]`
+            Ordered list of categorical columns to group the records.
+        metrics : `Union[list, None]`
+            Ordered list of numeric columns to summarize by `aggrules`.
+        aggrules : `Union[list, None]`
+            Ordered list of aggregation rules that determine the aggregation of the `metrics`.
+        """
+        raise NotImplementedError
+
+
+# Define the pandas dataset analytical engine `class`
+class Pandas(Engine):
+    """ A `class` that aggregates datasets with a group-by query executed by the storage engine, or
+    in-memory with `assemblit.toolkit.aggregator` when the storage engine lacks an aggregation rule.
+    """
+
+    name: str = 'pandas'
+
+    def aggregate(
+        self,
+        location: str,
+        datetime: Union[list, None] = None,
+        dimension: Union[list, None] = None,
+        metrics: Union[list, None] = None,
+        aggrules: Union[list, None] = None
+    ) -> pd.DataFrame:
+
+        # Push the group-by down to the storage engine, unless it lacks an aggregation rule
+        try:
+            return _storage.resolve(Database=self.Database, location=location).aggregate(
+                location=location,
+                datetime=datetime,
+                dimension=dimension,
+                metrics=metrics,
+                aggrules=aggrules
+            )
+        except Unsupported:
+            pass
+
+        return aggregator.agg_df(
+            df=self._read(location=location, columns=[i[0] for i in (datetime or [])[:1]] + (dimension or []) + metrics),
+            datetime=datetime,
+            dimension=dimension,
+            metrics=metrics,
+            aggrules=aggrules
+        )
+
+    def describe(
+        self,
+        location: str,
+        dimension: Union[list, None] = None,
+        metrics: Union[list, None] = None,
+        aggrules: Union[list, None] = None
+    ) -> pd.DataFrame:
+        return aggregator.describe_df(
+            df=self._read(location=location, columns=(dimension or []) + metrics),
+            dimension=dimension,
+            metrics=metrics,
+            aggrules=aggrules
+        )
+
+    def _read(
+        self,
+        location: str,
+        columns: List[str]
+    ) -> pd.DataFrame:
+        """ Reads the referenced columns of a dataset. """
+        return _storage.resolve(Database=self.Database, location=location).read(
+            location=location,
+            columns=list(dict.fromkeys(columns))
+        )
+
+
+# Define the duckdb dataset analytical engine `class`
+class DuckDB(Engine):
+    """ A `class` that aggregates datasets with an embedded `duckdb` database, directly over the stored
+    `sqlite` table or Parquet file.
+    """
+
+    name: str = 'duckdb'
+
+    # Define the SQL-expression of each `pandas` aggregation function
+    FUNCTIONS: Dict[str, str] = {
+        'count': 'COUNT(%s)',
+        'sum': 'COALESCE(SUM(%s), 0)',
+        'min': 'MIN(%s)',
+        'max': 'MAX(%s)',
+        'mean': 'AVG(%s)',
+        'median': 'MEDIAN(%s)',
+        'mode': 'MODE(%s)',
+        'std': 'STDDEV_SAMP(%s)',
+        'var': 'VAR_SAMP(%s)'
+    }
+
+    # Define the SQL-expression of each descriptive statistic of `pandas.DataFrame.describe`
+    STATISTICS: Dict[str, str] = {
+        'count': 'CAST(COUNT(%s) AS DOUBLE)',
+        'mean': 'AVG(%s)',
+        'std': 'STDDEV_SAMP(%s)',
+        'min': 'CAST(MIN(%s) AS DOUBLE)',
+        '25%': 'QUANTILE_CONT(%s, 0.25)',
+        '50%': 'QUANTILE_CONT(%s, 0.5)',
+        '75%': 'QUANTILE_CONT(%s, 0.75)',
+        'max': 'CAST(MAX(%s) AS DOUBLE)'
+    }
+
+    def __init__(
+        self,
+        Database: _generic.Connection
+    ):
+        if duckdb is None:
+            raise ImportError(
+                'The `duckdb` analytical engine requires `duckdb`. Install it with `pip install assemblit[duckdb]`.'
+            )
+        super().__init__(Database=Database)
+
+        # Install and load the extensions of the process-wide `duckdb` database
+        get_connection()
+
+    def aggregate(
+        self,
+        location: str,
+        datetime: Union[list, None] = None,
+        dimension: Union[list, None] = None,
+        metrics: Union[list, None] = None,
+        aggrules: Union[list, None] = None
+    ) -> pd.DataFrame:
+        functions = dict(zip(metrics, aggregator.parse_aggrules(aggrules=aggrules)))
+
+        # Build the group-by keys
+        keys = [quote(i) for i in (dimension or [])]
+        if datetime:
+            keys += ["STRPTIME(CAST(%s AS VARCHAR), '%s') AS %s" % (
+                quote(datetime[0][0]),
+                str(datetime[0][1]).replace("'", "''"),
+                quote(datetime[0][0])
+            )]
+
+        return self._execute(
+            query='SELECT %s FROM %s %s;' % (
+                ', '.join(keys + [
+                    '%s AS %s' % (self.FUNCTIONS[function] % (quote(metric)), quote(metric))
+                    for metric, function in functions.items()
+                ]),
+                self._source(location=location),
+                group_by(columns=(dimension or []) + [i[0] for i in (datetime or [])[:1]])
+            ),
+            columns=(dimension or []) + [i[0] for i in (datetime or [])[:1]] + list(functions)
+        )
+
+    def describe(
+        self,
+        location: str,
+        dimension: Union[list, None] = None,
+        metrics: Union[list, None] = None,
+        aggrules: Union[list, None] = None
+    ) -> pd.DataFrame:
+        if len(metrics) != 1 or len(aggrules) != 1 or len(dimension or []) > 1:
+            raise Unsupported('The `duckdb` analytical engine describes a single metric by at most one dimension.')
+        function = aggregator.parse_aggrules(aggrules=aggrules)[0]
+
+        keys = [quote(i) for i in (dimension or [])]
+        return self._execute(
+            query='SELECT %s FROM %s %s;' % (
+                ', '.join(
+                    keys
+                    + ['%s AS %s' % (self.FUNCTIONS[function] % (quote(metrics[0])), quote(aggrules[0]))]
+                    + [
+                        '%s AS %s' % (expression % (quote(metrics[0])), quote(name))
+                        for name, expression in self.STATISTICS.items()
+                    ]
+                ),
+                self._source(location=location),
+                group_by(columns=dimension or [])
+            ),
+            columns=(dimension or []) + [aggrules[0]] + list(self.STATISTICS)
+        )
+
+    def _source(
+        self,
+        location: str
+    ) -> str:
+        """ Returns the `duckdb` table-function that scans a stored dataset as a `str`. """
+        engine = _storage.resolve(Database=self.Database, location=location)
+        if isinstance(engine, _storage.Parquet):
+            return "READ_PARQUET('%s')" % (engine.path(location=location).replace("'", "''"))
+        elif 'sqlite' in _FAILURES:
+            raise Unsupported(
+                ' '.join([
+                    'The `duckdb` analytical engine cannot scan `sqlite` datasets, as its `sqlite` extension',
+                    'could not be installed or loaded (%s).' % (_FAILURES['sqlite']),
+                    'Install the extension while online with `python -c "import duckdb; duckdb.install_extension(\'sqlite\')"`.'
+                ])
+            )
+        else:
+            return "SQLITE_SCAN('%s', '%s')" % (
+                os.path.abspath(os.path.join(self.Database.dir_name, self.Database.db_name)).replace("'", "''"),
+                str(location).replace("'", "''")
+            )
+
+    def _execute(
+        self,
+        query: str,
+        columns: List[str]
+    ) -> pd.DataFrame:
+        """ Executes a query on a cursor of the process-wide `duckdb` database and returns the result
+        with its columns named by `columns`, since `duckdb` de-duplicates case-insensitive column names.
+        """
+        try:
+            df = get_connection().cursor().execute(query).df()
+        except duckdb.Error as e:
+            raise Unsupported(str(e))
+        df.columns = columns
+        return df
+
+
+def group_by(
+    columns: List[str]
+) -> str:
+    """ Returns the clauses that exclude null keys, group by and sort by the group-by keys, the
+    leading columns of the select-list, as a `str`.
+
+    Parameters
+    ----------
+    columns : `List[str]`
+        Names of the group-by columns.
+    """
+    if not columns:
+        return ''
+    positions = ', '.join([str(i + 1) for i in range(len(columns))])
+    return 'WHERE %s GROUP BY %s ORDER BY %s' % (
+        ' AND '.join(['%s IS NOT NULL' % (quote(i)) for i in columns]),
+        positions,
+        positions
+    )
+
+
+# Define the extensions of the process-wide duckdb database
+EXTENSIONS: List[str] = ['sqlite']
+
+# Define the process-wide duckdb database
+_CONNECTION = None
+_CONNECTION_LOCK: threading.Lock = threading.Lock()
+
+# Define the error of each extension that could not be installed or loaded
+_FAILURES: Dict[str, str] = {}
+
+
+def get_connection():
+    """ Returns the process-wide, in-memory `duckdb` database connection, creating it if it does not exist.
+    The `EXTENSIONS` are installed and loaded when the database is created, and extensions are not
+    installed or loaded automatically thereafter, so that queries never download an extension.
+    """
+    global _CONNECTION
+    with _CONNECTION_LOCK:
+        if _CONNECTION is None:
+            connection = duckdb.connect(database=':memory:')
+            for extension in EXTENSIONS:
+                try:
+                    connection.install_extension(extension)
+                    connection.load_extension(extension)
+                except duckdb.Error as e:
+                    _FAILURES[extension] = str(e).splitlines()[0]
+            connection.execute('SET autoinstall_known_extensions = false;')
+            connection.execute('SET autoload_known_extensions = false;')
+            _CONNECTION = connection
+        return _CONNECTION
+
+
+# Define the named dataset analytical engines
+ENGINES: Dict[str, Type[Engine]] = {
+    'pandas': Pandas,
+    'duckdb': DuckDB
+}
+
+
+def get_engine(
+    Database: _generic.Connection,
+    name: Union[str, None] = None
+) -> Engine:
+    """ Returns the named dataset analytical engine as an `Engine`. If `name` is `None`, then
+    the engine named by the `ASSEMBLIT_ANALYTICS_ENGINE` environment variable is returned,
+    otherwise the `pandas` engine.
+
+    Parameters
+    ----------
+    Database : `_generic.Connection`
+        Connection to the data database.
+    name : `Union[str, None]`
+        Name of the dataset analytical engine.
+    """
+    if name is None:
+        name = os.environ.get(ENVIRONMENT_VARIABLE, None) or DEFAULT
+
+    try:
+        return ENGINES[str(name).strip().lower()](Database=Database)
+    except KeyError:
+        raise ValueError(
+            'Invalid analytical engine {%s}. Currently, `assemblit` supports the following engines, [%s].' % (
+                name,
+                ', '.join(["'%s'" % (i) for i in ENGINES])
+            )
+        )
+
+
+# Define exception classes
+Unsupported = _storage.Unsupported
@@ -0,0 +1,356 @@
+""" Database read cache
+
+An opt-in, process-wide, memory-bounded least-recently-used cache of `SELECT`
+results, keyed by database, normalized query and parameters. `streamlit` re-runs
+the entire page script on every widget interaction, so identical queries are
+otherwise re-executed many times per minute for each session.
+
+Every table carries a generation counter that is incremented by each write issued
+through `Connection`, and each cached result records the generations of the tables
+that it reads, so a write to a table invalidates exactly the results that read it.
+Writes that cannot be attributed to a table, such as schema changes or a rolled-back
+transaction, increment the generation of the whole database. Writes made outside of
+`Connection`, e.g., by another process, are not observed.
+
+The cache is enabled within '/.assemblit/config.yaml' by setting the
+`ASSEMBLIT_DB_CACHE_SIZE` environment variable to its capacity in megabytes.
+"""
+
+from __future__ import annotations
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, Hashable, List, Tuple, Union
+import os
+import re
+import sys
+import threading
+
+# Define the environment variable that sets the cache capacity
+ENVIRONMENT_VARIABLE: str = 'ASSEMBLIT_DB_CACHE_SIZE'
+DEFAULT_MAX_ENTRIES: int = 4096
+
+# Define the statement patterns
+WRITE_PATTERN: re.Pattern = re.compile(r'^\s*(INSERT|REPLACE|UPDATE|DELETE)\b', re.IGNORECASE)
+DDL_PATTERN: re.Pattern = re.compile(r'^\s*(CREATE|DROP|ALTER|ATTACH|DETACH|VACUUM|REINDEX)\b', re.IGNORECASE)
+TABLE_PATTERN: re.Pattern = re.compile(
+    r"""\b(?:FROM|JOIN|INTO|UPDATE(?:\s+OR\s+\w+)?)\s+((?:"[^"]+"|'[^']+'|\w+)(?:\s*\.\s*(?:"[^"]+"|'[^']+'|\w+))?)""",
+    re.IGNORECASE
+)
+
+
+# Define the cache statistics `class`
+@dataclass
+class Statistics():
+    """ A `class` that contains the statistics of the read cache.
+
+    Attributes
+    ----------
+    entries : `int`
+        The number of cached results.
+    bytes : `int`
+        The estimated size of the cached results in bytes.
+    hits : `int`
+        The total number of reads answered from the cache.
+    misses : `int`
+        The total number of reads executed against the database.
+    evictions : `int`
+        The total number of results evicted to stay within the capacity.
+    invalidations : `int`
+        The total number of generation increments caused by writes.
+    """
+
+    entries: int = 0
+    bytes: int = 0
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    def to_dict(self) -> dict:
+        """ Returns the cache statistics as a `dict`. """
+        return asdict(self)
+
+
+# Define the read cache `class`
+class Cache():
+    """ A `class` that represents a generation-counted, least-recently-used cache of query results. """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        max_entries: int = DEFAULT_MAX_ENTRIES
+    ):
+        """ Initializes an instance of the read cache `class`.
+
+        Parameters
+        ----------
+        max_bytes : `int`
+            The maximum estimated size of the cached results in bytes.
+        max_entries : `int`
+            The maximum number of cached results.
+        """
+
+        # Assign class variables
+        self.max_bytes: int = int(max_bytes)
+        self.max_entries: int = int(max_entries)
+        self.stats: Statistics = Statistics()
+
+        self._entries: OrderedDict[Hashable, Tuple[tuple, Any, int]] = OrderedDict()
+        self._generations: Dict[Tuple[str, str], int] = {}
+        self._epochs: Dict[str, int] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def get(
+        self,
+        key: Hashable,
+        tables: List[Tuple[str, str]]
+    ) -> Tuple[bool, Any]:
+        """ Returns `(True, result)` when a current result is cached, otherwise `(False, None)`.
+
+        Parameters
+        ----------
+        key : `Hashable`
+            The cache key returned by `key`.
+        tables : `List[Tuple[str, str]]`
+            The database file path and name of each table read by the query.
+        """
+        with self._lock:
+            entry = self._entries.get(key, None)
+            if entry is not None and entry[0] == self._snapshot(tables=tables):
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return True, entry[1]
+
+            self.stats.misses += 1
+            return False, None
+
+    def put(
+        self,
+        key: Hashable,
+        tables: List[Tuple[str, str]],
+        result: Any,
+        snapshot: tuple
+    ):
+        """ Caches a result, evicting the least-recently-used results to stay within the capacity.
+        The result is discarded when a table was written to since `snapshot` was taken.
+
+        Parameters
+        ----------
+        key : `Hashable`
+            The cache key returned by `key`.
+        tables : `List[Tuple[str, str]]`
+            The database file path and name of each table read by the query.
+        result : `Any`
+            The query result.
+        snapshot : `tuple`
+            The table generations returned by `snapshot` before the query was executed.
+        """
+        size = estimate_size(value=result)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if snapshot != self._snapshot(tables=tables):
+                return
+
+            if key in self._entries:
+                self.stats.bytes -= self._entries.pop(key)[2]
+
+            self._entries[key] = (snapshot, result, size)
+            self.stats.bytes += size
+
+            while self._entries and (self.stats.bytes > self.max_bytes or len(self._entries) > self.max_entries):
+                _, (_, _, evicted) = self._entries.popitem(last=False)
+                self.stats.bytes -= evicted
+                self.stats.evictions += 1
+
+            self.stats.entries = len(self._entries)
+
+    def snapshot(
+        self,
+        tables: List[Tuple[str, str]]
+    ) -> tuple:
+        """ Returns the current generations of the database and of each table as a `tuple`.
+
+        Parameters
+        ----------
+        tables : `List[Tuple[str, str]]`
+            The database file path and name of each table read by the query.
+        """
+        with self._lock:
+            return self._snapshot(tables=tables)
+
+    def bump(
+        self,
+        database: str,
+        tables: Union[List[str], None] = None
+    ):
+        """ Increments the generation of each table, or of the whole database when `tables` is `None`.
+
+        Parameters
+        ----------
+        database : `str`
+            Local file path of the database.
+        tables : `Union[List[str], None]`
+            Names of the written tables.
+        """
+        with self._lock:
+            if tables is None:
+                self._epochs[database] = self._epochs.get(database, 0) + 1
+            else:
+                for table in tables:
+                    self._generations[(database, table)] = self._generations.get((database, table), 0) + 1
+            self.stats.invalidations += 1
+
+    def clear(self):
+        """ Discards every cached result. """
+        with self._lock:
+            self._entries.clear()
+            self.stats.entries = 0
+            self.stats.bytes = 0
+
+    def statistics(self) -> dict:
+        """ Returns the cache statistics as a `dict`. """
+        with self._lock:
+            return self.stats.to_dict()
+
+    def _snapshot(
+        self,
+        tables: List[Tuple[str, str]]
+    ) -> tuple:
+        """ Returns the current generations. Must be called while holding the lock. """
+        return tuple(
+            (self._epochs.get(database, 0), self._generations.get((database, table), 0))
+            for database, table in tables
+        )
+
+
+def key(
+    database: str,
+    query: str,
+    params: Any,
+    mode: str = 'all'
+) -> Hashable:
+    """ Returns the cache key of a query as a `tuple`.
+
+    Parameters
+    ----------
+    database : `str`
+        Local file path of the database.
+    query : `str`
+        SQL-statement string.
+    params : `Any`
+        Values bound to the placeholders of `query`.
+    mode : `str`
+        The fetch mode of the result, `all` or `one`.
+    """
+    return (database, normalize(query=query), tuple(params), mode)
+
+
+def normalize(
+    query: str
+) -> str:
+    """ Returns the query with all runs of white-space collapsed to a single space as a `str`.
+
+    Parameters
+    ----------
+    query : `str`
+        SQL-statement string.
+    """
+    return ' '.join(str(query).split())
+
+
+def is_write(
+    query: str
+) -> bool:
+    """ Returns `True` when the statement modifies table values.
+
+    Parameters
+    ----------
+    query : `str`
+        SQL-statement string.
+    """
+    return bool(WRITE_PATTERN.match(query))
+
+
+def is_ddl(
+    query: str
+) -> bool:
+    """ Returns `True` when the statement modifies the database schema.
+
+    Parameters
+    ----------
+    query : `str`
+        SQL-statement string.
+    """
+    return bool(DDL_PATTERN.match(query))
+
+
+def tables(
+    query: str
+) -> List[Tuple[Union[str, None], str]]:
+    """ Returns the schema name, or `None`, and name of each table referenced by a statement as a `list`.
+
+    Parameters
+    ----------
+    query : `str`
+        SQL-statement string.
+    """
+    references = []
+    for reference in TABLE_PATTERN.findall(query):
+        parts = [i.strip().strip('"\'') for i in re.split(r'\s*\.\s*(?=(?:[^"\']|"[^"]*"|\'[^\']*\')*$)', reference)]
+        if len(parts) == 2:
+            references.append((parts[0], parts[1]))
+        else:
+            references.append((None, parts[0]))
+    return references
+
+
+def estimate_size(
+    value: Any
+) -> int:
+    """ Returns the estimated size of a query result in bytes as an `int`.
+
+    Parameters
+    ----------
+    value : `Any`
+        The query result, a `tuple`, a `list` of `tuple` or `None`.
+    """
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_size(value=i) for i in value)
+    else:
+        return sys.getsizeof(value)
+
+
+# Define the process-wide cache
+_CACHE: Union[Cache, None] = None
+_CACHE_LOCK: threading.Lock = threading.Lock()
+
+
+def get_cache() -> Union[Cache, None]:
+    """ Returns the process-wide `Cache`, creating it if it does not exist, or `None` when the
+    cache is disabled. The capacity is read from the `ASSEMBLIT_DB_CACHE_SIZE` environment
+    variable, in megabytes, when the cache is first created.
+    """
+    global _CACHE
+    with _CACHE_LOCK:
+        if _CACHE is None:
+            try:
+                size = float(os.environ.get(ENVIRONMENT_VARIABLE, None) or 0)
+            except ValueError:
+                raise ValueError(
+                    'Invalid database cache size {%s}. The cache size must be a number of megabytes.' % (
+                        os.environ.get(ENVIRONMENT_VARIABLE)
+                    )
+                )
+            if size <= 0:
+                return None
+            _CACHE = Cache(max_bytes=int(size * 1024 * 1024))
+        return _CACHE
+
+
+def dispose():
+    """ Discards the process-wide cache. """
+    global _CACHE
+    with _CACHE_LOCK:
+        _CACHE = None
@@ -0,0 +1,406 @@
+""" Cascade delete planner
+
+Plans and executes the deletion of records that are linked across databases by
+their query-indexes, e.g., a user owns sessions, and a session owns datasets and
+analysis runs. The planner computes the full closure of orphaned query-index values
+with set-based statements against temporary tables, and then deletes every affected
+record with one transaction per database, deepest dependents first, so that a failed
+cascade can be re-run from the same root value.
+
+Workspace folders of deleted records are removed by a process-wide background
+cleaner, so that page re-runs do not wait on the file-system.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Tuple, Union
+import os
+import queue
+import contextlib
+import shutil
+import threading
+from assemblit._database import _generic, _syntax
+
+
+# Define the cascade level `class`
+@dataclass
+class Level():
+    """ A `class` that represents the records identified by a single query-index.
+
+    Attributes
+    ----------
+    query_index : `str`
+        Name of the query-index.
+    databases : `List[_generic.Connection]`
+        Connections to the databases whose records are deleted by `query_index`.
+    callbacks : `Dict[str, List[Callable[[List[str]], None]]]`
+        Functions called with the deleted query-index values, keyed by database file path,
+            within the transaction of that database and before its records are deleted.
+    """
+
+    query_index: str
+    databases: List[_generic.Connection] = field(default_factory=list)
+    callbacks: Dict[str, List[Callable[[List[str]], None]]] = field(default_factory=dict)
+
+
+# Define the cascade dependency `class`
+@dataclass
+class Dependency():
+    """ A `class` that represents the ownership of `dependent_query_index` values by `query_index` values.
+
+    Attributes
+    ----------
+    query_index : `str`
+        Name of the owner query-index.
+    dependent_query_index : `str`
+        Name of the owned query-index.
+    Database : `_generic.Connection`
+        Connection to the database whose tables relate `query_index` to `dependent_query_index`.
+    """
+
+    query_index: str
+    dependent_query_index: str
+    Database: _generic.Connection
+
+
+# Define the cascade delete planner `class`
+class Planner():
+    """ A `class` that plans and executes cascade deletes across databases. """
+
+    def __init__(self):
+        """ Initializes an instance of the cascade delete planner `class`. """
+
+        # Assign class variables
+        self.levels: Dict[str, Level] = {}
+        self.dependencies: List[Dependency] = []
+
+    def purge(
+        self,
+        query_index: str,
+        Database: _generic.Connection,
+        callback: Union[Callable[[List[str]], None], None] = None
+    ) -> Planner:
+        """ Registers a database whose records are deleted by `query_index`. Databases that
+        share a query-index are deleted from in reverse order of registration, so the database
+        that owns the query-index should be registered last.
+
+        Parameters
+        ----------
+        query_index : `str`
+            Name of the query-index.
+        Database : `_generic.Connection`
+            Connection to the database.
+        callback : `Union[Callable[[List[str]], None], None]`
+            Function called with the deleted query-index values within the transaction of
+                `Database` and before its records are deleted.
+        """
+        level = self.levels.setdefault(str(query_index), Level(query_index=str(query_index)))
+        level.databases.append(Database)
+        if callback is not None:
+            level.callbacks.setdefault(os.path.join(Database.dir_name, Database.db_name), []).append(callback)
+        return self
+
+    def cascade(
+        self,
+        query_index: str,
+        dependent_query_index: str,
+        Database: _generic.Connection
+    ) -> Planner:
+        """ Registers that `dependent_query_index` values owned only by deleted `query_index`
+        values are deleted as well.
+
+        Parameters
+        ----------
+        query_index : `str`
+            Name of the owner query-index.
+        dependent_query_index : `str`
+            Name of the owned query-index.
+        Database : `_generic.Connection`
+            Connection to the database whose tables relate `query_index` to `dependent_query_index`.
+        """
+        self.dependencies.append(
+            Dependency(
+                query_index=str(query_index),
+                dependent_query_index=str(dependent_query_index),
+                Database=Database
+            )
+        )
+        return self
+
+    def plan(
+        self,
+        query_index: str,
+        values: List[str]
+    ) -> Dict[str, List[str]]:
+        """ Returns the closure of deleted query-index values, keyed by query-index in
+        the order they were reached, as a `dict`.
+
+        Parameters
+        ----------
+        query_index : `str`
+            Name of the root query-index.
+        values : `List[str]`
+            The root query-index values to delete.
+        """
+        plan: Dict[str, List[str]] = {str(query_index): sorted(set(str(i) for i in values))}
+        pending: List[str] = [str(query_index)]
+
+        while pending:
+            owner = pending.pop(0)
+            if not plan[owner]:
+                continue
+
+            for dependency in [i for i in self.dependencies if i.query_index == owner]:
+                orphans = select_orphans(
+                    Database=dependency.Database,
+                    query_index=owner,
+                    values=plan[owner],
+                    dependent_query_index=dependency.dependent_query_index
+                )
+                merged = sorted(set(plan.get(dependency.dependent_query_index, [])) | set(orphans))
+                if merged != plan.get(dependency.dependent_query_index, None):
+                    plan[dependency.dependent_query_index] = merged
+                    pending.append(dependency.dependent_query_index)
+
+        return plan
+
+    def execute(
+        self,
+        plan: Dict[str, List[str]]
+    ) -> Dict[str, int]:
+        """ Deletes the records of a plan with one transaction per database and returns the number
+        of deleted records, keyed by database file path, as a `dict`. Databases are processed
+        deepest dependents first.
+
+        Parameters
+        ----------
+        plan : `Dict[str, List[str]]`
+            The closure of deleted query-index values returned by `Planner.plan`.
+        """
+        deleted: Dict[str, int] = {}
+
+        for Database, query_indexes in self._order(plan=plan):
+            key = os.path.join(Database.dir_name, Database.db_name)
+            with Database.transaction():
+                deleted[key] = deleted.get(key, 0)
+                for query_index in query_indexes:
+                    for callback in self.levels[query_index].callbacks.get(key, []):
+                        callback(plan[query_index])
+
+                    stage(Database=Database, query_index=query_index, values=plan[query_index])
+                    for table_name in Database.select_all_tables_with_column_name(col=query_index):
+                        deleted[key] += Database.execute(
+                            query='DELETE FROM %s WHERE %s IN (SELECT value FROM temp.%s);' % (
+                                table_name,
+                                query_index,
+                                temp_table_name(query_index=query_index)
+                            )
+                        ).rowcount
+
+        return deleted
+
+    def delete(
+        self,
+        query_index: str,
+        values: List[str]
+    ) -> Dict[str, List[str]]:
+        """ Plans and executes the cascade delete of the root query-index values and returns
+        the closure of deleted query-index values as a `dict`.
+
+        Parameters
+        ----------
+        query_index : `str`
+            Name of the root query-index.
+        values : `List[str]`
+            The root query-index values to delete.
+        """
+        plan = self.plan(query_index=query_index, values=values)
+        self.execute(plan=plan)
+        return plan
+
+    def _order(
+        self,
+        plan: Dict[str, List[str]]
+    ) -> List[Tuple[_generic.Connection, List[str]]]:
+        """ Returns each database of a plan with the query-indexes to delete from it, as a `list`,
+        ordered by decreasing depth and then in reverse order of registration.
+
+        Parameters
+        ----------
+        plan : `Dict[str, List[str]]`
+            The closure of deleted query-index values returned by `Planner.plan`.
+        """
+        databases: Dict[str, Tuple[int, int, _generic.Connection, List[str]]] = {}
+
+        for depth, query_index in enumerate(plan):
+            if not plan[query_index] or query_index not in self.levels:
+                continue
+
+            for position, Database in enumerate(self.levels[query_index].databases):
+                key = os.path.join(Database.dir_name, Database.db_name)
+                if key not in databases:
+                    databases[key] = (depth, position, Database, [])
+                databases[key][3].append(query_index)
+
+        return [
+            (Database, query_indexes) for _, _, Database, query_indexes in sorted(
+                databases.values(),
+                key=lambda i: (-i[0], -i[1])
+            )
+        ]
+
+
+def temp_table_name(
+    query_index: str
+) -> str:
+    """ Returns the name of the temporary table that stages the values of a query-index as a `str`.
+
+    Parameters
+    ----------
+    query_index : `str`
+        Name of the query-index.
+    """
+    return 'cascade_%s' % (query_index)
+
+
+def stage(
+    Database: _generic.Connection,
+    query_index: str,
+    values: List[str]
+):
+    """ Replaces the contents of the temporary table of a query-index with `values`. Temporary tables
+    are private to the connection, so staging does not acquire the write-lock of the database.
+
+    Parameters
+    ----------
+    Database : `_generic.Connection`
+        Connection to the database.
+    query_index : `str`
+        Name of the query-index.
+    values : `List[str]`
+        The query-index values.
+    """
+    table_name = temp_table_name(query_index=query_index)
+
+    with contextlib.closing(Database.connection()) as connection:
+        connection.execute('CREATE TEMP TABLE IF NOT EXISTS %s (value TEXT PRIMARY KEY);' % (table_name))
+        connection.execute('DELETE FROM temp.%s;' % (table_name))
+        connection.executemany(
+            'INSERT OR IGNORE INTO temp.%s (value) VALUES (?);' % (table_name),
+            [(_syntax.Literal.param(i),) for i in values]
+        )
+
+        # Commit the staged values, unless they join the transaction that deletes the planned records
+        if not connection.depth:
+            connection.commit()
+
+
+def select_orphans(
+    Database: _generic.Connection,
+    query_index: str,
+    values: List[str],
+    dependent_query_index: str
+) -> List[str]:
+    """ Returns the `dependent_query_index` values whose every owner is within `values` as a `list`.
+
+    Parameters
+    ----------
+    Database : `_generic.Connection`
+        Connection to the database whose tables relate `query_index` to `dependent_query_index`.
+    query_index : `str`
+        Name of the owner query-index.
+    values : `List[str]`
+        The deleted owner query-index values.
+    dependent_query_index : `str`
+        Name of the owned query-index.
+    """
+    tables = [
+        i for i in Database.select_all_tables_with_column_name(col=query_index)
+        if dependent_query_index in Database.select_table_column_names_as_list(table_name=i)
+    ]
+    if not tables:
+        return []
+
+    stage(Database=Database, query_index=query_index, values=values)
+
+    orphans = set()
+    for table_name in tables:
+        orphans |= set(
+            str(i[0]) for i in Database.execute(
+                query="""
+                    SELECT %s FROM %s
+                        WHERE %s IS NOT NULL
+                            GROUP BY %s
+                                HAVING MIN(%s IN (SELECT value FROM temp.%s)) = 1;
+                """ % (
+                    dependent_query_index,
+                    table_name,
+                    dependent_query_index,
+                    dependent_query_index,
+                    query_index,
+                    temp_table_name(query_index=query_index)
+                )
+            ).fetchall()
+        )
+
+    return sorted(orphans)
+
+
+# Define the workspace-folder cleaner `class`
+class Cleaner():
+    """ A `class` that removes folders on a background daemon-thread. """
+
+    def __init__(self):
+        """ Initializes an instance of the workspace-folder cleaner `class`. """
+
+        # Assign class variables
+        self.queue: queue.Queue = queue.Queue()
+        self.removed: int = 0
+        self._thread: threading.Thread = threading.Thread(
+            target=self._run,
+            name='assemblit-cleaner',
+            daemon=True
+        )
+        self._thread.start()
+
+    def remove(
+        self,
+        paths: List[Union[str, os.PathLike]]
+    ):
+        """ Schedules folders for removal.
+
+        Parameters
+        ----------
+        paths : `List[Union[str, os.PathLike]]`
+            Local directory paths of the folders.
+        """
+        for path in paths:
+            self.queue.put(str(path))
+
+    def join(self):
+        """ Blocks until every scheduled folder is removed. """
+        self.queue.join()
+
+    def _run(self):
+        """ Removes scheduled folders until the process exits. """
+        while True:
+            path = self.queue.get()
+            try:
+                shutil.rmtree(path, ignore_errors=True)
+                self.removed += 1
+            finally:
+                self.queue.task_done()
+
+
+# Define the process-wide cleaner
+_CLEANER: Union[Cleaner, None] = None
+_CLEANER_LOCK: threading.Lock = threading.Lock()
+
+
+def get_cleaner() -> Cleaner:
+    """ Returns the process-wide `Cleaner`, creating it if it does not exist. """
+    global _CLEANER
+    with _CLEANER_LOCK:
+        if _CLEANER is None:
+            _CLEANER = Cleaner()
+        return _CLEANER
@@ -0,0 +1,304 @@
+""" Database table-metadata catalog
+
+Maintains a process-wide cache of the table, column and index names, and the declared
+column datatypes, of each database file, so that `sqlite_master` and `pragma_table_info` are read once and not on
+every insert or page re-run. Table and index names are loaded with a single query
+on first use, the columns of each table are loaded when first requested, and the
+catalog is invalidated whenever `Connection.create_table`,
+`Connection.drop_table` or `Connection.to_sql` change the database schema.
+
+Schema changes made within a transaction are only visible to other connections
+once the transaction is committed, so the catalog is not cached while such a
+transaction is open, and is invalidated again when it ends.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass, asdict
+from typing import Dict, Iterable, List, Set, Union
+import os
+import sqlite3
+import threading
+
+
+# Define the catalog statistics `class`
+@dataclass
+class Statistics():
+    """ A `class` that contains the statistics of a table-metadata catalog.
+
+    Attributes
+    ----------
+    hits : `int`
+        The total number of lookups answered from the catalog.
+    loads : `int`
+        The total number of metadata queries issued to the database.
+    invalidations : `int`
+        The total number of times the catalog was invalidated.
+    """
+
+    hits: int = 0
+    loads: int = 0
+    invalidations: int = 0
+
+    def to_dict(self) -> dict:
+        """ Returns the catalog statistics as a `dict`. """
+        return asdict(self)
+
+
+# Define the table-metadata catalog `class`
+class Catalog():
+    """ A `class` that represents the cached table, column and index names of a single database. """
+
+    def __init__(
+        self,
+        database: Union[str, os.PathLike]
+    ):
+        """ Initializes an instance of the table-metadata catalog `class`.
+
+        Parameters
+        ----------
+        database : `Union[str, os.PathLike]`
+            Local file path of the database.
+        """
+
+        # Assign class variables
+        self.database: str = os.path.abspath(database)
+        self.stats: Statistics = Statistics()
+
+        self._tables: Union[Dict[str, Union[Dict[str, str], None]], None] = None
+        self._indexes: Set[str] = set()
+        self._pending: int = 0
+        self._lock: threading.Lock = threading.Lock()
+
+    def tables(
+        self,
+        connection: sqlite3.Connection
+    ) -> List[str]:
+        """ Returns the names of every table within the database as a `list`.
+
+        Parameters
+        ----------
+        connection : `sqlite3.Connection`
+            An open sqlite3-connection to the database, used when the catalog is not loaded.
+        """
+        with self._lock:
+            return list(self._load(connection=connection))
+
+    def columns(
+        self,
+        connection: sqlite3.Connection,
+        table_name: str
+    ) -> List[str]:
+        """ Returns the column names of a table, in column order, as a `list`.
+
+        Parameters
+        ----------
+        connection : `sqlite3.Connection`
+            An open sqlite3-connection to the database.
+        table_name : `str`
+            Name of the database table.
+        """
+        with self._lock:
+            return list(self._load_columns(connection=connection, table_name=str(table_name)))
+
+    def types(
+        self,
+        connection: sqlite3.Connection,
+        table_name: str
+    ) -> Dict[str, str]:
+        """ Returns the declared datatype of each column of a table, in column order, as a `dict`.
+
+        Parameters
+        ----------
+        connection : `sqlite3.Connection`
+            An open sqlite3-connection to the database.
+        table_name : `str`
+            Name of the database table.
+        """
+        with self._lock:
+            return dict(self._load_columns(connection=connection, table_name=str(table_name)))
+
+    def exists(
+        self,
+        connection: sqlite3.Connection,
+        table_name: str
+    ) -> bool:
+        """ Returns `True` when the table exists within the database.
+
+        Parameters
+        ----------
+        connection : `sqlite3.Connection`
+            An open sqlite3-connection to the database.
+        table_name : `str`
+            Name of the database table.
+        """
+        with self._lock:
+            return str(table_name) in self._load(connection=connection)
+
+    def index_exists(
+        self,
+        connection: sqlite3.Connection,
+        index_name: str
+    ) -> bool:
+        """ Returns `True` when the index exists within the database.
+
+        Parameters
+        ----------
+        connection : `sqlite3.Connection`
+            An open sqlite3-connection to the database.
+        index_name : `str`
+            Name of the database index.
+        """
+        with self._lock:
+            self._load(connection=connection)
+            return str(index_name) in self._indexes
+
+    def tables_with_column(
+        self,
+        connection: sqlite3.Connection,
+        col: str,
+        exclude: Iterable[str] = ()
+    ) -> List[str]:
+        """ Returns the names of all tables that contain a column, in name order, as a `list`.
+
+        Parameters
+        ----------
+        connection : `sqlite3.Connection`
+            An open sqlite3-connection to the database.
+        col : `str`
+            Name of the database table column.
+        exclude : `Iterable[str]`
+            Names of the database tables to skip, e.g., dataset tables, whose columns are
+                then never read.
+        """
+        exclude = set(exclude)
+        with self._lock:
+            return sorted([
+                table_name for table_name in list(self._load(connection=connection))
+                if table_name not in exclude and str(col) != table_name
+                and str(col) in self._load_columns(connection=connection, table_name=table_name)
+            ])
+
+    def invalidate(self):
+        """ Discards the cached table-metadata. The catalog is re-loaded on the next lookup. """
+        with self._lock:
+            self._invalidate()
+
+    def begin(self):
+        """ Discards the cached table-metadata when a transaction changes the database schema. The
+        catalog is not cached until `end` is called for each open transaction.
+        """
+        with self._lock:
+            self._pending += 1
+            self._invalidate()
+
+    def end(self):
+        """ Discards the cached table-metadata when a transaction that changed the database schema is
+        committed or rolled back.
+        """
+        with self._lock:
+            self._pending = max(self._pending - 1, 0)
+            self._invalidate()
+
+    def statistics(self) -> dict:
+        """ Returns the catalog statistics as a `dict`. """
+        with self._lock:
+            return self.stats.to_dict()
+
+    def _invalidate(self):
+        """ Discards the cached table-metadata. Must be called while holding the lock. """
+        self._tables = None
+        self._indexes = set()
+        self.stats.invalidations += 1
+
+    def _load(
+        self,
+        connection: sqlite3.Connection
+    ) -> Dict[str, Union[Dict[str, str], None]]:
+        """ Returns the cached table names, loading the table and index names of the database
+        if the catalog is not loaded. The loaded names are not cached while a transaction that
+        changed the database schema is open. Must be called while holding the lock.
+
+        Parameters
+        ----------
+        connection : `sqlite3.Connection`
+            An open sqlite3-connection to the database.
+        """
+        if self._tables is not None:
+            self.stats.hits += 1
+            return self._tables
+
+        tables: Dict[str, Union[Dict[str, str], None]] = {}
+        indexes: Set[str] = set()
+        for name, type_ in connection.execute(
+            "SELECT name, type FROM sqlite_master WHERE type IN ('table', 'view', 'index') ORDER BY name;"
+        ).fetchall():
+            if type_ == 'index':
+                indexes.add(name)
+            else:
+                tables[name] = None
+
+        self.stats.loads += 1
+        if self._pending:
+            self._indexes = indexes
+            return tables
+
+        self._tables, self._indexes = tables, indexes
+        return self._tables
+
+    def _load_columns(
+        self,
+        connection: sqlite3.Connection,
+        table_name: str
+    ) -> Dict[str, str]:
+        """ Returns the cached declared datatype of each column of a table, keyed by column name in
+        column order, loading them from the database on first use. Must be called while holding the lock.
+
+        Parameters
+        ----------
+        connection : `sqlite3.Connection`
+            An open sqlite3-connection to the database.
+        table_name : `str`
+            Name of the database table.
+        """
+        tables = self._load(connection=connection)
+        if table_name not in tables:
+            return {}
+
+        if tables[table_name] is None:
+            tables[table_name] = {
+                name: str(type_).upper() for name, type_ in connection.execute(
+                    'SELECT name, type FROM pragma_table_info(?) ORDER BY cid;',
+                    [table_name]
+                ).fetchall()
+            }
+            self.stats.loads += 1
+
+        return tables[table_name]
+
+
+# Define the process-wide catalog registry
+_CATALOGS: Dict[str, Catalog] = {}
+_CATALOGS_LOCK: threading.Lock = threading.Lock()
+
+
+def get_catalog(
+    database: Union[str, os.PathLike]
+) -> Catalog:
+    """ Returns the process-wide `Catalog` of `database`, creating it if it does not exist.
+
+    Parameters
+    ----------
+    database : `Union[str, os.PathLike]`
+        Local file path of the database.
+    """
+    key = os.path.abspath(database)
+    with _CATALOGS_LOCK:
+        if key not in _CATALOGS:
+            _CATALOGS[key] = Catalog(database=key)
+        return _CATALOGS[key]
+
+
+def dispose():
+    """ Removes every catalog from the registry. """
+    with _CATALOGS_LOCK:
+        _CATALOGS.clear()
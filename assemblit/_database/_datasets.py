@@ -0,0 +1,917 @@
+""" Dataset catalog
+
+Maintains a catalog table within the data database that records, for each
+uploaded dataset, its physical location, column names, number of rows and size
+in bytes. Delete and cascade helpers look datasets up in the catalog rather
+than introspecting every table within `sqlite_master`, which grows linearly
+with the number of uploaded datasets.
+
+Datasets written with a content key, e.g., the hash of the uploaded datafile, are
+stored at a location addressed by that key, so datasets with identical content
+share a single stored dataset. The catalog records each dataset that references a
+location, and a stored dataset is removed once no catalogued dataset references it,
+whether the dataset is dropped or re-written with different content. Datasets are
+stored outside of any transaction and then recorded within a single transaction,
+together with any metadata of the caller, so a dataset that fails to be recorded
+is removed rather than left behind unreferenced.
+"""
+
+import json
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, List, Union
+import pandas as pd
+import pandera
+from assemblit.toolkit import _ingestion
+from assemblit._database import _analytics, _generic, _storage, _syntax
+from assemblit._database._structures import DatasetMetadata, Filter, Row
+
+# Define the name of the dataset catalog table
+TABLE_NAME: str = 'dataset_catalog'
+
+
+def schema(
+    query_index: str
+) -> _generic.Schema:
+    """ Returns the dataset catalog table schema as a `Schema`.
+
+    Parameters
+    ----------
+    query_index : `str`
+        Name of the query-index of the data database.
+    """
+    return _generic.Schema(
+        name=TABLE_NAME,
+        columns={
+            query_index: pandera.Column(
+                str,
+                nullable=False,
+                unique=True,
+                metadata={'primary_key': True}
+            ),
+            'location': pandera.Column(
+                str,
+                nullable=False,
+                unique=False,
+                metadata={'index': True}
+            ),
+            'columns': pandera.Column(
+                str,
+                nullable=False,
+                unique=False
+            ),
+            'rows': pandera.Column(
+                int,
+                nullable=False,
+                unique=False
+            ),
+            'bytes': pandera.Column(
+                int,
+                nullable=False,
+                unique=False
+            ),
+            'digest': pandera.Column(
+                str,
+                nullable=True,
+                unique=False
+            )
+        }
+    )
+
+
+def upgrade(
+    Database: _generic.Connection,
+    query_index: str
+) -> List[str]:
+    """ Adds the columns of the dataset catalog schema that are missing from a dataset catalog
+    table created by an earlier version, and returns their names as a `list`.
+
+    Parameters
+    ----------
+    Database : `_generic.Connection`
+        Connection to the data database.
+    query_index : `str`
+        Name of the query-index of the data database.
+    """
+    existing = Database.select_table_column_names_as_list(table_name=TABLE_NAME)
+    missing = [col for col in schema(query_index=query_index).columns if col not in existing]
+
+    for col in missing:
+        Database.execute(query='ALTER TABLE %s ADD COLUMN %s TEXT;' % (TABLE_NAME, col))
+    if missing:
+        Database.invalidate_catalog()
+
+    return missing
+
+
+def register(
+    Database: _generic.Connection,
+    query_index: str,
+    dataset_id: str,
+    location: str,
+    df: Union[pd.DataFrame, None] = None,
+    digest: Union[Dict[str, str], None] = None
+):
+    """ Records a dataset within the dataset catalog, replacing any existing record.
+
+    Parameters
+    ----------
+    Database : `_generic.Connection`
+        Connection to the data database.
+    query_index : `str`
+        Name of the query-index of the data database.
+    dataset_id : `str`
+        Dataset ID of the dataset.
+    location : `str`
+        Physical location of the dataset, e.g., the name of the database table.
+    df : `Union[pd.DataFrame, None]`
+        The dataset. If `None`, the column names and number of rows are read from the
+            stored dataset at `location`.
+    digest : `Union[Dict[str, str], None]`
+        The sha256 hash of each column of the dataset, keyed by column name, see
+            `assemblit.toolkit._ingestion.Digest`. The digest is recorded with the version of
+            its serialization.
+    """
+    if df is not None:
+        columns, rows = [str(col) for col in df.columns], len(df)
+    else:
+        columns, rows = _storage.resolve(Database=Database, location=location).shape(location=location)
+
+    Database.insert_many(
+        table_name=TABLE_NAME,
+        rows=[
+            Row(
+                cols=[query_index, 'location', 'columns', 'rows', 'bytes', 'digest'],
+                vals=[
+                    dataset_id,
+                    location,
+                    json.dumps(columns),
+                    int(rows),
+                    size(Database=Database, location=location, df=df),
+                    json.dumps({
+                        'version': _ingestion.DIGEST_VERSION,
+                        'columns': digest
+                    }) if digest is not None else None
+                ]
+            )
+        ],
+        conflict='REPLACE'
+    )
+
+
+def unregister(
+    Database: _generic.Connection,
+    query_index: str,
+    dataset_ids: List[str]
+):
+    """ Removes datasets from the dataset catalog.
+
+    Parameters
+    ----------
+    Database : `_generic.Connection`
+        Connection to the data database.
+    query_index : `str`
+        Name of the query-index of the data database.
+    dataset_ids : `List[str]`
+        Dataset IDs of the datasets.
+    """
+    if Database.table_exists(table_name=TABLE_NAME):
+        Database.delete_table_column_value(
+            table_name=TABLE_NAME,
+            filtr=Filter(
+                col=query_index,
+                val=list(dataset_ids)
+            )
+        )
+
+
+def link(
+    Database: _generic.Connection,
+    query_index: str,
+    dataset_id: str,
+    location: str
+) -> bool:
+    """ Records a dataset within the dataset catalog as a reference to the stored dataset at
+    `location`, copying the record of a dataset that already references it, and returns `True`.
+    Returns `False` when no catalogued dataset references `location`.
+
+    Parameters
+    ----------
+    Database : `_generic.Connection`
+        Connection to the data database.
+    query_index : `str`
+        Name of the query-index of the data database.
+    dataset_id : `str`
+        Dataset ID of the dataset.
+    location : `str`
+        Physical location of the stored dataset.
+    """
+    cols = [col for col in schema(query_index=query_index).columns if col != query_index]
+    return Database.execute(
+        query='INSERT OR REPLACE INTO %s (%s) SELECT ?, %s FROM %s WHERE location = ? LIMIT 1;' % (
+            TABLE_NAME,
+            ', '.join([query_index] + cols),
+            ', '.join(cols),
+            TABLE_NAME
+        ),
+        params=[str(dataset_id), str(location)]
+    ).rowcount > 0
+
+
+def references(
+    Database: _generic.Connection,
+    query_index: str,
+    locations: Iterable[str]
+) -> Dict[str, int]:
+    """ Returns the number of catalogued datasets that reference each stored dataset, keyed by
+    physical location, as a `dict`. Locations without references are omitted.
+
+    Parameters
+    ----------
+    Database : `_generic.Connection`
+        Connection to the data database.
+    query_index : `str`
+        Name of the query-index of the data database.
+    locations : `Iterable[str]`
+        Physical locations of the stored datasets.
+    """
+    locations = list(locations)
+    if not locations or not Database.table_exists(table_name=TABLE_NAME):
+        return {}
+
+    counts: Dict[str, int] = {}
+    for (location,) in Database.execute(
+        query=_syntax.Statement.select(
+            table_name=TABLE_NAME,
+            cols=('location',),
+            col='location',
+            arity=_generic.arity(value=locations)
+        ),
+        params=_syntax.Statement.params(values=locations)
+    ).fetchall():
+        counts[str(location)] = counts.get(str(location), 0) + 1
+
+    return counts
+
+
+def locations(
+    Database: _generic.Connection,
+    query_index: str,
+    dataset_ids: Union[Iterable[str], None] = None
+) -> Dict[str, str]:
+    """ Returns the physical location of each catalogued dataset, keyed by dataset ID, as a `dict`.
+
+    Parameters
+    ----------
+    Database : `_generic.Connection`
+        Connection to the data database.
+    query_index : `str`
+        Name of the query-index of the data database.
+    dataset_ids : `Union[Iterable[str], None]`
+        Dataset IDs of the datasets. If `None`, all catalogued datasets are returned.
+    """
+    if not Database.table_exists(table_name=TABLE_NAME):
+        return {}
+
+    if dataset_ids is None:
+        records = Database.execute(
+            query='SELECT %s, location FROM %s;' % (query_index, TABLE_NAME)
+        ).fetchall()
+    else:
+        dataset_ids = list(dataset_ids)
+        records = Database.execute(
+            query=_syntax.Statement.select(
+                table_name=TABLE_NAME,
+                cols=(query_index, 'location'),
+                col=query_index,
+                arity=_generic.arity(value=dataset_ids)
+            ),
+            params=_syntax.Statement.params(values=dataset_ids)
+        ).fetchall()
+
+    return {str(dataset_id): str(location) for dataset_id, location in records}
+
+
+def backfill(
+    Database: _generic.Connection,
+    query_index: str,
+    table_name: str
+) -> List[str]:
+    """ Records the datasets listed within the data database table `table_name` that are
+    missing from the dataset catalog, and returns their dataset IDs as a `list`. Datasets
+    uploaded before the catalog existed are stored in a table named by their dataset ID.
+
+    Parameters
+    ----------
+    Database : `_generic.Connection`
+        Connection to the data database.
+    query_index : `str`
+        Name of the query-index of the data database.
+    table_name : `str`
+        Name of the data database table that lists the uploaded datasets.
+    """
+    dataset_ids = [
+        str(i[0]) for i in Database.execute(
+            query='SELECT %s FROM %s WHERE %s NOT IN (SELECT %s FROM %s);' % (
+                query_index,
+                table_name,
+                query_index,
+                query_index,
+                TABLE_NAME
+            )
+        ).fetchall()
+    ]
+
+    registered = []
+    with Database.transaction():
+        for dataset_id in dataset_ids:
+            if Database.table_exists(table_name=dataset_id):
+                register(Database=Database, query_index=query_index, dataset_id=dataset_id, location=dataset_id)
+                registered.append(dataset_id)
+
+    return registered
+
+
+def write(
+    Database: _generic.Connection,
+    query_index: str,
+    dataset_id: str,
+    df: Union[pd.DataFrame, Iterable[pd.DataFrame]],
+    engine: Union[str, None] = None,
+    key: Union[str, None] = None,
+    hook: Union[Callable[[], None], None] = None
+) -> str:
+    """ Stores a dataset with a dataset storage engine, records it within the dataset catalog
+    and returns its physical location as a `str`. When a dataset with the same content `key`
+    is already stored, it is shared and only recorded within the dataset catalog, so `df`
+    is not consumed. The stored dataset that the dataset ID referenced before is removed once
+    no catalogued dataset references it.
+
+    Parameters
+    ----------
+    Database : `_generic.Connection`
+        Connection to the data database.
+    query_index : `str`
+        Name of the query-index of the data database.
+    dataset_id : `str`
+        Dataset ID of the dataset.
+    df : `Union[pd.DataFrame, Iterable[pd.DataFrame]]`
+        The dataset, or an iterable of the chunks of the dataset, which are stored as they
+            are consumed.
+    engine : `Union[str, None]`
+        Name of the dataset storage engine. If `None`, the engine named by the
+            `ASSEMBLIT_DATASET_ENGINE` environment variable is used.
+    key : `Union[str, None]`
+        Content key of the dataset, e.g., the sha256 hash of its datafile, that addresses
+            its physical location. If `None`, the dataset is stored at a location addressed
+            by its dataset ID.
+    hook : `Union[Callable[[], None], None]`
+        Function that records the metadata of the dataset, called within the transaction
+            that records the dataset within the dataset catalog, so that either both or
+            neither are committed.
+    """
+    Engine = _storage.get_engine(Database=Database, name=engine)
+
+    # Share the stored dataset with the same content
+    if key is not None:
+        location = Engine.location(dataset_id=key)
+        with Database.transaction():
+            previous = locations(Database=Database, query_index=query_index, dataset_ids=[dataset_id])
+            if Engine.exists(location=location) and (
+                link(Database=Database, query_index=query_index, dataset_id=dataset_id, location=location)
+            ):
+                release(Database=Database, query_index=query_index, locations=list(previous.values()))
+                if hook is not None:
+                    hook()
+                return location
+
+    # Stage the dataset outside of the transaction, as it is written chunk-by-chunk, then install it
+    #   within the transaction that records it, so that it cannot be removed before it is referenced.
+    #   A dataset with the same content that is already stored is shared.
+    digest = _ingestion.Digest()
+    location = Engine.location(dataset_id=key if key is not None else dataset_id)
+    staged = Engine.stage(
+        dataset_id=key if key is not None else dataset_id,
+        df=digest.stream(chunks=_storage.chunks(df=df))
+    )
+    try:
+        with Database.transaction():
+            Engine.install(staged=staged, dataset_id=key if key is not None else dataset_id, exist_ok=key is not None)
+            previous = locations(Database=Database, query_index=query_index, dataset_ids=[dataset_id])
+            register(
+                Database=Database,
+                query_index=query_index,
+                dataset_id=dataset_id,
+                location=location,
+                df=df if isinstance(df, pd.DataFrame) else None,
+                digest=digest.hexdigest()
+            )
+            release(Database=Database, query_index=query_index, locations=list(previous.values()))
+            if hook is not None:
+                hook()
+    except BaseException:
+
+        # Remove the staged or installed dataset that was not recorded
+        Engine.drop(location=staged)
+        release(Database=Database, query_index=query_index, locations=[location])
+        raise
+
+    return location
+
+
+def verify(
+    Database: _generic.Connection,
+    query_index: str,
+    dataset_id: str,
+    df: pd.DataFrame
+) -> Union[bool, None]:
+    """ Returns `True` when the columns of `df`, read in full from a dataset, match the per-column digest
+    recorded within the dataset catalog when the dataset was stored, otherwise `False`. Returns `None` when
+    the catalog records no digest for a column of `df`, e.g., for datasets stored by an earlier version.
+
+    Parameters
+    ----------
+    Database : `_generic.Connection`
+        Connection to the data database.
+    query_index : `str`
+        Name of the query-index of the data database.
+    dataset_id : `str`
+        Dataset ID of the dataset.
+    df : `pd.DataFrame`
+        Columns of the dataset, with all of its rows in storage order.
+    """
+    if not Database.table_exists(table_name=TABLE_NAME):
+        return None
+
+    row = Database.fetch(
+        query=_syntax.Statement.select(
+            table_name=TABLE_NAME,
+            cols=('digest',),
+            col=query_index
+        ),
+        params=[str(dataset_id)],
+        mode='one'
+    )
+    recorded = json.loads(row[0]) if row is not None and row[0] else {}
+
+    # Digests recorded without their version were serialized by either of the earlier versions
+    if isinstance(recorded.get('columns'), dict):
+        versions, recorded = [recorded.get('version')], recorded['columns']
+    else:
+        versions = [2, 1]
+    if not all(str(col) in recorded for col in df.columns) or not all(
+        version in range(1, _ingestion.DIGEST_VERSION + 1) for version in versions
+    ):
+        return None
+
+    return any(
+        all(recorded[col] == value for col, value in _ingestion.digest(chunks=[df], version=version).items())
+        for version in versions
+    )
+
+
+def read(
+    Database: _generic.Connection,
+    query_index: str,
+    dataset_id: str,
+    columns: Union[List[str], None] = None,
+    filtr: Union[Filter, List[Filter], None] = None,
+    chunksize: Union[int, None] = None
+) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+    """ Reads a dataset from its dataset storage engine and returns it as a `pd.DataFrame`, or as an
+    iterator of `pd.DataFrame` chunks when `chunksize` is set. Datasets missing from the catalog are
+    assumed to be stored in a table named by their dataset ID.
+
+    Parameters
+    ----------
+    Database : `_generic.Connection`
+        Connection to the data database.
+    query_index : `str`
+        Name of the query-index of the data database.
+    dataset_id : `str`
+        Dataset ID of the dataset.
+    columns : `Union[List[str], None]`
+        Names of the columns to read. If `None`, all columns are read.
+    filtr : `Union[Filter, List[Filter], None]`
+        The row filter(s). Each filter retains the rows where `col` equals `val`, or where `col` is
+            in `val` when `val` is a list. Multiple filters are combined with `AND`.
+    chunksize : `Union[int, None]`
+        The number of rows of each chunk. If `None`, the dataset is read as a single `pd.DataFrame`.
+    """
+    location = locations(
+        Database=Database,
+        query_index=query_index,
+        dataset_ids=[dataset_id]
+    ).get(str(dataset_id), str(dataset_id))
+
+    return _storage.resolve(Database=Database, location=location).read(
+        location=location,
+        columns=columns,
+        filtr=filtr,
+        chunksize=chunksize
+    )
+
+
+def export(
+    Database: _generic.Connection,
+    query_index: str,
+    dataset_id: str,
+    path: str,
+    file_format: str = 'csv',
+    columns: Union[List[str], None] = None,
+    chunksize: int = _storage.DEFAULT_CHUNKSIZE
+):
+    """ Writes a dataset to a local `.csv` or `.parquet` file without holding the whole dataset
+    in memory.
+
+    Parameters
+    ----------
+    Database : `_generic.Connection`
+        Connection to the data database.
+    query_index : `str`
+        Name of the query-index of the data database.
+    dataset_id : `str`
+        Dataset ID of the dataset.
+    path : `str`
+        Local file path of the exported file.
+    file_format : `str`
+        The format of the exported file, `csv` or `parquet`.
+    columns : `Union[List[str], None]`
+        Names of the columns to export. If `None`, all columns are exported.
+    chunksize : `int`
+        The number of rows of each chunk.
+    """
+    location = locations(
+        Database=Database,
+        query_index=query_index,
+        dataset_ids=[dataset_id]
+    ).get(str(dataset_id), str(dataset_id))
+
+    _storage.resolve(Database=Database, location=location).export(
+        location=location,
+        path=path,
+        file_format=file_format,
+        columns=columns,
+        chunksize=chunksize
+    )
+
+
+def aggregate(
+    Database: _generic.Connection,
+    query_index: str,
+    dataset_id: str,
+    datetime: Union[list, None] = None,
+    dimension: Union[list, None] = None,
+    metrics: Union[list, None] = None,
+    aggrules: Union[list, None] = None,
+    engine: Union[str, None] = None
+) -> pd.DataFrame:
+    """ Groups a dataset by `dimension` and/or `datetime`, aggregates `metrics` with `aggrules` using
+    the dataset analytical engine and returns the result as a `pd.DataFrame`. Requests that the engine
+    cannot execute are answered by the `pandas` engine.
+
+    Parameters
+    ----------
+    Database : `_generic.Connection`
+        Connection to the data database.
+    query_index : `str`
+        Name of the query-index of the data database.
+    dataset_id : `str`
+        Dataset ID of the dataset.
+    datetime : `Union[list, None]`
+        Ordered list of the date-time columns and their formats.
+    dimension : `Union[list, None]`
+        Ordered list of categorical columns to group the records.
+    metrics : `Union[list, None]`
+        Ordered list of numeric columns to summarize by `aggrules`.
+    aggrules : `Union[list, None]`
+        Ordered list of aggregation rules that determine the aggregation of the `metrics`.
+    engine : `Union[str, None]`
+        Name of the dataset analytical engine. If `None`, the engine named by the
+            `ASSEMBLIT_ANALYTICS_ENGINE` environment variable is used.
+    """
+    location = locations(
+        Database=Database,
+        query_index=query_index,
+        dataset_ids=[dataset_id]
+    ).get(str(dataset_id), str(dataset_id))
+
+    try:
+        return _analytics.get_engine(Database=Database, name=engine).aggregate(
+            location=location,
+            datetime=datetime,
+            dimension=dimension,
+            metrics=metrics,
+            aggrules=aggrules
+        )
+    except _analytics.Unsupported:
+        return _analytics.Pandas(Database=Database).aggregate(
+            location=location,
+            datetime=datetime,
+            dimension=dimension,
+            metrics=metrics,
+            aggrules=aggrules
+        )
+
+
+def describe(
+    Database: _generic.Connection,
+    query_index: str,
+    dataset_id: str,
+    dimension: Union[list, None] = None,
+    metrics: Union[list, None] = None,
+    aggrules: Union[list, None] = None,
+    engine: Union[str, None] = None
+) -> pd.DataFrame:
+    """ Groups a dataset by `dimension`, calculates descriptive statistics using the dataset analytical
+    engine and returns the result as a `pd.DataFrame`. Requests that the engine cannot execute are
+    answered by the `pandas` engine.
+
+    Parameters
+    ----------
+    Database : `_generic.Connection`
+        Connection to the data database.
+    query_index : `str`
+        Name of the query-index of the data database.
+    dataset_id : `str`
+        Dataset ID of the dataset.
+    dimension : `Union[list, None]`
+        Ordered list of categorical columns to group the records.
+    metrics : `Union[list, None]`
+        Ordered list of numeric columns to summarize by `aggrules`.
+    aggrules : `Union[list, None]`
+        Ordered list of aggregation rules that determine the aggregation of the `metrics`.
+    engine : `Union[str, None]`
+        Name of the dataset analytical engine. If `None`, the engine named by the
+            `ASSEMBLIT_ANALYTICS_ENGINE` environment variable is used.
+    """
+    location = locations(
+        Database=Database,
+        query_index=query_index,
+        dataset_ids=[dataset_id]
+    ).get(str(dataset_id), str(dataset_id))
+
+    try:
+        return _analytics.get_engine(Database=Database, name=engine).describe(
+            location=location,
+            dimension=dimension,
+            metrics=metrics,
+            aggrules=aggrules
+        )
+    except _analytics.Unsupported:
+        return _analytics.Pandas(Database=Database).describe(
+            location=location,
+            dimension=dimension,
+            metrics=metrics,
+            aggrules=aggrules
+        )
+
+
+# Define the dataset reference `class`
+@dataclass
+class Reference():
+    """ A `class` that references a stored dataset, which `assemblit.toolkit.aggregator` and
+    `assemblit.toolkit.plotter` accept in place of a `pandas.DataFrame` to aggregate the dataset
+    where it is stored rather than in-memory.
+
+    Attributes
+    ----------
+    Database : `_generic.Connection`
+        Connection to the data database.
+    query_index : `str`
+        Name of the query-index of the data database.
+    dataset_id : `str`
+        Dataset ID of the dataset.
+    engine : `Union[str, None]`
+        Name of the dataset analytical engine. If `None`, the engine named by the
+            `ASSEMBLIT_ANALYTICS_ENGINE` environment variable is used.
+    """
+
+    Database: _generic.Connection
+    query_index: str
+    dataset_id: str
+    engine: Union[str, None] = None
+
+    def agg_df(
+        self,
+        datetime: Union[list, None] = None,
+        dimension: Union[list, None] = None,
+        metrics: Union[list, None] = None,
+        aggrules: Union[list, None] = None
+    ) -> pd.DataFrame:
+        """ Returns the referenced dataset aggregated by `aggregate` as a `pd.DataFrame`. """
+        return aggregate(
+            Database=self.Database,
+            query_index=self.query_index,
+            dataset_id=self.dataset_id,
+            datetime=datetime,
+            dimension=dimension,
+            metrics=metrics,
+            aggrules=aggrules,
+            engine=self.engine
+        )
+
+    def describe_df(
+        self,
+        dimension: Union[list, None] = None,
+        metrics: Union[list, None] = None,
+        aggrules: Union[list, None] = None
+    ) -> pd.DataFrame:
+        """ Returns the descriptive statistics of the referenced dataset calculated by `describe` as a `pd.DataFrame`. """
+        return describe(
+            Database=self.Database,
+            query_index=self.query_index,
+            dataset_id=self.dataset_id,
+            dimension=dimension,
+            metrics=metrics,
+            aggrules=aggrules,
+            engine=self.engine
+        )
+
+
+def metadata(
+    Database: _generic.Connection,
+    table_name: str,
+    query_index: str,
+    dataset_id: str,
+    cache: bool = True
+) -> DatasetMetadata:
+    """ Selects the metadata record of a dataset within the `data` table with a single query and returns
+    it as a `DatasetMetadata`. Raises `_generic.NullReturnValue` when the dataset has no record.
+
+    Parameters
+    ----------
+    Database : `_generic.Connection`
+        Connection to the data database.
+    table_name : `str`
+        Name of the `data` table that contains the dataset metadata.
+    query_index : `str`
+        Name of the query-index of the data database.
+    dataset_id : `str`
+        Dataset ID of the dataset.
+    cache : `bool`
+        `True` or `False`, whether the record may be answered from the read cache, when it is
+            enabled, until the `data` table is written to.
+    """
+    query = _syntax.Statement.select(
+        table_name=str(table_name),
+        cols=DatasetMetadata.columns(query_index=query_index),
+        col=str(query_index)
+    )
+
+    if cache:
+        row = Database.fetch(query=query, params=[str(dataset_id)], mode='one')
+    else:
+        row = Database.execute(query=query, params=[str(dataset_id)]).fetchone()
+
+    if row is None:
+        raise _generic.NullReturnValue(
+            "The dataset {%s} has no metadata record within {%s}." % (
+                dataset_id,
+                table_name
+            )
+        )
+
+    return DatasetMetadata.from_row(row=row)
+
+
+def exists(
+    Database: _generic.Connection,
+    query_index: str,
+    dataset_id: str
+) -> bool:
+    """ Returns `True` when the dataset is stored within the data database.
+
+    Parameters
+    ----------
+    Database : `_generic.Connection`
+        Connection to the data database.
+    query_index : `str`
+        Name of the query-index of the data database.
+    dataset_id : `str`
+        Dataset ID of the dataset.
+    """
+    location = locations(
+        Database=Database,
+        query_index=query_index,
+        dataset_ids=[dataset_id]
+    ).get(str(dataset_id), str(dataset_id))
+
+    return _storage.resolve(Database=Database, location=location).exists(location=location)
+
+
+def drop(
+    Database: _generic.Connection,
+    query_index: str,
+    dataset_ids: List[str]
+):
+    """ Removes datasets from the dataset catalog, and from their dataset storage engine once no other
+    catalogued dataset references their stored dataset. Datasets missing from the catalog are assumed to
+    be stored in a table named by their dataset ID.
+
+    Parameters
+    ----------
+    Database : `_generic.Connection`
+        Connection to the data database.
+    query_index : `str`
+        Name of the query-index of the data database.
+    dataset_ids : `List[str]`
+        Dataset IDs of the datasets.
+    """
+    catalogued = locations(Database=Database, query_index=query_index, dataset_ids=dataset_ids)
+    stored = list(dict.fromkeys([catalogued.get(str(dataset_id), str(dataset_id)) for dataset_id in dataset_ids]))
+
+    with Database.transaction():
+        unregister(Database=Database, query_index=query_index, dataset_ids=dataset_ids)
+        release(Database=Database, query_index=query_index, locations=stored)
+
+
+def release(
+    Database: _generic.Connection,
+    query_index: str,
+    locations: List[str]
+):
+    """ Removes the stored datasets that no catalogued dataset references, from the transactional dataset
+    storage engines within the transaction of the data database, and from the other engines once the
+    transaction is committed.
+
+    Parameters
+    ----------
+    Database : `_generic.Connection`
+        Connection to the data database.
+    query_index : `str`
+        Name of the query-index of the data database.
+    locations : `List[str]`
+        Physical locations of the stored datasets.
+    """
+    with Database.transaction():
+
+        # Retain the stored datasets that are still referenced
+        referenced = references(Database=Database, query_index=query_index, locations=locations)
+        unreferenced = [location for location in dict.fromkeys(locations) if location not in referenced]
+        purge(Database=Database, query_index=query_index, locations=unreferenced, transactional=True)
+
+        # Remove the stored datasets that cannot be rolled back once the catalog is committed
+        Database.after_commit(
+            lambda: purge(Database=Database, query_index=query_index, locations=unreferenced, transactional=False)
+        )
+
+
+def purge(
+    Database: _generic.Connection,
+    query_index: str,
+    locations: List[str],
+    transactional: bool
+):
+    """ Removes the stored datasets that no catalogued dataset references from the dataset storage engines
+    that are, or are not, `transactional`. Stored datasets are removed within a transaction of the data
+    database, so that a stored dataset cannot be linked while it is removed.
+
+    Parameters
+    ----------
+    Database : `_generic.Connection`
+        Connection to the data database.
+    query_index : `str`
+        Name of the query-index of the data database.
+    locations : `List[str]`
+        Physical locations of the stored datasets.
+    transactional : `bool`
+        `True` or `False`, whether to remove the stored datasets of the transactional dataset storage engines,
+            e.g., `sqlite`, or of the engines whose removals cannot be rolled back, e.g., `parquet`.
+    """
+    engines = {location: _storage.resolve(Database=Database, location=location) for location in locations}
+    locations = [location for location in locations if engines[location].transactional == transactional]
+    if not locations:
+        return
+
+    with Database.transaction():
+        referenced = references(Database=Database, query_index=query_index, locations=locations)
+        for location in locations:
+            if location not in referenced:
+                engines[location].drop(location=location)
+
+
+def size(
+    Database: _generic.Connection,
+    location: str,
+    df: Union[pd.DataFrame, None] = None
+) -> int:
+    """ Returns the stored size of a dataset in bytes as an `int`. When the dataset storage engine
+    cannot report the size, e.g., sqlite compiled without `dbstat`, the in-memory size of `df` is returned.
+
+    Parameters
+    ----------
+    Database : `_generic.Connection`
+        Connection to the data database.
+    location : `str`
+        Physical location of the dataset.
+    df : `Union[pd.DataFrame, None]`
+        The dataset.
+    """
+    value = _storage.resolve(Database=Database, location=location).size(location=location)
+    if value is not None:
+        return int(value)
+
+    if df is not None:
+        return int(df.memory_usage(deep=True).sum())
+    else:
+        return 0
@@ -143,6 +143,37 @@ class REAL(_DATATYPE):
         return True if kind in REAL.kinds else False
 
 
+@dataclass
+class BOOLEAN(_DATATYPE):
+    """ A `class` that represents a `boolean` database datatype, stored as `0` or `1`.
+
+    Attributes
+    ----------
+    kinds : `List[str]`
+        The `numpy.dtype().kind` values that correspond to the datatype.
+    built_in : `type`
+        The corresponding python 'built-in' datatype.
+    sqlite : `str`
+        The corresponding sqlite3-database datatype.
+    """
+
+    kinds: ClassVar[List[str]] = [
+        'b',    # Boolean
+    ]
+    built_in: ClassVar[type] = bool
+    sqlite: ClassVar[str] = 'BOOLEAN'
+
+    def check(kind: str):
+        """ Returns `True` when the provided `numpy.dtype().kind` corresponds to the datatype.
+
+        Parameters
+        ----------
+        kind : `str`
+            The `numpy.dtype().kind` of a data object.
+        """
+        return True if kind in BOOLEAN.kinds else False
+
+
 @dataclass
 class TEXT(_DATATYPE):
     """ A `class` that represents a `text` database datatype.
@@ -158,7 +189,6 @@ class TEXT(_DATATYPE):
     """
 
     kinds: ClassVar[List[str]] = [
-        'b',    # Boolean
         'O',    # Object
         'S',    # String
         'U',    # Unicode string
@@ -254,6 +284,8 @@ def from_pandera(datatype: pandera.DataType) -> _DATATYPE:
         return INTEGER()
     elif REAL.check(np.dtype(datatype.type).kind):
         return REAL()
+    elif BOOLEAN.check(np.dtype(datatype.type).kind):
+        return BOOLEAN()
     elif TEXT.check(np.dtype(datatype.type).kind):
         return TEXT()
     elif DATETIME.check(np.dtype(datatype.type).kind):
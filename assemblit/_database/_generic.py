@@ -1,13 +1,17 @@
 """ Database table """
 
 from __future__ import annotations
-from typing import List, Literal, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Literal, Mapping, Sequence, Tuple, Union
 import os
 import sqlite3
+import datetime
 import contextlib
+from concurrent.futures import Future
+import numpy as np
+import pandas as pd
 import pandera
 from assemblit.blocks.structures import Setting
-from assemblit._database import _datatypes, _syntax
+from assemblit._database import _cache, _catalog, _datatypes, _pool, _profiles, _syntax, _trace, _writer
 from assemblit._database._structures import DBMS, Filter, Validate, Value, Table, Row
 from pytensils import utils
 
@@ -77,6 +81,57 @@ class Schema(pandera.DataFrameSchema):
         """
         raise NotImplementedError
 
+    def indexes(self) -> Dict[str, List[str]]:
+        """ Returns the secondary indexes declared within the column metadata as a `dict` of
+        index names and their columns, in the order of the schema columns.
+
+        A column is indexed by setting `metadata={'index': True}`. Composite indexes are
+        declared by setting the same index name on each column, e.g. `metadata={'index': 'state'}`,
+        and a column may belong to several indexes, e.g. `metadata={'index': ['state', 'created_on']}`.
+        """
+        column_name: str
+        column_schema: pandera.Column
+        indexes: Dict[str, List[str]] = {}
+
+        for column_name, column_schema in self.columns.items():
+            if column_schema.metadata and column_schema.metadata.get('index', False):
+                names = column_schema.metadata['index']
+
+                # Parse the index name(s)
+                if names is True:
+                    names = [column_name]
+                elif isinstance(names, str):
+                    names = [names]
+
+                for name in names:
+                    indexes.setdefault(str(name), []).append(column_name)
+
+        return indexes
+
+    def to_sqlite_indexes(
+        self,
+        table_name: str
+    ) -> Dict[str, str]:
+        """ Returns the sqlite3-statements that create the secondary indexes of the schema
+        if they do not exist as a `dict`, keyed by index name.
+
+        Parameters
+        ----------
+        table_name : `str`
+            Name of the database table.
+        """
+        statements: Dict[str, str] = {}
+
+        for name, columns in self.indexes().items():
+            index_name = '_'.join([str(table_name), name, 'index'])
+            statements[index_name] = 'CREATE INDEX IF NOT EXISTS "%s" ON %s (%s);' % (
+                index_name,
+                str(table_name),
+                ', '.join(columns)
+            )
+
+        return statements
+
     def to_sqlite(self) -> str:
         """ Returns a sqlite3-column schema definition. """
         column_name: str
@@ -155,7 +210,9 @@ class Connection():
     def __init__(
         self,
         db_name: str,
-        dir_name: str
+        dir_name: str,
+        profile: Union[str, None] = None,
+        attach: Union[List[str], None] = None
     ):
         """ Initializes an instance of the database-connection `class`.
 
@@ -165,39 +222,481 @@ class Connection():
             Name of the database located within `dir_name`.
         dir_name : `str`
             Local directory path of the database.
+        profile : `Union[str, None]`
+            Name of the database performance profile applied to new connections, `default`,
+                `concurrent` or `bulk-load`. If `None`, the profile is read from the
+                `ASSEMBLIT_DB_PROFILE` environment variable. The profile only takes effect
+                when the database pool is first created.
+        attach : `Union[List[str], None]`
+            Names of the databases located within `dir_name` to attach to the connection, so
+                that scoped queries can join tables across databases. Each database is
+                attached as a schema named by the database name without its file-extension.
         """
 
         # Assign class variables
         self.dir_name: str = dir_name
         self.db_name: str = parse_db_name(db_name=db_name)
-        self.conn: sqlite3.Connection = sqlite3.connect(os.path.join(self.dir_name, self.db_name))
+        self.schemas: Dict[str, str] = {self.db_name: 'main'}
+        for name in (attach or []):
+            if parse_db_name(db_name=name) != self.db_name:
+                self.schemas[parse_db_name(db_name=name)] = os.path.splitext(parse_db_name(db_name=name))[0]
 
         # Create the database directory if it does not exist
         if not os.path.exists(dir_name):
-            os.mkdir(dir_name)
+            os.makedirs(dir_name, exist_ok=True)
+
+        # Lease a connection from the process-wide database pool
+        self.pool: _pool.Pool = _pool.get_pool(
+            database=os.path.join(self.dir_name, self.db_name),
+            profile=_profiles.get_profile(name=profile),
+            attach={
+                schema: os.path.join(self.dir_name, name)
+                for name, schema in self.schemas.items() if schema != 'main'
+            }
+        )
+        self.conn: _pool.PooledConnection = self.pool.acquire()
+        self._reader: Union[_pool.PooledConnection, None] = None
+
+        # Share the process-wide table-metadata catalog of the database
+        self.catalog: _catalog.Catalog = _catalog.get_catalog(database=os.path.join(self.dir_name, self.db_name))
+
+        # Share the process-wide read cache, if it is enabled
+        self.cache: Union[_cache.Cache, None] = _cache.get_cache()
+
+        # Share the process-wide query tracer
+        self.tracer: _trace.Tracer = _trace.get_tracer()
+
+        # Share the process-wide single-writer of the database, if it is enabled
+        self.writer: Union[_writer.Writer, None] = None
+        if len(self.schemas) == 1:
+            self.writer = _writer.get_writer(
+                database=os.path.join(self.dir_name, self.db_name),
+                profile=self.pool.profile
+            )
 
     # Define db function(s) to handle connections
     def connection(self) -> sqlite3.Connection:
-        """ Returns a new sqlite3-connection context manager for all
-        `DELETE`, `INSERT` and `UPDATE` commands.
+        """ Returns the pooled sqlite3-connection for all `DELETE`, `INSERT` and `UPDATE`
+        commands. Closing the returned connection releases its lease and does not close
+        the underlying sqlite3-connection.
+        """
+        return self.pool.lease(connection=self.conn)
+
+    @property
+    def reader(self) -> _pool.PooledConnection:
+        """ Returns the pooled sqlite3-connection that selects values as they are stored, without
+        converting them by their declared datatypes, to read the tables created by `pandas`. The
+        converters that `pandas` registers for `DATE` and `TIMESTAMP` columns raise on time-zone
+        aware or non-ISO formatted values. The connection does not see uncommitted changes.
+        """
+        if self._reader is None:
+            self._reader = _pool.get_pool(
+                database=self.pool.database,
+                profile=self.pool.profile,
+                attach=self.pool.attach,
+                detect_types=0
+            ).acquire()
+        return self._reader
+
+    def close(self):
+        """ Returns the sqlite3-connections to the database pools.
+        """
+        if self.conn is not None:
+            self.pool.release(connection=self.conn)
+            self.conn = None
+        if self._reader is not None:
+            self._reader.pool.release(connection=self._reader)
+            self._reader = None
+
+    def statistics(self) -> dict:
+        """ Returns the statistics of the database pool as a `dict`.
         """
-        return sqlite3.connect(os.path.join(self.dir_name, self.db_name))
+        return self.pool.statistics()
+
+    def cache_statistics(self) -> Union[dict, None]:
+        """ Returns the statistics of the read cache as a `dict`, or `None` when the cache is disabled.
+        """
+        return self.cache.statistics() if self.cache is not None else None
+
+    def schema(
+        self,
+        db_name: str
+    ) -> str:
+        """ Returns the schema name of the database within the connection as a `str`.
+
+        Parameters
+        ----------
+        db_name : `str`
+            Name of the database, either the connected database or an attached database.
+        """
+        try:
+            return self.schemas[parse_db_name(db_name=db_name)]
+        except KeyError:
+            raise ValueError(
+                'The database {%s} is not attached to the connection to {%s}.' % (
+                    db_name,
+                    self.db_name
+                )
+            )
+
+    def __enter__(self) -> Connection:
+        return self
+
+    def __exit__(self, *args):
+        """ Returns the sqlite3-connection to the database pool when the context exits.
+        """
+        self.close()
 
     def __del__(self):
-        """ Closes the sqlite3-connection when deconstructed.
+        """ Returns the sqlite3-connection to the database pool when deconstructed.
         """
         try:
-            self.conn.close()
+            self.close()
         except AttributeError:
             pass
 
+    # Define db function(s) to execute parameterized statements
+    def execute(
+        self,
+        query: str,
+        params: Sequence[Any] = ()
+    ) -> sqlite3.Cursor:
+        """ Executes a parameterized SQL-statement and returns the `sqlite3.Cursor`. `DELETE`, `INSERT`,
+        `REPLACE` and `UPDATE` statements executed outside of a transaction are committed within their own
+        transaction, so that the read cache is only invalidated once the write is visible to other connections.
+
+        Parameters
+        ----------
+        query : `str`
+            SQL-statement string containing `?` placeholders.
+        params : `Sequence[Any]`
+            Values bound to the placeholders of `query`.
+        """
+        if not self.conn.depth and _cache.is_write(query=query):
+            with self.transaction():
+                return self.execute(query=query, params=params)
+
+        with self.tracer.span(database=os.path.join(self.dir_name, self.db_name), query=query) as span:
+            cursor = self.conn.execute(query, tuple(params))
+            self.invalidate(query=query)
+            span.rows = cursor.rowcount
+        return cursor
+
+    def fetch(
+        self,
+        query: str,
+        params: Sequence[Any] = (),
+        mode: Literal['all', 'one'] = 'all'
+    ) -> Union[List[tuple], tuple, None]:
+        """ Executes a parameterized `SELECT` statement and returns all records as a `list`, or the
+        first record as a `tuple`. Results are answered from the read cache, when it is enabled, until
+        a table read by the statement is written to through a `Connection`. Statements executed within
+        a transaction are never cached.
+
+        Parameters
+        ----------
+        query : `str`
+            SQL-statement string containing `?` placeholders.
+        params : `Sequence[Any]`
+            Values bound to the placeholders of `query`.
+        mode : `Literal['all', 'one']`
+            The fetch mode, `all` to return all records or `one` to return the first record.
+        """
+        with self.tracer.span(database=os.path.join(self.dir_name, self.db_name), query=query) as span:
+            tables = self._cached_tables(query=query)
+
+            # Execute the statement when the result cannot be cached
+            if tables is None:
+                result = self._fetch(query=query, params=params, mode=mode)
+
+            else:
+                key = _cache.key(database=os.path.join(self.dir_name, self.db_name), query=query, params=params, mode=mode)
+                span.cached, result = self.cache.get(key=key, tables=tables)
+                if not span.cached:
+                    snapshot = self.cache.snapshot(tables=tables)
+                    result = self._fetch(query=query, params=params, mode=mode)
+                    self.cache.put(key=key, tables=tables, result=result, snapshot=snapshot)
+
+            span.rows = len(result) if mode == 'all' else int(result is not None)
+
+        return result
+
+    def _fetch(
+        self,
+        query: str,
+        params: Sequence[Any],
+        mode: Literal['all', 'one']
+    ) -> Union[List[tuple], tuple, None]:
+        """ Executes a parameterized `SELECT` statement and returns all records or the first record. """
+        cursor = self.conn.execute(query, tuple(params))
+        return cursor.fetchall() if mode == 'all' else cursor.fetchone()
+
+    def invalidate(
+        self,
+        query: Union[str, None] = None,
+        table_name: Union[str, None] = None
+    ):
+        """ Increments the read-cache generation of the tables written to by a statement, or of
+        {table_name}. Schema changes, and writes that cannot be attributed to a table, increment the
+        generation of every database within the connection.
+
+        Parameters
+        ----------
+        query : `Union[str, None]`
+            SQL-statement string.
+        table_name : `Union[str, None]`
+            Name of the database table.
+        """
+        if self.cache is None:
+            return
+
+        targets: List[tuple] = []
+        databases = {schema: os.path.join(self.dir_name, name) for name, schema in self.schemas.items()}
+
+        if table_name is not None:
+            targets.append((databases['main'], [str(table_name)]))
+
+        elif query is None or _cache.is_ddl(query=query):
+            targets.extend((database, None) for database in databases.values())
+
+        elif _cache.is_write(query=query):
+            references = _cache.tables(query=query)
+            if not references:
+                targets.extend((database, None) for database in databases.values())
+
+            for schema, table in references:
+                if schema is None or schema in databases:
+                    targets.append((databases[schema or 'main'], [table]))
+
+        # Defer the invalidation until the transaction ends
+        if self.conn is not None and self.conn.depth:
+            self.conn.pending.extend(targets)
+        else:
+            self._bump(targets=targets)
+
+    def _bump(
+        self,
+        targets: List[tuple]
+    ):
+        """ Increments the read-cache generation of each database, or of its tables. """
+        if self.cache is not None:
+            for database, tables in targets:
+                self.cache.bump(database=database, tables=tables)
+
+    def _cached_tables(
+        self,
+        query: str
+    ) -> Union[List[tuple], None]:
+        """ Returns the database file path and name of each table read by a cacheable statement as a
+        `list`, or `None` when the read cache is disabled or the statement cannot be cached.
+        """
+        if self.cache is None or self.conn.in_transaction:
+            return None
+
+        databases = {schema: os.path.join(self.dir_name, name) for name, schema in self.schemas.items()}
+        tables = []
+        for schema, table in _cache.tables(query=query):
+            if (schema or 'main') not in databases:
+                return None
+            tables.append((databases[schema or 'main'], table))
+
+        return tables or None
+
+    def write(
+        self,
+        query: str,
+        params: Sequence[Any] = ()
+    ):
+        """ Executes and commits a parameterized `DELETE`, `INSERT` or `UPDATE` statement.
+
+        Parameters
+        ----------
+        query : `str`
+            SQL-statement string containing `?` placeholders.
+        params : `Sequence[Any]`
+            Values bound to the placeholders of `query`.
+        """
+        with self.tracer.span(database=os.path.join(self.dir_name, self.db_name), query=query) as span:
+            if self._serialized():
+                span.rows = self.writer.result(future=self.submit(statements=[(query, [params])]))
+            else:
+                with contextlib.closing(self.connection()) as connection:
+                    span.rows = connection.execute(query, tuple(params)).rowcount
+                    if not connection.depth:
+                        connection.commit()
+                self.invalidate(query=query)
+
+    def write_many(
+        self,
+        query: str,
+        params: Iterable[Sequence[Any]]
+    ) -> int:
+        """ Executes a parameterized `INSERT` or `UPDATE` statement once for each sequence of
+        values within a single transaction and returns the number of modified rows as an `int`.
+
+        Parameters
+        ----------
+        query : `str`
+            SQL-statement string containing `?` placeholders.
+        params : `Iterable[Sequence[Any]]`
+            Sequences of values bound to the placeholders of `query`.
+        """
+        with self.tracer.span(database=os.path.join(self.dir_name, self.db_name), query=query) as span:
+            if self._serialized():
+                span.rows = self.writer.result(future=self.submit(statements=[(query, params)]))
+            else:
+                with self.transaction():
+                    with contextlib.closing(self.connection()) as connection:
+                        span.rows = connection.executemany(query, (tuple(i) for i in params)).rowcount
+                    self.invalidate(query=query)
+        return span.rows
+
+    def submit(
+        self,
+        statements: List[Tuple[str, Iterable[Sequence[Any]]]]
+    ) -> Future:
+        """ Submits a group of parameterized `DELETE`, `INSERT` or `UPDATE` statements that are
+        committed atomically and returns a `concurrent.futures.Future` that resolves to the number
+        of modified rows. When the single-writer is enabled, the statements are queued and committed
+        by the writer thread of the database, grouped with the statements submitted by other sessions,
+        otherwise they are committed immediately within a transaction.
+
+        e.g.,
+
+            future = Database.submit(
+                statements=[
+                    ('UPDATE test SET name = ? WHERE id = ?;', [('a', '1')]),
+                    ('DELETE FROM test WHERE id = ?;', [('2',), ('3',)])
+                ]
+            )
+            future.result()
+
+        Parameters
+        ----------
+        statements : `List[Tuple[str, Iterable[Sequence[Any]]]]`
+            SQL-statement strings containing `?` placeholders, each with the sequences of values
+                bound to its placeholders. Each statement is executed once for each sequence of values.
+        """
+        statements = [(str(query), [tuple(i) for i in params]) for query, params in statements]
+
+        if self._serialized():
+            return self.writer.submit(
+                statements=statements,
+                callback=lambda: [self.invalidate(query=query) for query, _ in statements]
+            )
+
+        future = Future()
+        try:
+            rows = 0
+            with self.transaction():
+                with contextlib.closing(self.connection()) as connection:
+                    for query, params in statements:
+                        rows += max(connection.executemany(query, params).rowcount, 0)
+                        self.invalidate(query=query)
+        except sqlite3.Error as e:
+            future.set_exception(e)
+        else:
+            future.set_result(rows)
+        return future
+
+    def _serialized(self) -> bool:
+        """ Returns `True` when writes are submitted to the single-writer, i.e., when it is enabled
+        and the connection is not within a transaction.
+        """
+        return self.writer is not None and not self.conn.in_transaction
+
+    @contextlib.contextmanager
+    def transaction(self) -> Iterator[Connection]:
+        """ Returns a context manager that groups all `DELETE`, `INSERT` and `UPDATE` commands
+        executed within it into a single transaction, committed once when the context exits and
+        rolled back if an exception is raised. Nested transactions, including those opened by
+        other `Connection` objects to the same database within the same thread, join the
+        outermost transaction.
+
+        e.g.,
+
+            with Database.transaction():
+                Database.update(...)
+                Database.update(...)
+        """
+        with contextlib.closing(self.connection()) as connection:
+
+            # Begin the outermost transaction, acquiring the write-lock up-front
+            if not connection.depth:
+                if connection.in_transaction:
+                    connection.commit()
+                connection.execute('BEGIN IMMEDIATE;')
+
+            connection.depth += 1
+            try:
+                yield self
+            except BaseException:
+                connection.depth -= 1
+                if not connection.depth:
+                    connection.rollback()
+                    self.catalog.invalidate()
+                    self._end(connection=connection)
+                raise
+            else:
+                connection.depth -= 1
+                if not connection.depth:
+                    connection.commit()
+                    hooks = self._end(connection=connection)
+                    for hook in hooks:
+                        hook()
+
+    def _end(
+        self,
+        connection: _pool.PooledConnection
+    ) -> List[Callable[[], None]]:
+        """ Applies the deferred read-cache and catalog invalidations once the outermost transaction ends,
+        and returns the functions to call once it is committed as a `list`.
+        """
+        self._bump(targets=connection.pending)
+        connection.pending = []
+        for catalog in connection.catalogs:
+            catalog.end()
+        connection.catalogs = []
+        hooks, connection.hooks = connection.hooks, []
+        return hooks
+
+    def after_commit(
+        self,
+        hook: Callable[[], None]
+    ):
+        """ Calls a function once the outermost transaction is committed, or immediately when the
+        connection is not within a transaction. The function is discarded if the transaction is
+        rolled back, e.g., to remove files that are only unreferenced once the transaction commits.
+
+        Parameters
+        ----------
+        hook : `Callable[[], None]`
+            The function to call.
+        """
+        if self.conn.depth:
+            self.conn.hooks.append(hook)
+        else:
+            hook()
+
+    def invalidate_catalog(self):
+        """ Discards the table-metadata catalog of the database after a schema change. Within a
+        transaction, the catalog is not cached until the transaction ends, so that other threads
+        never cache a schema that is not committed, or that is rolled back.
+        """
+        if self.conn is not None and self.conn.depth:
+            if self.catalog not in self.conn.catalogs:
+                self.conn.catalogs.append(self.catalog)
+                self.catalog.begin()
+                return
+        self.catalog.invalidate()
+
     # Define db function(s) to create tables
     def create_table(
         self,
         table_name: str,
         schema: Schema
     ) -> Connection:
-        """ Creates {table_name} in the database if it does not exist.
+        """ Creates {table_name} and its secondary indexes in the database if they do not exist.
 
         Parameters
         ----------
@@ -206,11 +705,26 @@ class Connection():
         schema : `assemblit.database.generic.Schema`
             Database table schema object.
         """
-        self.conn.cursor().execute(
-            """
-                CREATE TABLE IF NOT EXISTS %s %s;
-            """ % (str(table_name), schema.to_sqlite())
-        )
+        statements: List[str] = []
+
+        # Create the table
+        if not self.catalog.exists(connection=self.conn, table_name=table_name):
+            statements.append(
+                """
+                    CREATE TABLE IF NOT EXISTS %s %s;
+                """ % (str(table_name), schema.to_sqlite())
+            )
+
+        # Create secondary indexes
+        for index_name, statement in schema.to_sqlite_indexes(table_name=table_name).items():
+            if not self.catalog.index_exists(connection=self.conn, index_name=index_name):
+                statements.append(statement)
+
+        if statements:
+            for statement in statements:
+                self.conn.cursor().execute(statement)
+            self.invalidate_catalog()
+            self.invalidate()
 
         return self
 
@@ -233,8 +747,62 @@ class Connection():
                 str(table_name)
             )
         )
+        self.invalidate_catalog()
+        self.invalidate()
+
+    def to_sql(
+        self,
+        df: pd.DataFrame,
+        table_name: str,
+        **kwargs
+    ):
+        """ Writes a `pandas.DataFrame` to {table_name} in the database.
+
+        Parameters
+        ----------
+        df : `pd.DataFrame`
+            The data to write.
+        table_name : `str`
+            Name of the database table.
+        **kwargs
+            Keyword arguments passed to `pandas.DataFrame.to_sql`.
+        """
+        try:
+            with contextlib.closing(self.connection()) as connection:
+                df.to_sql(name=str(table_name), con=connection, **kwargs)
+        finally:
+            self.invalidate_catalog()
+            self.invalidate(table_name=table_name)
 
     # Define db function(s) to insert/update table values
+    def binder(
+        self,
+        table_name: str,
+        cols: Sequence[str]
+    ) -> Callable[[Sequence[Any]], List[Any]]:
+        """ Returns a function that converts the values of `cols` in {table_name} to their bound-parameter
+        values. Booleans are bound as `'True'` or `'False'` to columns that are not declared `BOOLEAN`, e.g.,
+        the `TEXT` columns of tables created by earlier versions, so that their values are not mixed with `1`
+        and `0`.
+
+        Parameters
+        ----------
+        table_name : `str`
+            Name of the database table.
+        cols : `Sequence[str]`
+            Names of the database table columns of the values.
+        """
+        types = self.catalog.types(connection=self.conn, table_name=table_name)
+        text = [types.get(str(col), _datatypes.BOOLEAN.sqlite) != _datatypes.BOOLEAN.sqlite for col in cols]
+
+        def bind(vals: Sequence[Any]) -> List[Any]:
+            return [
+                _syntax.Literal.param('%s' % (bool(val)) if legacy and isinstance(val, (bool, np.bool_)) else val)
+                for legacy, val in zip(text, vals)
+            ]
+
+        return bind
+
     def insert(
         self,
         table_name: str,
@@ -274,23 +842,13 @@ class Connection():
                 table_name=table_name
             )
         ):
-            with contextlib.closing(self.connection()) as connection:
-                connection.cursor().execute(
-                    """
-                        INSERT INTO %s
-                        VALUES (%s);
-                    """ % (
-                        str(table_name),
-                        ', '.join(
-                            [
-                                "'%s'" % normalize(string=i) for i in list(
-                                    row.vals
-                                )
-                            ]
-                        )
-                    )
-                )
-                connection.commit()
+            self.write(
+                query=_syntax.Statement.insert(
+                    table_name=str(table_name),
+                    arity=len(row.vals)
+                ),
+                params=self.binder(table_name=table_name, cols=row.cols)(row.vals)
+            )
 
         # Raise an error if the table columns mismatch
         #   the provided values
@@ -311,6 +869,76 @@ class Connection():
                 ])
             )
 
+    def insert_many(
+        self,
+        table_name: str,
+        rows: Union[Iterable[Row], Mapping[str, Sequence[Any]]],
+        conflict: Union[Literal['ROLLBACK', 'ABORT', 'FAIL', 'IGNORE', 'REPLACE'], None] = None
+    ) -> int:
+        """ Inserts a batch of rows of values into the database table within a single transaction
+        and returns the number of inserted rows as an `int`.
+
+        Parameters
+        ----------
+        table_name : `str`
+            Name of the database table.
+        rows : `Union[Iterable[Row], Mapping[str, Sequence[Any]]]`
+            Either an iterable of Row objects containing the table columns `cols` and values
+                `vals`, or a column-oriented mapping of each table column to its sequence of
+                values. The columns are validated once. If the columns of a row do not match
+                the order of columns in the database table, or the mapping does not contain
+                every column, a `KeyError` is raised.
+        conflict : `Union[Literal['ROLLBACK', 'ABORT', 'FAIL', 'IGNORE', 'REPLACE'], None]`
+            The conflict-resolution policy applied when a row violates a constraint, or `None`
+                for the table default.
+        """
+        cols = self.select_table_column_names_as_list(table_name=table_name)
+        bind = self.binder(table_name=table_name, cols=cols)
+
+        # Convert the column-oriented mapping to rows of values in the order of the table columns
+        if isinstance(rows, Mapping):
+            if sorted(rows.keys()) != sorted(cols):
+                raise KeyError(
+                    ' '.join([
+                        "Missing values.",
+                        "The Sqlite {%s} table in {%s} " % (
+                            table_name,
+                            self.db_name
+                        ),
+                        "expects values for the following columns,",
+                        str(cols)
+                    ])
+                )
+            values = zip(*[rows[col] for col in cols])
+
+        # Validate the columns of each row against the table columns
+        else:
+            def parse(rows: Iterable[Row]) -> Iterator[List[Any]]:
+                for row in rows:
+                    if list(row.cols) != cols:
+                        raise KeyError(
+                            ' '.join([
+                                "Missing values.",
+                                "The Sqlite {%s} table in {%s} " % (
+                                    table_name,
+                                    self.db_name
+                                ),
+                                "expects values in the following order,",
+                                str(cols)
+                            ])
+                        )
+                    yield row.vals
+            values = parse(rows=rows)
+
+        return self.write_many(
+            query=_syntax.Statement.insert(
+                table_name=str(table_name),
+                arity=len(cols),
+                conflict=conflict
+            ),
+            params=(bind(vals) for vals in values)
+        )
+
     def update(
         self,
         table_name: str,
@@ -337,21 +965,14 @@ class Connection():
             table_name=table_name,
             filtr=filtr
         ) == 1:
-            with contextlib.closing(self.connection()) as connection:
-                connection.cursor().execute(
-                    """
-                        UPDATE %s
-                        SET %s = '%s'
-                        WHERE %s = '%s';
-                    """ % (
-                        str(table_name),
-                        str(value.col),
-                        normalize(string=value.val),
-                        str(filtr.col),
-                        normalize(string=filtr.val)
-                    )
-                )
-                connection.commit()
+            self.write(
+                query=_syntax.Statement.update(
+                    table_name=str(table_name),
+                    cols=(str(value.col),),
+                    col=str(filtr.col)
+                ),
+                params=self.binder(table_name=table_name, cols=[value.col, filtr.col])([value.val, filtr.val])
+            )
 
         # Raise an error if the query attempts to update more
         #   than one record.
@@ -360,6 +981,70 @@ class Connection():
                 'The query attempted to update more than one record.'
             )
 
+    def update_columns(
+        self,
+        table_name: str,
+        values: List[Value],
+        filtr: Filter
+    ) -> List[str]:
+        """ Updates multiple column values in a filtered database table with a single `UPDATE`
+        statement, skipping the columns whose stored value is unchanged, and returns the names
+        of the changed columns as a `list`. The stored values are compared and updated within
+        a single transaction.
+
+        Parameters
+        ----------
+        table_name : `str`
+            Name of the database table.
+        values : `List[Value]`
+            List of Value objects containing the column `col` and value
+                `val` to update in `table_name`.
+        filtr : `Filter`
+            Filter object containing the column `col` and value
+                `val` to filter `table_name`. If the filtered table
+                does not return exactly one record, a `ValueError` is raised.
+        """
+        if not values:
+            return []
+
+        params = self.binder(
+            table_name=table_name,
+            cols=[value.col for value in values] + [filtr.col]
+        )([value.val for value in values] + [filtr.val])
+
+        with self.transaction():
+
+            # Compare the stored values
+            records = self.execute(
+                query=_syntax.Statement.changed(
+                    table_name=str(table_name),
+                    cols=tuple([str(value.col) for value in values]),
+                    col=str(filtr.col)
+                ),
+                params=params
+            ).fetchmany(2)
+
+            # Raise an error if the query attempts to update more
+            #   than one record.
+            if len(records) != 1:
+                raise ValueError(
+                    'The query attempted to update more than one record.'
+                )
+
+            # Update the changed values
+            changed = [(value, param) for value, param, differs in zip(values, params, records[0]) if differs]
+            if changed:
+                self.write(
+                    query=_syntax.Statement.update(
+                        table_name=str(table_name),
+                        cols=tuple([str(value.col) for value, _ in changed]),
+                        col=str(filtr.col)
+                    ),
+                    params=[param for _, param in changed] + params[-1:]
+                )
+
+        return [value.col for value, _ in changed]
+
     def reset_table_column_value(
         self,
         table_name: str,
@@ -380,49 +1065,20 @@ class Connection():
                 `val` to filter `table_name`. If the filtered table
                 returns more than one record, a `ValueError` is raised.
         """
+        query, params = _syntax.Statement.update(
+            table_name=str(table_name),
+            cols=(str(value.col),)
+        ), self.binder(table_name=table_name, cols=[value.col])([value.val])
 
-        with contextlib.closing(self.connection()) as connection:
-            if filtr:
-                if isinstance(filtr.val, list):
-                    connection.cursor().execute(
-                        """
-                            UPDATE %s
-                            SET %s = '%s'
-                            WHERE %s IN (%s);
-                        """ % (
-                            str(table_name),
-                            str(value.col),
-                            normalize(string=value.val),
-                            str(filtr.col),
-                            ', '.join(["'%s'" % normalize(string=i) for i in filtr.val])
-                        )
-                    )
-                else:
-                    connection.cursor().execute(
-                        """
-                            UPDATE %s
-                            SET %s = '%s'
-                            WHERE %s = '%s';
-                        """ % (
-                            str(table_name),
-                            str(value.col),
-                            normalize(string=value.val),
-                            str(filtr.col),
-                            normalize(string=filtr.val)
-                        )
-                    )
-            else:
-                connection.cursor().execute(
-                    """
-                        UPDATE %s
-                        SET %s = '%s';
-                    """ % (
-                        str(table_name),
-                        str(value.col),
-                        normalize(string=value.val)
-                    )
-                )
-            connection.commit()
+        if filtr:
+            query, params = _syntax.Statement.update(
+                table_name=str(table_name),
+                cols=(str(value.col),),
+                col=str(filtr.col),
+                arity=arity(value=filtr.val)
+            ), params + _syntax.Statement.params(values=filtr.val)
+
+        self.write(query=query, params=params)
 
     # Define db function(s) to delete table values
     def delete(
@@ -438,12 +1094,13 @@ class Connection():
                 column values.
         """
         if tables:
-            for table in tables:
-                table: Table
-                self.delete_table_column_value(
-                    table_name=table.table_name,
-                    filtr=table.filtr
-                )
+            with self.transaction():
+                for table in tables:
+                    table: Table
+                    self.delete_table_column_value(
+                        table_name=table.table_name,
+                        filtr=table.filtr
+                    )
 
     def delete_table_column_value(
         self,
@@ -461,30 +1118,14 @@ class Connection():
                 `val` to filter `table_name`. The returned record(s) are
                 deleted from `table_name`.
         """
-        with contextlib.closing(self.connection()) as connection:
-            if isinstance(filtr.val, list):
-                connection.cursor().execute(
-                    """
-                        DELETE FROM %s
-                        WHERE %s IN (%s);
-                    """ % (
-                        str(table_name),
-                        str(filtr.col),
-                        ', '.join(["'%s'" % normalize(string=i) for i in filtr.val])
-                    )
-                )
-            else:
-                connection.cursor().execute(
-                    """
-                        DELETE FROM %s
-                        WHERE %s = '%s';
-                    """ % (
-                        str(table_name),
-                        str(filtr.col),
-                        normalize(string=filtr.val)
-                    )
-                )
-            connection.commit()
+        self.write(
+            query=_syntax.Statement.delete(
+                table_name=str(table_name),
+                col=str(filtr.col),
+                arity=arity(value=filtr.val)
+            ),
+            params=_syntax.Statement.params(values=filtr.val)
+        )
 
     def build_database_table_objects_to_delete(
         self,
@@ -581,48 +1222,19 @@ class Connection():
                 `val` to filter `table_name`. The returned record is
                 deleted from `table_name`.
         """
-
-        if isinstance(filtr.val, list):
-            query = """
-                SELECT %s
-                FROM (
-                    SELECT %s, %s, COUNT(%s) as COUNT
-                    FROM %s
-                    GROUP BY %s
-                ) WHERE COUNT = 1 AND %s in (%s);
-            """ % (
-                str(col),
-                str(col),
-                str(filtr.col),
-                str(col),
-                str(table_name),
-                str(col),
-                str(filtr.col),
-                ', '.join(["'%s'" % normalize(string=i) for i in filtr.val])
-            )
-        else:
-            query = """
-                SELECT %s FROM (
-                    SELECT %s, %s, COUNT(%s) as COUNT
-                    FROM %s
-                    GROUP BY %s
-                ) WHERE COUNT = 1 AND %s = '%s';
-            """ % (
-                str(col),
-                str(col),
-                str(filtr.col),
-                str(col),
-                str(table_name),
-                str(col),
-                str(filtr.col),
-                normalize(string=filtr.val)
-            )
-
         values = [
-            i[0] for i in self.conn.cursor().execute(query).fetchall()
+            i[0] for i in self.execute(
+                query=_syntax.Statement.orphans(
+                    table_name=str(table_name),
+                    col=str(col),
+                    filtr_col=str(filtr.col),
+                    arity=arity(value=filtr.val)
+                ),
+                params=_syntax.Statement.params(values=filtr.val)
+            ).fetchall()
         ]
 
-        return [utils.as_type(value=i, return_dtype='str') for i in values]
+        return [as_type(value=i, return_dtype='str') for i in values]
 
     def create_object_to_delete(
         self,
@@ -662,16 +1274,7 @@ class Connection():
         table_name : `str`
             Name of the database table.
         """
-        if self.conn.cursor().execute(
-            """
-                SELECT name
-                FROM sqlite_master
-                WHERE name = '%s';
-            """ % (str(table_name))
-        ).fetchall():
-            return True
-        else:
-            return False
+        return self.catalog.exists(connection=self.conn, table_name=table_name)
 
     def table_record_exists(
         self,
@@ -689,38 +1292,17 @@ class Connection():
                 `val` to filter `table_name`. If the filtered table
                 returns a record, `True` is returned.
         """
-        if isinstance(filtr.val, list):
-            if self.conn.cursor().execute(
-                """
-                    SELECT %s
-                    FROM %s
-                    WHERE %s IN (%s);
-                """ % (
-                    str(filtr.col),
-                    str(table_name),
-                    str(filtr.col),
-                    ', '.join(["'%s'" % normalize(string=i) for i in filtr.val])
-                )
-            ).fetchall():
-                return True
-            else:
-                return False
+        if self.execute(
+            query=_syntax.Statement.exists(
+                table_name=str(table_name),
+                col=str(filtr.col),
+                arity=arity(value=filtr.val)
+            ),
+            params=_syntax.Statement.params(values=filtr.val)
+        ).fetchone():
+            return True
         else:
-            if self.conn.cursor().execute(
-                """
-                    SELECT %s
-                    FROM %s
-                    WHERE %s = '%s';
-                """ % (
-                    str(filtr.col),
-                    str(table_name),
-                    str(filtr.col),
-                    normalize(string=filtr.val)
-                )
-            ).fetchall():
-                return True
-            else:
-                return False
+            return False
 
     def select_table_column_names_as_list(
         self,
@@ -733,17 +1315,7 @@ class Connection():
         table_name : `str`
             Name of the database table.
         """
-        return [
-            col[0] for col in self.conn.cursor().execute(
-                """
-                    SELECT name
-                    FROM pragma_table_info('%s')
-                    ORDER BY cid;
-                """ % (
-                    table_name
-                )
-            ).fetchall()
-        ]
+        return self.catalog.columns(connection=self.conn, table_name=table_name)
 
     def select_num_table_records(
         self,
@@ -762,18 +1334,13 @@ class Connection():
                 returns (a) record(s), then the number of records
                 is returned.
         """
-        query = """
-            SELECT COUNT(*)
-            FROM %s
-            WHERE %s = '%s';
-        """ % (
-            str(table_name),
-            str(filtr.col),
-            normalize(string=filtr.val)
-        )
-        value = [
-            i[0] for i in self.conn.cursor().execute(query).fetchall()
-        ]
+        value = self.execute(
+            query=_syntax.Statement.count(
+                table_name=str(table_name),
+                col=str(filtr.col)
+            ),
+            params=[_syntax.Literal.param(filtr.val)]
+        ).fetchone()
 
         if value:
             return int(value[0])
@@ -792,18 +1359,7 @@ class Connection():
         col : `str`
             Name of the database table column.
         """
-        query = """
-            SELECT
-                m.name AS table_name,
-                p.name AS column_name
-            FROM sqlite_master AS m
-            LEFT OUTER JOIN pragma_table_info((m.name)) AS p
-            ON m.name <> p.name
-            WHERE column_name = '%s'
-            ORDER BY table_name, column_name;
-        """ % (str(col))
-
-        return [i[0] for i in self.conn.cursor().execute(query).fetchall()]
+        return self.catalog.tables_with_column(connection=self.conn, col=col)
 
     # Define generic db function(s) for selecting table values
     def select_table_column_value(
@@ -847,67 +1403,50 @@ class Connection():
         if not isinstance(filtr.val, list):
             filtr.val = [filtr.val]
 
-        if contains:
-            query = """
-                SELECT %s
-                FROM %s
-                WHERE %s IN (%s)
-                ORDER BY %s %s;
-            """ % (
-                str(col),
-                str(table_name),
-                str(filtr.col),
-                ', '.join(["'%s'" % normalize(string=i) for i in filtr.val]),
-                str(col),
-                str(order)
-            )
-        else:
-            query = """
-                SELECT %s
-                FROM %s
-                WHERE %s NOT IN (%s)
-                ORDER BY %s %s;
-            """ % (
-                str(col),
-                str(table_name),
-                str(filtr.col),
-                ', '.join(["'%s'" % normalize(string=i) for i in filtr.val]),
-                str(col),
-                str(order)
-            )
+        query = _syntax.Statement.select(
+            table_name=str(table_name),
+            cols=(str(col),),
+            col=str(filtr.col),
+            arity=arity(value=filtr.val),
+            contains=bool(contains),
+            order=str(order)
+        )
+        params = _syntax.Statement.params(values=filtr.val)
 
         value = [
-            i[0] for i in self.conn.cursor().execute(query).fetchall()
+            i[0] for i in self.fetch(query=query, params=params)
         ]
 
         if value:
             if len(value) == 1 and not multi:
-                return utils.as_type(
+                return as_type(
                     value=value[0],
                     return_dtype=return_dtype
                 )
             elif len(value) == 1 and multi:
-                return [utils.as_type(
+                return [as_type(
                     value=value[0],
                     return_dtype=return_dtype
                 )]
             elif len(value) > 1 and multi:
-                return [utils.as_type(
+                return [as_type(
                     value=v,
                     return_dtype=return_dtype
                 ) for v in value]
             else:
                 raise ValueError(
                     ' '.join([
-                        "The query {%s} returned more than one value." % (
-                            query
+                        "The query {%s} with parameters {%s} returned more than one value." % (
+                            query,
+                            params
                         )
                     ])
                 )
         else:
             raise NullReturnValue(
-                "The query {%s} returned a null value." % (
-                    query
+                "The query {%s} with parameters {%s} returned a null value." % (
+                    query,
+                    params
                 )
             )
 
@@ -931,44 +1470,234 @@ class Connection():
                 the `cols` and values are returned as a `dict`. If no record(s) are
                 returned, then `NullReturnValue` is raised.
         """
-        if isinstance(filtr.val, list):
-            query = """
-                SELECT %s
-                FROM %s
-                WHERE %s IN (%s);
-            """ % (
-                ', '.join([str(i) for i in cols]),
-                str(table_name),
-                str(filtr.col),
-                ', '.join(["'%s'" % normalize(string=i) for i in filtr.val])
-            )
+        query = _syntax.Statement.select(
+            table_name=str(table_name),
+            cols=tuple([str(i) for i in cols]),
+            col=str(filtr.col),
+            arity=arity(value=filtr.val)
+        )
+        params = _syntax.Statement.params(values=filtr.val)
+
+        values = self.fetch(query=query, params=params, mode='one')
+
+        if values:
+            return dict(zip(cols, values))
         else:
-            query = """
-                SELECT %s
-                FROM %s
-                WHERE %s = '%s';
-            """ % (
-                ', '.join([str(i) for i in cols]),
-                str(table_name),
-                str(filtr.col),
-                normalize(string=filtr.val)
+            raise NullReturnValue(
+                "The query {%s} with parameters {%s} returned a null value." % (
+                    query,
+                    params
+                )
+            )
+
+    # Define generic db function(s) for selecting scoped table values across databases
+    def select_scoped_table_column_value(
+        self,
+        db_name: str,
+        table_name: str,
+        col: str,
+        query_index: str,
+        scope_db_name: str,
+        scope_query_index: str,
+        scope_value: str,
+        filtr: Union[Filter, None] = None,
+        return_dtype: Literal['str', 'int', 'float', 'bool', 'list', 'dict'] = 'str',
+        aggregate: Union[str, None] = None,
+        order: Union[str, None] = 'ASC'
+    ) -> list:
+        """ Returns the column values of the records of a database table that belong to a scope
+        as a `list`, by joining the table within `db_name` to the same table within `scope_db_name`
+        in a single query.
+
+        Parameters
+        ----------
+        db_name : `str`
+            Name of the database that contains the scoped table.
+        table_name : `str`
+            Name of the database table within both `db_name` and `scope_db_name`.
+        col : `str`
+            Name of the scoped table column.
+        query_index : `str`
+            Name of the index within `db_name` & `table_name`. May only be one column.
+        scope_db_name : `str`
+            Name of the database that contains the associated scope.
+        scope_query_index : `str`
+            Name of the index within `scope_db_name` & `table_name`. May only be one column.
+        scope_value : `str`
+            The `scope_query_index` value of the scope.
+        filtr : `Union[Filter, None]`
+            Filter object containing the column `col` and value `val` to filter the scoped
+                table by equality.
+        return_dtype : `Literal['str', 'int', 'float', 'bool', 'list', 'dict']`
+            Name of the datatype (`str`, `int`, `float`, `bool`, `list`, `dict`) of
+                the returned values.
+        aggregate : `Union[str, None]`
+            The aggregate function applied to `col`, e.g., `MAX`.
+        order : `Union[str, None]`
+            The sorting method (`ASC`, `DESC`) for the returned values.
+        """
+        values = self._select_scoped(
+            db_name=db_name,
+            table_name=table_name,
+            cols=[col],
+            query_index=query_index,
+            scope_db_name=scope_db_name,
+            scope_query_index=scope_query_index,
+            scope_value=scope_value,
+            filtr=filtr,
+            aggregate=aggregate,
+            order=order
+        )
+
+        return [as_type(value=i[0], return_dtype=return_dtype) for i in values]
+
+    def select_scoped_multi_table_column_value(
+        self,
+        db_name: str,
+        table_name: str,
+        cols: List[str],
+        query_index: str,
+        scope_db_name: str,
+        scope_query_index: str,
+        scope_value: str,
+        filtr: Filter
+    ) -> dict:
+        """ Returns multiple column values of the single record of a database table that belongs
+        to a scope and matches `filtr` as a `dict`. If more than one record is returned, then a
+        `ValueError` is raised.
+
+        Parameters
+        ----------
+        db_name : `str`
+            Name of the database that contains the scoped table.
+        table_name : `str`
+            Name of the database table within both `db_name` and `scope_db_name`.
+        cols : `List[str]`
+            Names of the scoped table columns.
+        query_index : `str`
+            Name of the index within `db_name` & `table_name`. May only be one column.
+        scope_db_name : `str`
+            Name of the database that contains the associated scope.
+        scope_query_index : `str`
+            Name of the index within `scope_db_name` & `table_name`. May only be one column.
+        scope_value : `str`
+            The `scope_query_index` value of the scope.
+        filtr : `Filter`
+            Filter object containing the column `col` and value `val` to filter the scoped
+                table by equality.
+        """
+        values = self._select_scoped(
+            db_name=db_name,
+            table_name=table_name,
+            cols=cols,
+            query_index=query_index,
+            scope_db_name=scope_db_name,
+            scope_query_index=scope_query_index,
+            scope_value=scope_value,
+            filtr=filtr
+        )
+
+        if len(values) > 1:
+            raise ValueError(
+                'The scoped query of {%s} filtered by {%s = %s} returned more than one record.' % (
+                    table_name,
+                    filtr.col,
+                    filtr.val
+                )
             )
 
-        values = self.conn.cursor().execute(query).fetchall()[0]
+        return dict(zip(cols, values[0]))
+
+    def select_scoped_table(
+        self,
+        db_name: str,
+        table_name: str,
+        query_index: str,
+        scope_db_name: str,
+        scope_query_index: str,
+        scope_value: str
+    ) -> pd.DataFrame:
+        """ Returns all records of a database table that belong to a scope as a `pd.DataFrame`.
+
+        Parameters
+        ----------
+        db_name : `str`
+            Name of the database that contains the scoped table.
+        table_name : `str`
+            Name of the database table within both `db_name` and `scope_db_name`.
+        query_index : `str`
+            Name of the index within `db_name` & `table_name`. May only be one column.
+        scope_db_name : `str`
+            Name of the database that contains the associated scope.
+        scope_query_index : `str`
+            Name of the index within `scope_db_name` & `table_name`. May only be one column.
+        scope_value : `str`
+            The `scope_query_index` value of the scope.
+        """
+        return pd.read_sql(
+            sql=_syntax.Statement.scoped(
+                schema=self.schema(db_name=db_name),
+                table_name=str(table_name),
+                cols=('*',),
+                query_index=str(query_index),
+                scope_schema=self.schema(db_name=scope_db_name),
+                scope_query_index=str(scope_query_index)
+            ),
+            con=self.conn,
+            params=[_syntax.Literal.param(scope_value)]
+        )
+
+    def _select_scoped(
+        self,
+        db_name: str,
+        table_name: str,
+        cols: List[str],
+        query_index: str,
+        scope_db_name: str,
+        scope_query_index: str,
+        scope_value: str,
+        filtr: Union[Filter, None] = None,
+        aggregate: Union[str, None] = None,
+        order: Union[str, None] = None
+    ) -> List[tuple]:
+        """ Returns the records of a scoped query as a `list`. If no records are returned,
+        then `NullReturnValue` is raised.
+        """
+        query = _syntax.Statement.scoped(
+            schema=self.schema(db_name=db_name),
+            table_name=str(table_name),
+            cols=tuple([str(i) for i in cols]),
+            query_index=str(query_index),
+            scope_schema=self.schema(db_name=scope_db_name),
+            scope_query_index=str(scope_query_index),
+            col=str(filtr.col) if filtr is not None else None,
+            aggregate=aggregate,
+            order=order
+        )
+        params = [_syntax.Literal.param(scope_value)]
+        if filtr is not None:
+            params += [_syntax.Literal.param(filtr.val)]
+
+        values = [
+            i for i in self.fetch(query=query, params=params)
+            if not (aggregate and i[0] is None)
+        ]
 
         if values:
-            return dict(zip(cols, values))
+            return values
         else:
             raise NullReturnValue(
-                "The query {%s} returned a null value." % (
-                    query
+                "The query {%s} with parameters {%s} returned a null value." % (
+                    query,
+                    params
                 )
             )
 
     def select_generic_query(
         self,
         query: str,
-        return_dtype: Literal['str', 'int', 'float', 'bool', 'list', 'dict'] = 'str'
+        return_dtype: Literal['str', 'int', 'float', 'bool', 'list', 'dict'] = 'str',
+        params: Sequence[Any] = ()
     ) -> Union[str, int, float, bool, list, dict]:
         """ Returns the result of the SQL query as `return_dtype`.
 
@@ -981,14 +1710,16 @@ class Connection():
             Name of the datatype (`str`, `int`, `float`, `bool`, `list`, `dict`) of
                 the returned value. If the returned value cannot be converted
                 to `return_dtype` then a `TypeError` is raised.
+        params : `Sequence[Any]`
+            Values bound to the `?` placeholders of `query`.
         """
         value = [
-            i[0] for i in self.conn.cursor().execute(query).fetchall()
+            i[0] for i in self.fetch(query=query, params=params)
         ]
 
         if value:
             if len(value) == 1:
-                return utils.as_type(
+                return as_type(
                     value=value[0],
                     return_dtype=return_dtype
                 )
@@ -1032,6 +1763,45 @@ def parse_db_name(db_name: str) -> str:
         return '.'.join([file_name, DBMS.DEFAULT])
 
 
+# Define the python 'built-in' datatype of each return datatype
+BUILT_INS: Dict[str, type] = {
+    'str': str,
+    'int': int,
+    'float': float,
+    'bool': bool,
+    'datetime': datetime.datetime,
+    'timedelta': datetime.timedelta
+}
+
+
+def as_type(
+    value: Any,
+    return_dtype: Literal['str', 'int', 'float', 'bool', 'list', 'dict', 'datetime', 'timedelta'] = 'str'
+) -> Union[str, int, float, bool, list, dict, datetime.datetime, datetime.timedelta]:
+    """ Returns a selected value as `return_dtype`. Values that are already stored as `return_dtype`,
+    since they were bound natively, are returned without conversion, booleans stored as `'1'` or `'0'`
+    within `TEXT` columns are converted to `bool`, and all other values are converted by
+    `pytensils.utils.as_type`.
+
+    Parameters
+    ----------
+    value : `Any`
+        The selected value.
+    return_dtype : `Literal['str', 'int', 'float', 'bool', 'list', 'dict', 'datetime', 'timedelta']`
+        Name of the datatype of the returned value. If the returned value cannot be converted
+            to `return_dtype` then a `TypeError` is raised.
+    """
+    built_in = BUILT_INS.get(str(return_dtype).strip().lower(), None)
+    if built_in is not None and type(value) is built_in:
+        return value
+    elif built_in is bool and isinstance(value, (int, float)):
+        return bool(value)
+    elif built_in is bool and isinstance(value, str) and value.strip() in ['0', '1']:
+        return value.strip() == '1'
+    else:
+        return utils.as_type(value=value, return_dtype=return_dtype)
+
+
 def normalize(
     string: str
 ) -> str:
@@ -1056,3 +1826,20 @@ def escape_quote_char(
         String to escape.
     """
     return str(string).replace("'", "''")
+
+
+def arity(
+    value: Any
+) -> Union[int, None]:
+    """ Returns the `IN` list arity bucket of a filter value as an `int`, or `None` when
+    the filter value is a single value.
+
+    Parameters
+    ----------
+    value: `Any`
+        Filter value.
+    """
+    if isinstance(value, (list, tuple)):
+        return _syntax.Statement.bucket(arity=len(value))
+    else:
+        return None
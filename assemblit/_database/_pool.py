@@ -0,0 +1,462 @@
+""" Database connection pool
+
+Maintains a process-wide, thread-safe pool of sqlite3-connections for each
+database file. Pooled connections are shared across `streamlit` sessions and
+page re-runs, so that connections are only opened once and then re-used.
+
+A pool may attach other database files to each of its connections, so that a
+single connection can join tables across databases.
+
+Each thread leases at most one connection from a pool at a time. Repeated
+acquisitions within the same thread add a lease to the connection that the
+thread already holds, and the connection is only returned to the pool once all
+of its leases are released.
+
+The maximum number of open connections of each pool is set within
+'/.assemblit/config.yaml' via the `ASSEMBLIT_DB_POOL_SIZE` environment variable.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Union
+import os
+import time
+import sqlite3
+import threading
+from assemblit._database import _profiles
+
+# Define the environment variable that sets the pool size
+ENVIRONMENT_VARIABLE: str = 'ASSEMBLIT_DB_POOL_SIZE'
+
+# Define pool defaults
+DEFAULT_MAX_SIZE: int = 10
+DEFAULT_TIMEOUT: float = 30.0
+DEFAULT_RECYCLE: float = 3600.0
+DEFAULT_CACHED_STATEMENTS: int = 256
+
+
+# Define the pooled sqlite3-connection `class`
+class PooledConnection(sqlite3.Connection):
+    """ A `sqlite3.Connection` that is returned to its `Pool` when closed. """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.pool: Union[Pool, None] = None
+        self.owner: Union[int, None] = None
+        self.leases: int = 0
+        self.depth: int = 0
+        self.pending: list = []
+        self.catalogs: list = []
+        self.hooks: list = []
+        self.created_on: float = time.monotonic()
+        self.last_used: float = self.created_on
+
+    def close(self):
+        """ Releases a lease on the connection. The connection is returned to the pool
+        once all leases are released.
+        """
+        if self.pool is None:
+            super().close()
+        else:
+            self.pool.release(connection=self)
+
+    def dispose(self):
+        """ Closes the underlying sqlite3-connection. """
+        super().close()
+
+
+# Define the pool statistics `class`
+@dataclass
+class Statistics():
+    """ A `class` that contains the statistics of a connection pool.
+
+    Attributes
+    ----------
+    size : `int`
+        The number of open connections.
+    idle : `int`
+        The number of open connections available within the pool.
+    in_use : `int`
+        The number of open connections leased from the pool.
+    created : `int`
+        The total number of connections opened by the pool.
+    acquired : `int`
+        The total number of connections acquired from the pool.
+    released : `int`
+        The total number of connections returned to the pool.
+    recycled : `int`
+        The total number of connections closed by the pool after failing a health check.
+    waits : `int`
+        The total number of acquisitions that waited for a connection to be returned.
+    timeouts : `int`
+        The total number of acquisitions that timed-out waiting for a connection.
+    """
+
+    size: int = 0
+    idle: int = 0
+    in_use: int = 0
+    created: int = 0
+    acquired: int = 0
+    released: int = 0
+    recycled: int = 0
+    waits: int = 0
+    timeouts: int = 0
+
+    def to_dict(self) -> dict:
+        """ Returns the pool statistics as a `dict`. """
+        return asdict(self)
+
+
+# Define the connection pool `class`
+class Pool():
+    """ A `class` that represents a bounded pool of sqlite3-connections to a single database. """
+
+    def __init__(
+        self,
+        database: Union[str, os.PathLike],
+        max_size: Union[int, None] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        recycle: float = DEFAULT_RECYCLE,
+        pre_ping: bool = True,
+        profile: Union[_profiles.Profile, None] = None,
+        attach: Union[Dict[str, str], None] = None,
+        detect_types: int = sqlite3.PARSE_DECLTYPES
+    ):
+        """ Initializes an instance of the connection pool `class`.
+
+        Parameters
+        ----------
+        database : `Union[str, os.PathLike]`
+            Local file path of the database.
+        max_size : `Union[int, None]`
+            The maximum number of open connections. If `None`, the size is read from the
+                `ASSEMBLIT_DB_POOL_SIZE` environment variable, or `DEFAULT_MAX_SIZE` when it is not set.
+        timeout : `float`
+            The number of seconds to wait for a connection to be returned to the pool
+                before a `PoolTimeout` is raised.
+        recycle : `float`
+            The number of seconds after which an open connection is closed and replaced.
+        pre_ping : `bool`
+            `True` or `False`, whether to check the health of a connection before it is leased.
+        profile : `Union[_profiles.Profile, None]`
+            The database performance profile applied to each connection when it is opened.
+        attach : `Union[Dict[str, str], None]`
+            Local file paths of the databases to attach to each connection when it is opened,
+                keyed by schema name.
+        detect_types : `int`
+            Whether each connection converts the values of columns by their declared datatypes,
+                `sqlite3.PARSE_DECLTYPES`, or selects them as they are stored, `0`.
+        """
+
+        # Validate
+        if max_size is None:
+            max_size = get_max_size()
+        if int(max_size) < 1:
+            raise ValueError('The maximum pool size must be greater than 0.')
+
+        # Assign class variables
+        self.database: str = os.path.abspath(database)
+        self.max_size: int = int(max_size)
+        self.timeout: float = float(timeout)
+        self.recycle: float = float(recycle)
+        self.pre_ping: bool = bool(pre_ping)
+        self.profile: Union[_profiles.Profile, None] = profile
+        self.attach: Dict[str, str] = {
+            str(schema): os.path.abspath(path) for schema, path in (attach or {}).items()
+        }
+        self.detect_types: int = int(detect_types)
+        self.stats: Statistics = Statistics()
+
+        self._idle: List[PooledConnection] = []
+        self._owners: Dict[int, PooledConnection] = {}
+        self._condition: threading.Condition = threading.Condition(threading.Lock())
+
+    def acquire(self) -> PooledConnection:
+        """ Leases a connection from the pool and returns it as a `PooledConnection`. If
+        the current thread already holds a connection, then a lease is added to that connection.
+        """
+        thread = threading.get_ident()
+        deadline = time.monotonic() + self.timeout
+
+        with self._condition:
+
+            # Re-use the connection held by the current thread
+            if thread in self._owners:
+                connection = self._owners[thread]
+                connection.leases += 1
+                return connection
+
+            while True:
+
+                # Lease an idle connection
+                while self._idle:
+                    connection = self._idle.pop()
+                    self.stats.idle -= 1
+                    if self._healthy(connection=connection):
+                        return self._checkout(connection=connection, thread=thread)
+                    else:
+                        self._discard(connection=connection)
+                        self.stats.recycled += 1
+
+                # Reserve a new connection
+                if self.stats.size < self.max_size:
+                    self.stats.size += 1
+                    break
+
+                # Wait for a connection to be returned
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.stats.timeouts += 1
+                    raise PoolTimeout(
+                        ' '.join([
+                            'Timed-out after %s second(s) waiting for a connection to {%s}.' % (
+                                self.timeout,
+                                self.database
+                            ),
+                            'All %s connection(s) of the pool are leased. The pool size is set by `%s`.' % (
+                                self.max_size,
+                                ENVIRONMENT_VARIABLE
+                            )
+                        ])
+                    )
+                self.stats.waits += 1
+                self._condition.wait(timeout=remaining)
+
+        # Open the new connection outside of the lock
+        try:
+            connection = self._connect()
+        except Exception:
+            with self._condition:
+                self.stats.size -= 1
+                self._condition.notify()
+            raise
+
+        with self._condition:
+            self.stats.created += 1
+            return self._checkout(connection=connection, thread=thread)
+
+    def lease(
+        self,
+        connection: PooledConnection
+    ) -> PooledConnection:
+        """ Adds a lease to a connection that is already leased from the pool.
+
+        Parameters
+        ----------
+        connection : `PooledConnection`
+            A connection leased from the pool.
+        """
+        with self._condition:
+            if connection.leases < 1:
+                raise ValueError('The connection is not leased from the pool.')
+            connection.leases += 1
+        return connection
+
+    def release(
+        self,
+        connection: PooledConnection
+    ):
+        """ Releases a lease on a connection, returning the connection to the pool
+        once all leases are released.
+
+        Parameters
+        ----------
+        connection : `PooledConnection`
+            A connection leased from the pool.
+        """
+        with self._condition:
+
+            # Ignore connections that are not leased
+            if connection.leases < 1:
+                return
+
+            connection.leases -= 1
+            if connection.leases > 0:
+                return
+
+            # Return the connection
+            if self._owners.get(connection.owner) is connection:
+                del self._owners[connection.owner]
+            connection.owner = None
+            connection.last_used = time.monotonic()
+            self.stats.released += 1
+            self.stats.in_use -= 1
+
+            # Discard uncommitted changes
+            connection.depth = 0
+            connection.pending = []
+            for catalog in connection.catalogs:
+                catalog.end()
+            connection.catalogs = []
+            connection.hooks = []
+            try:
+                if connection.in_transaction:
+                    connection.rollback()
+                self._idle.append(connection)
+                self.stats.idle += 1
+            except sqlite3.Error:
+                self._discard(connection=connection)
+
+            self._condition.notify()
+
+    def statistics(self) -> dict:
+        """ Returns the pool statistics as a `dict`. """
+        with self._condition:
+            return self.stats.to_dict()
+
+    def dispose(self):
+        """ Closes all idle connections within the pool. """
+        with self._condition:
+            while self._idle:
+                self._discard(connection=self._idle.pop())
+                self.stats.idle -= 1
+            self._condition.notify_all()
+
+    def _connect(self) -> PooledConnection:
+        """ Opens a new pooled sqlite3-connection. """
+        connection: PooledConnection = sqlite3.connect(
+            self.database,
+            timeout=self.timeout,
+            check_same_thread=False,
+            factory=PooledConnection,
+            cached_statements=DEFAULT_CACHED_STATEMENTS,
+            detect_types=self.detect_types
+        )
+        try:
+            if self.profile is not None:
+                self.profile.apply(connection=connection)
+            for schema, path in self.attach.items():
+                connection.execute('ATTACH DATABASE ? AS "%s";' % (schema), [path])
+        except sqlite3.Error:
+            connection.dispose()
+            raise
+        connection.pool = self
+        return connection
+
+    def _checkout(
+        self,
+        connection: PooledConnection,
+        thread: int
+    ) -> PooledConnection:
+        """ Assigns a connection to a thread. Must be called while holding the lock.
+
+        Parameters
+        ----------
+        connection : `PooledConnection`
+            A connection owned by the pool.
+        thread : `int`
+            The identifier of the thread leasing the connection.
+        """
+        connection.owner = thread
+        connection.leases = 1
+        self._owners[thread] = connection
+        self.stats.acquired += 1
+        self.stats.in_use += 1
+        return connection
+
+    def _healthy(
+        self,
+        connection: PooledConnection
+    ) -> bool:
+        """ Returns `True` when an idle connection can be leased. Must be called while holding the lock.
+
+        Parameters
+        ----------
+        connection : `PooledConnection`
+            An idle connection owned by the pool.
+        """
+        if time.monotonic() - connection.created_on > self.recycle:
+            return False
+
+        if self.pre_ping:
+            try:
+                connection.execute('SELECT 1;').fetchone()
+            except sqlite3.Error:
+                return False
+
+        return True
+
+    def _discard(
+        self,
+        connection: PooledConnection
+    ):
+        """ Closes a connection and removes it from the pool. Must be called while holding the lock.
+
+        Parameters
+        ----------
+        connection : `PooledConnection`
+            A connection owned by the pool.
+        """
+        connection.pool = None
+        self.stats.size -= 1
+        try:
+            connection.dispose()
+        except sqlite3.Error:
+            pass
+
+
+def get_max_size() -> int:
+    """ Returns the maximum number of open connections of a pool as an `int`, read from the
+    `ASSEMBLIT_DB_POOL_SIZE` environment variable, or `DEFAULT_MAX_SIZE` when it is not set.
+    """
+    try:
+        return int(os.environ.get(ENVIRONMENT_VARIABLE, None) or DEFAULT_MAX_SIZE)
+    except ValueError:
+        raise ValueError(
+            'Invalid database pool size {%s}. The pool size must be a positive number of connections.' % (
+                os.environ.get(ENVIRONMENT_VARIABLE)
+            )
+        )
+
+
+# Define the process-wide pool registry
+_POOLS: Dict[str, Pool] = {}
+_POOLS_LOCK: threading.Lock = threading.Lock()
+
+
+def get_pool(
+    database: Union[str, os.PathLike],
+    **kwargs
+) -> Pool:
+    """ Returns the process-wide `Pool` of `database`, creating it if it does not exist.
+
+    Pools that attach other databases, or that do not convert values by their declared datatypes,
+    are registered separately from the pool of `database`.
+
+    Parameters
+    ----------
+    database : `Union[str, os.PathLike]`
+        Local file path of the database.
+    **kwargs
+        Keyword arguments passed to `Pool` when the pool is created.
+    """
+    key = os.path.abspath(database)
+    if kwargs.get('attach', None):
+        key = '%s?attach=%s' % (key, ','.join(sorted(kwargs['attach'])))
+    if kwargs.get('detect_types', sqlite3.PARSE_DECLTYPES) != sqlite3.PARSE_DECLTYPES:
+        key = '%s%sdetect_types=%s' % (key, '&' if '?' in key else '?', kwargs['detect_types'])
+    with _POOLS_LOCK:
+        if key not in _POOLS:
+            _POOLS[key] = Pool(database=database, **kwargs)
+        return _POOLS[key]
+
+
+def statistics() -> Dict[str, dict]:
+    """ Returns the statistics of every pool as a `dict`, keyed by database file path. """
+    with _POOLS_LOCK:
+        pools = dict(_POOLS)
+    return {key: pool.statistics() for key, pool in pools.items()}
+
+
+def dispose():
+    """ Closes all idle connections and removes every pool from the registry. """
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        pool.dispose()
+
+
+# Define exception classes
+class PoolTimeout(sqlite3.OperationalError):
+    pass
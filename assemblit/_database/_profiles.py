@@ -0,0 +1,130 @@
+""" Database performance profiles
+
+Named sets of sqlite3 `PRAGMA` settings that are applied to every connection
+opened by the database connection pool. The profile is selected within
+'/.assemblit/config.yaml' via the `ASSEMBLIT_DB_PROFILE` environment variable.
+
+- `default`: write-ahead logging with moderate page-cache and memory-mapped I/O,
+    suitable for a single `streamlit` server with a handful of sessions.
+- `concurrent`: write-ahead logging with a larger page-cache, memory-mapped I/O and
+    a long busy-timeout, suitable for many concurrent readers and writers.
+- `bulk-load`: write-ahead logging without `fsync` on commit, suitable for
+    loading large datasets where durability on power-loss is not required.
+"""
+
+from __future__ import annotations
+import os
+import sqlite3
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Literal, Union
+
+# Define the environment variable that selects the profile
+ENVIRONMENT_VARIABLE: str = 'ASSEMBLIT_DB_PROFILE'
+DEFAULT: str = 'default'
+
+
+# Define the database profile `class`
+@dataclass(frozen=True)
+class Profile():
+    """ A `class` that contains the sqlite3 `PRAGMA` settings of a database performance profile.
+
+    Attributes
+    ----------
+    journal_mode : `Literal['DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'WAL', 'OFF']`
+        The journal mode of the database. `WAL` allows readers to proceed concurrently with a writer.
+    synchronous : `Literal['OFF', 'NORMAL', 'FULL', 'EXTRA']`
+        The `fsync` behavior on commit. `NORMAL` is durable on application crash when using `WAL`.
+    cache_size : `int`
+        The page-cache size. Negative values are in KiB, positive values are in pages.
+    mmap_size : `int`
+        The maximum number of bytes of the database file to access via memory-mapped I/O.
+    temp_store : `Literal['DEFAULT', 'FILE', 'MEMORY']`
+        The storage location of temporary tables and indices.
+    busy_timeout : `int`
+        The number of milliseconds to wait on a locked database before raising
+            `sqlite3.OperationalError`.
+    """
+
+    journal_mode: Literal['DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'WAL', 'OFF'] = 'WAL'
+    synchronous: Literal['OFF', 'NORMAL', 'FULL', 'EXTRA'] = 'NORMAL'
+    cache_size: int = -16000
+    mmap_size: int = 67108864
+    temp_store: Literal['DEFAULT', 'FILE', 'MEMORY'] = 'MEMORY'
+    busy_timeout: int = 5000
+
+    def to_dict(self) -> dict:
+        """ Returns the database profile as a `dict`. """
+        return asdict(self)
+
+    def to_pragmas(self) -> List[str]:
+        """ Returns the database profile as a `list` of sqlite3 `PRAGMA` statements. """
+        return [
+            'PRAGMA busy_timeout = %s;' % (int(self.busy_timeout)),
+            'PRAGMA journal_mode = %s;' % (str(self.journal_mode).upper()),
+            'PRAGMA synchronous = %s;' % (str(self.synchronous).upper()),
+            'PRAGMA cache_size = %s;' % (int(self.cache_size)),
+            'PRAGMA mmap_size = %s;' % (int(self.mmap_size)),
+            'PRAGMA temp_store = %s;' % (str(self.temp_store).upper())
+        ]
+
+    def apply(
+        self,
+        connection: sqlite3.Connection
+    ):
+        """ Applies the database profile to a sqlite3-connection.
+
+        Parameters
+        ----------
+        connection : `sqlite3.Connection`
+            An open sqlite3-connection.
+        """
+        for pragma in self.to_pragmas():
+            connection.execute(pragma).fetchall()
+
+
+# Define the named database profiles
+PROFILES: Dict[str, Profile] = {
+    'default': Profile(),
+    'concurrent': Profile(
+        journal_mode='WAL',
+        synchronous='NORMAL',
+        cache_size=-65536,
+        mmap_size=268435456,
+        temp_store='MEMORY',
+        busy_timeout=30000
+    ),
+    'bulk-load': Profile(
+        journal_mode='WAL',
+        synchronous='OFF',
+        cache_size=-262144,
+        mmap_size=268435456,
+        temp_store='MEMORY',
+        busy_timeout=30000
+    )
+}
+
+
+def get_profile(
+    name: Union[str, None] = None
+) -> Profile:
+    """ Returns the named database profile as a `Profile`. If `name` is `None`, then the
+    profile named by the `ASSEMBLIT_DB_PROFILE` environment variable is returned,
+    otherwise the `default` profile.
+
+    Parameters
+    ----------
+    name : `Union[str, None]`
+        Name of the database profile.
+    """
+    if name is None:
+        name = os.environ.get(ENVIRONMENT_VARIABLE, None) or DEFAULT
+
+    try:
+        return PROFILES[str(name).strip().lower()]
+    except KeyError:
+        raise ValueError(
+            'Invalid database profile {%s}. Currently, `assemblit` supports the following profiles, [%s].' % (
+                name,
+                ', '.join(["'%s'" % (i) for i in PROFILES])
+            )
+        )
@@ -0,0 +1,836 @@
+""" Dataset storage engines
+
+Pluggable engines that persist uploaded datasets and read them back, while the
+`data` database only retains the dataset metadata and the dataset catalog. The
+engine is selected within '/.assemblit/config.yaml' via the
+`ASSEMBLIT_DATASET_ENGINE` environment variable.
+
+- `sqlite`: stores each dataset as a table within the `data` database.
+- `parquet`: stores each dataset as a compressed Parquet file under the database
+    directory and reads it with column projection and memory-mapping. Requires
+    `pyarrow`.
+
+The engine of a stored dataset is resolved from its location, so datasets written
+by different engines can be read and dropped side-by-side. Datasets are written
+either whole or from an iterator of chunks, and read with column projection, row
+filters and, optionally, as an iterator of `chunksize`-row chunks, so callers only
+hold the columns and rows that they need in memory.
+
+Datasets are first staged at a temporary location that is unique to each writer,
+outside of any transaction, and then installed at their location within a transaction
+of the `data` database, so that concurrent writers of the same content-addressed
+location never share a partially written dataset, and the installation is serialized
+with the removal of unreferenced datasets.
+"""
+
+from __future__ import annotations
+import os
+import sqlite3
+import shutil
+import tempfile
+import uuid
+from typing import Dict, Iterable, Iterator, List, Tuple, Type, Union
+import pandas as pd
+from assemblit.toolkit import aggregator
+from assemblit._database import _generic
+from assemblit._database._structures import Filter
+
+try:
+    import pyarrow
+    import pyarrow.compute
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover
+    pyarrow = None
+
+# Define the environment variable that selects the engine
+ENVIRONMENT_VARIABLE: str = 'ASSEMBLIT_DATASET_ENGINE'
+DEFAULT: str = 'sqlite'
+
+# Define the default number of rows of each chunk when exporting a dataset
+DEFAULT_CHUNKSIZE: int = 100000
+
+
+# Define the dataset storage engine `class`
+class Engine():
+    """ A `class` that represents a dataset storage engine of the `data` database. """
+
+    name: str = ''
+
+    # Define whether stored datasets are removed within the transaction of the `data` database
+    transactional: bool = True
+
+    def __init__(
+        self,
+        Database: _generic.Connection
+    ):
+        """ Initializes an instance of the dataset storage engine `class`.
+
+        Parameters
+        ----------
+        Database : `_generic.Connection`
+            Connection to the data database.
+        """
+
+        # Assign class variables
+        self.Database: _generic.Connection = Database
+
+    def location(
+        self,
+        dataset_id: str
+    ) -> str:
+        """ Returns the physical location of a dataset as a `str`.
+
+        Parameters
+        ----------
+        dataset_id : `str`
+            Dataset ID of the dataset.
+        """
+        raise NotImplementedError
+
+    def write(
+        self,
+        dataset_id: str,
+        df: Union[pd.DataFrame, Iterable[pd.DataFrame]],
+        exist_ok: bool = False
+    ) -> str:
+        """ Stores a dataset, by staging and installing it, and returns its physical location as a `str`.
+
+        Parameters
+        ----------
+        dataset_id : `str`
+            Dataset ID of the dataset.
+        df : `Union[pd.DataFrame, Iterable[pd.DataFrame]]`
+            The dataset, or an iterable of the chunks of the dataset with identical columns.
+        exist_ok : `bool`
+            `True` or `False`, whether a dataset that is already stored at the location is kept, e.g.,
+                when the location is addressed by the content of the dataset.
+        """
+        staged = self.stage(dataset_id=dataset_id, df=df)
+        try:
+            with self.Database.transaction():
+                return self.install(staged=staged, dataset_id=dataset_id, exist_ok=exist_ok)
+        except BaseException:
+            self.drop(location=staged)
+            raise
+
+    def stage(
+        self,
+        dataset_id: str,
+        df: Union[pd.DataFrame, Iterable[pd.DataFrame]]
+    ) -> str:
+        """ Stores a dataset at a temporary location that is unique to the caller and returns the temporary
+        location as a `str`. When `df` is an iterable of chunks, each chunk is stored as it is consumed, and
+        the partially stored dataset is removed if consuming the iterable raises an exception. Chunks may
+        also be `pyarrow.Table` objects.
+
+        Parameters
+        ----------
+        dataset_id : `str`
+            Dataset ID of the dataset.
+        df : `Union[pd.DataFrame, Iterable[pd.DataFrame]]`
+            The dataset, or an iterable of the chunks of the dataset with identical columns.
+        """
+        raise NotImplementedError
+
+    def install(
+        self,
+        staged: str,
+        dataset_id: str,
+        exist_ok: bool = False
+    ) -> str:
+        """ Moves a staged dataset to the location of its dataset ID, replacing any dataset stored there, and
+        returns the location as a `str`. When `exist_ok` and a dataset is already stored at the location, the
+        staged dataset is removed instead. Call within a transaction of the `data` database, so that the
+        installation is serialized with the removal of unreferenced datasets.
+
+        Parameters
+        ----------
+        staged : `str`
+            Temporary location of the staged dataset.
+        dataset_id : `str`
+            Dataset ID of the dataset.
+        exist_ok : `bool`
+            `True` or `False`, whether a dataset that is already stored at the location is kept, e.g.,
+                when the location is addressed by the content of the dataset.
+        """
+        raise NotImplementedError
+
+    def read(
+        self,
+        location: str,
+        columns: Union[List[str], None] = None,
+        filtr: Union[Filter, List[Filter], None] = None,
+        chunksize: Union[int, None] = None
+    ) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+        """ Reads a dataset and returns it as a `pd.DataFrame`, or as an iterator of `pd.DataFrame`
+        chunks when `chunksize` is set.
+
+        Parameters
+        ----------
+        location : `str`
+            Physical location of the dataset.
+        columns : `Union[List[str], None]`
+            Names of the columns to read. If `None`, all columns are read.
+        filtr : `Union[Filter, List[Filter], None]`
+            The row filter(s). Each filter retains the rows where `col` equals `val`, or where `col` is
+                in `val` when `val` is a list. Multiple filters are combined with `AND`.
+        chunksize : `Union[int, None]`
+            The number of rows of each chunk. If `None`, the dataset is read as a single `pd.DataFrame`.
+        """
+        raise NotImplementedError
+
+    def export(
+        self,
+        location: str,
+        path: str,
+        file_format: str = 'csv',
+        columns: Union[List[str], None] = None,
+        chunksize: int = DEFAULT_CHUNKSIZE
+    ):
+        """ Writes a dataset to a local `.csv` or `.parquet` file, `chunksize` rows at a time.
+
+        Parameters
+        ----------
+        location : `str`
+            Physical location of the dataset.
+        path : `str`
+            Local file path of the exported file.
+        file_format : `str`
+            The format of the exported file, `csv` or `parquet`.
+        columns : `Union[List[str], None]`
+            Names of the columns to export. If `None`, all columns are exported.
+        chunksize : `int`
+            The number of rows of each chunk.
+        """
+        file_format = validate_format(file_format=file_format)
+
+        if file_format == 'csv':
+            header = True
+            with open(path, 'w', newline='') as file:
+                for chunk in self.read(location=location, columns=columns, chunksize=chunksize):
+                    chunk.to_csv(file, sep=',', index=False, header=header)
+                    header = False
+            if header:
+                self.read(location=location, columns=columns).to_csv(path, sep=',', index=False)
+        else:
+
+            # Column types may differ between chunks read from sqlite, so the file is written whole
+            self.read(location=location, columns=columns).to_parquet(path, index=False)
+
+    def exists(
+        self,
+        location: str
+    ) -> bool:
+        """ Returns `True` when the dataset exists.
+
+        Parameters
+        ----------
+        location : `str`
+            Physical location of the dataset.
+        """
+        raise NotImplementedError
+
+    def shape(
+        self,
+        location: str
+    ) -> Tuple[List[str], int]:
+        """ Returns the column names and the number of rows of a dataset as a `Tuple[List[str], int]`.
+
+        Parameters
+        ----------
+        location : `str`
+            Physical location of the dataset.
+        """
+        raise NotImplementedError
+
+    def drop(
+        self,
+        location: str
+    ):
+        """ Removes a dataset if it exists.
+
+        Parameters
+        ----------
+        location : `str`
+            Physical location of the dataset.
+        """
+        raise NotImplementedError
+
+    def size(
+        self,
+        location: str
+    ) -> Union[int, None]:
+        """ Returns the stored size of a dataset in bytes as an `int`, or `None` if unknown.
+
+        Parameters
+        ----------
+        location : `str`
+            Physical location of the dataset.
+        """
+        return None
+
+    def aggregate(
+        self,
+        location: str,
+        datetime: Union[list, None] = None,
+        dimension: Union[list, None] = None,
+        metrics: Union[list, None] = None,
+        aggrules: Union[list, None] = None
+    ) -> pd.DataFrame:
+        """ Groups a dataset by `dimension` and/or `datetime`, aggregates `metrics` with `aggrules` where
+        the dataset is stored and returns the result as a `pd.DataFrame`, equivalent to
+        `assemblit.toolkit.aggregator.agg_df`. Raises `Unsupported` when the engine cannot execute
+        an aggregation rule.
+
+        Parameters
+        ----------
+        location : `str`
+            Physical location of the dataset.
+        datetime : `Union[list, None]`
+            Ordered list of the date-time columns and their formats.
+        dimension : `Union[list, None]`
+            Ordered list of categorical columns to group the records.
+        metrics : `Union[list, None]`
+            Ordered list of numeric columns to summarize by `aggrules`.
+        aggrules : `Union[list, None]`
+            Ordered list of aggregation rules that determine the aggregation of the `metrics`.
+        """
+        raise Unsupported('The `%s` dataset storage engine does not aggregate datasets.' % (self.name))
+
+
+# Define the sqlite dataset storage engine `class`
+class Sqlite(Engine):
+    """ A `class` that stores each dataset as a table within the `data` database. """
+
+    name: str = 'sqlite'
+
+    # Define the partial aggregates that compute each supported `pandas` aggregation function
+    FUNCTIONS: Dict[str, Dict[str, str]] = {
+        'count': {'count': 'COUNT(%s)'},
+        'sum': {'sum': 'COALESCE(SUM(%s), 0)'},
+        'min': {'min': 'MIN(%s)'},
+        'max': {'max': 'MAX(%s)'},
+        'mean': {'sum': 'COALESCE(SUM(%s), 0)', 'count': 'COUNT(%s)'}
+    }
+
+    def location(
+        self,
+        dataset_id: str
+    ) -> str:
+        return str(dataset_id)
+
+    def stage(
+        self,
+        dataset_id: str,
+        df: Union[pd.DataFrame, Iterable[pd.DataFrame]]
+    ) -> str:
+        staged = '%s_%s' % (self.location(dataset_id=dataset_id), uuid.uuid4().hex)
+        created = False
+        try:
+            for chunk in chunks(df=df):
+                self.Database.to_sql(
+                    df=chunk if isinstance(chunk, pd.DataFrame) else chunk.to_pandas(),
+                    table_name=staged,
+                    index=False,
+                    if_exists='append' if created else 'fail'
+                )
+                created = True
+        except BaseException:
+            if created:
+                self.drop(location=staged)
+            raise
+        return staged
+
+    def install(
+        self,
+        staged: str,
+        dataset_id: str,
+        exist_ok: bool = False
+    ) -> str:
+        location = self.location(dataset_id=dataset_id)
+        if not self.exists(location=staged):
+            return location
+
+        if self.exists(location=location):
+            if exist_ok:
+                self.drop(location=staged)
+                return location
+            self.drop(location=location)
+
+        self.Database.execute(query='ALTER TABLE "%s" RENAME TO "%s";' % (staged, location))
+        self.Database.invalidate_catalog()
+        self.Database.invalidate(table_name=location)
+        return location
+
+    def read(
+        self,
+        location: str,
+        columns: Union[List[str], None] = None,
+        filtr: Union[Filter, List[Filter], None] = None,
+        chunksize: Union[int, None] = None
+    ) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+        clause, params = where(filtr=filtr)
+        return pd.read_sql(
+            sql='SELECT %s FROM "%s"%s;' % (
+                ', '.join([quote(col) for col in columns]) if columns else '*',
+                location,
+                clause
+            ),
+            con=self.Database.reader,
+            params=params,
+            chunksize=chunksize
+        )
+
+    def exists(
+        self,
+        location: str
+    ) -> bool:
+        return self.Database.table_exists(table_name=location)
+
+    def shape(
+        self,
+        location: str
+    ) -> Tuple[List[str], int]:
+        return (
+            self.Database.select_table_column_names_as_list(table_name=location),
+            self.Database.execute(query='SELECT COUNT(*) FROM %s;' % (quote(location))).fetchone()[0]
+        )
+
+    def drop(
+        self,
+        location: str
+    ):
+        self.Database.drop_table(table_name=location)
+
+    def size(
+        self,
+        location: str
+    ) -> Union[int, None]:
+        try:
+            value = self.Database.execute(
+                query='SELECT SUM(pgsize) FROM dbstat WHERE name = ?;',
+                params=[location]
+            ).fetchone()[0]
+        except sqlite3.OperationalError:
+            return None
+        return int(value) if value is not None else None
+
+    def aggregate(
+        self,
+        location: str,
+        datetime: Union[list, None] = None,
+        dimension: Union[list, None] = None,
+        metrics: Union[list, None] = None,
+        aggrules: Union[list, None] = None
+    ) -> pd.DataFrame:
+        functions = dict(zip(metrics, aggregator.parse_aggrules(aggrules=aggrules)))
+        if any(function not in self.FUNCTIONS for function in functions.values()):
+            raise Unsupported(
+                'The `sqlite` dataset storage engine does not support the agg. rule(s) [%s].' % (
+                    ', '.join([i for i in aggrules if aggregator.AGGRULES[i] not in self.FUNCTIONS])
+                )
+            )
+
+        # Group by the raw date-time values, which are parsed after aggregation
+        keys = list(dict.fromkeys((dimension or []) + [i[0] for i in (datetime or [])[:1]]))
+
+        # Aggregate each metric by partial aggregates that can be re-combined
+        expressions: List[str] = []
+        for metric, function in functions.items():
+            for name, expression in self.FUNCTIONS[function].items():
+                expressions.append('%s AS %s' % (expression % (quote(metric)), quote(partial(metric, name))))
+
+        df = pd.read_sql(
+            sql='SELECT %s FROM "%s" %s;' % (
+                ', '.join([quote(i) for i in keys] + expressions),
+                location,
+                'WHERE %s GROUP BY %s' % (
+                    ' AND '.join(['%s IS NOT NULL' % (quote(i)) for i in keys]),
+                    ', '.join([quote(i) for i in keys])
+                ) if keys else ''
+            ),
+            con=self.Database.reader
+        )
+
+        # Parse the date-time dimension and re-combine groups whose values parse to the same date-time
+        if datetime:
+            df[datetime[0][0]] = pd.to_datetime(df[datetime[0][0]], format=datetime[0][1])
+            df = df.groupby(keys).agg({
+                column: REDUCERS[column.rsplit('__', 1)[1]] for column in df.columns if column not in keys
+            }).reset_index(drop=False)
+
+        # Combine the partial aggregates
+        for metric, function in functions.items():
+            if function == 'mean':
+                df[metric] = df[partial(metric, 'sum')] / df[partial(metric, 'count')]
+            else:
+                df[metric] = df[partial(metric, function)]
+
+        df = df[keys + list(functions)]
+        if keys:
+            df = df.sort_values(by=keys).reset_index(drop=True)
+        return df
+
+
+# Define the parquet dataset storage engine `class`
+class Parquet(Engine):
+    """ A `class` that stores each dataset as a compressed Parquet file within the
+    'datasets' folder of the database directory.
+    """
+
+    name: str = 'parquet'
+    transactional: bool = False
+    suffix: str = '.parquet'
+    folder: str = 'datasets'
+    compression: str = 'zstd'
+
+    def __init__(
+        self,
+        Database: _generic.Connection
+    ):
+        if pyarrow is None:
+            raise ImportError(
+                'The `parquet` dataset storage engine requires `pyarrow`. Install it with `pip install assemblit[parquet]`.'
+            )
+        super().__init__(Database=Database)
+
+    def location(
+        self,
+        dataset_id: str
+    ) -> str:
+        return '%s/%s%s' % (self.folder, dataset_id, self.suffix)
+
+    def path(
+        self,
+        location: str
+    ) -> str:
+        """ Returns the local file path of a dataset as a `str`.
+
+        Parameters
+        ----------
+        location : `str`
+            Physical location of the dataset, relative to the database directory.
+        """
+        return os.path.join(self.Database.dir_name, *location.split('/'))
+
+    def stage(
+        self,
+        dataset_id: str,
+        df: Union[pd.DataFrame, Iterable[pd.DataFrame]]
+    ) -> str:
+        path = self.path(location=self.location(dataset_id=dataset_id))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # Write to a temporary file that is unique to the writer, so that readers never see a partial
+        #   file and concurrent writers of the same location never share one
+        descriptor, staged = tempfile.mkstemp(dir=os.path.dirname(path), prefix='%s.' % (dataset_id), suffix='.tmp')
+        os.close(descriptor)
+        writer = None
+        try:
+            for chunk in chunks(df=df):
+                if isinstance(chunk, pd.DataFrame):
+                    table = pyarrow.Table.from_pandas(df=chunk, preserve_index=False)
+                else:
+                    table = chunk
+                if writer is None:
+                    writer = pyarrow.parquet.ParquetWriter(
+                        staged,
+                        schema=table.schema,
+                        compression=self.compression
+                    )
+                writer.write_table(table.cast(writer.schema))
+            if writer is None:
+                pyarrow.parquet.write_table(
+                    pyarrow.Table.from_pandas(df=pd.DataFrame(), preserve_index=False),
+                    staged,
+                    compression=self.compression
+                )
+            else:
+                writer.close()
+        except BaseException:
+            if writer is not None:
+                writer.close()
+            if os.path.isfile(staged):
+                os.remove(staged)
+            raise
+        return '%s/%s' % (self.folder, os.path.basename(staged))
+
+    def install(
+        self,
+        staged: str,
+        dataset_id: str,
+        exist_ok: bool = False
+    ) -> str:
+        location = self.location(dataset_id=dataset_id)
+        if exist_ok and self.exists(location=location):
+            self.drop(location=staged)
+        else:
+            os.replace(self.path(location=staged), self.path(location=location))
+        return location
+
+    def read(
+        self,
+        location: str,
+        columns: Union[List[str], None] = None,
+        filtr: Union[Filter, List[Filter], None] = None,
+        chunksize: Union[int, None] = None
+    ) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+        if chunksize:
+            return self._iterate(location=location, columns=columns, filtr=filtr, chunksize=chunksize)
+
+        return pyarrow.parquet.read_table(
+            self.path(location=location),
+            columns=list(columns) if columns else None,
+            filters=expression(filtr=filtr),
+            memory_map=True
+        ).to_pandas()
+
+    def export(
+        self,
+        location: str,
+        path: str,
+        file_format: str = 'csv',
+        columns: Union[List[str], None] = None,
+        chunksize: int = DEFAULT_CHUNKSIZE
+    ):
+
+        # Copy the stored file, which is already in the requested format
+        if validate_format(file_format=file_format) == 'parquet' and not columns:
+            shutil.copyfile(self.path(location=location), path)
+        elif file_format == 'parquet':
+            with pyarrow.parquet.ParquetFile(self.path(location=location), memory_map=True) as source:
+                with pyarrow.parquet.ParquetWriter(path, schema=source.schema_arrow.select(list(columns))) as writer:
+                    for batch in source.iter_batches(batch_size=chunksize, columns=list(columns)):
+                        writer.write_batch(batch)
+        else:
+            super().export(location=location, path=path, file_format=file_format, columns=columns, chunksize=chunksize)
+
+    def _iterate(
+        self,
+        location: str,
+        columns: Union[List[str], None],
+        filtr: Union[Filter, List[Filter], None],
+        chunksize: int
+    ) -> Iterator[pd.DataFrame]:
+        """ Reads the record batches of a dataset and yields them as `pd.DataFrame` chunks. """
+        condition = expression(filtr=filtr)
+        with pyarrow.parquet.ParquetFile(self.path(location=location), memory_map=True) as source:
+            for batch in source.iter_batches(batch_size=int(chunksize), columns=list(columns) if columns else None):
+                table = pyarrow.Table.from_batches([batch])
+                yield (table.filter(condition) if condition is not None else table).to_pandas()
+
+    def exists(
+        self,
+        location: str
+    ) -> bool:
+        return os.path.isfile(self.path(location=location))
+
+    def shape(
+        self,
+        location: str
+    ) -> Tuple[List[str], int]:
+        metadata = pyarrow.parquet.read_metadata(self.path(location=location))
+        return metadata.schema.to_arrow_schema().names, metadata.num_rows
+
+    def drop(
+        self,
+        location: str
+    ):
+        if self.exists(location=location):
+            os.remove(self.path(location=location))
+
+    def size(
+        self,
+        location: str
+    ) -> Union[int, None]:
+        return os.path.getsize(self.path(location=location)) if self.exists(location=location) else None
+
+
+def chunks(
+    df: Union[pd.DataFrame, Iterable[pd.DataFrame]]
+) -> Iterator[pd.DataFrame]:
+    """ Returns an iterator of the chunks of a dataset as an `Iterator[pd.DataFrame]`. A `pyarrow.Table`
+    is a single chunk, like a `pd.DataFrame`.
+
+    Parameters
+    ----------
+    df : `Union[pd.DataFrame, Iterable[pd.DataFrame]]`
+        The dataset, or an iterable of the chunks of the dataset.
+    """
+    if isinstance(df, pd.DataFrame) or (pyarrow is not None and isinstance(df, pyarrow.Table)):
+        return iter([df])
+    return iter(df)
+
+
+# Define the functions that re-combine partial aggregates
+REDUCERS: Dict[str, str] = {
+    'count': 'sum',
+    'sum': 'sum',
+    'min': 'min',
+    'max': 'max'
+}
+
+
+def quote(
+    name: str
+) -> str:
+    """ Returns a quoted SQL-identifier as a `str`.
+
+    Parameters
+    ----------
+    name : `str`
+        The identifier.
+    """
+    return '"%s"' % (str(name).replace('"', '""'))
+
+
+def partial(
+    metric: str,
+    name: str
+) -> str:
+    """ Returns the column name of a partial aggregate of a metric as a `str`.
+
+    Parameters
+    ----------
+    metric : `str`
+        Name of the metric column.
+    name : `str`
+        Name of the partial aggregate, `count`, `sum`, `min` or `max`.
+    """
+    return '%s__%s' % (metric, name)
+
+
+def filters(
+    filtr: Union[Filter, List[Filter], None]
+) -> List[Tuple[str, list, bool]]:
+    """ Returns the column, the values and whether the values are a list of each row filter as a `list`.
+
+    Parameters
+    ----------
+    filtr : `Union[Filter, List[Filter], None]`
+        The row filter(s).
+    """
+    if filtr is None:
+        return []
+    return [
+        (str(i.col), list(i.val), True) if isinstance(i.val, (list, tuple)) else (str(i.col), [i.val], False)
+        for i in ([filtr] if isinstance(filtr, Filter) else filtr)
+    ]
+
+
+def where(
+    filtr: Union[Filter, List[Filter], None]
+) -> Tuple[str, list]:
+    """ Returns the parameterized `WHERE` clause of the row filter(s) and its parameters as a `tuple`.
+
+    Parameters
+    ----------
+    filtr : `Union[Filter, List[Filter], None]`
+        The row filter(s).
+    """
+    clauses, params = [], []
+    for col, values, multi in filters(filtr=filtr):
+        if multi:
+            clauses += ['%s IN (%s)' % (quote(col), ', '.join(['?'] * len(values))) if values else '0']
+        else:
+            clauses += ['%s = ?' % (quote(col))]
+        params += values
+    return (' WHERE %s' % (' AND '.join(clauses)) if clauses else ''), params
+
+
+def expression(
+    filtr: Union[Filter, List[Filter], None]
+):
+    """ Returns the `pyarrow.compute.Expression` of the row filter(s), or `None`.
+
+    Parameters
+    ----------
+    filtr : `Union[Filter, List[Filter], None]`
+        The row filter(s).
+    """
+    condition = None
+    for col, values, multi in filters(filtr=filtr):
+        if multi:
+            term = pyarrow.compute.field(col).isin(values) if values else pyarrow.compute.scalar(False)
+        else:
+            term = pyarrow.compute.field(col) == values[0]
+        condition = term if condition is None else condition & term
+    return condition
+
+
+def validate_format(
+    file_format: str
+) -> str:
+    """ Returns the normalized export file format, `csv` or `parquet`, as a `str`.
+
+    Parameters
+    ----------
+    file_format : `str`
+        The format of the exported file.
+    """
+    file_format = str(file_format).strip().lower().lstrip('.')
+    if file_format not in ['csv', 'parquet']:
+        raise ValueError(
+            'Invalid export file format {%s}. Datasets are exported as `csv` or `parquet` files.' % (file_format)
+        )
+    return file_format
+
+
+# Define the named dataset storage engines
+ENGINES: Dict[str, Type[Engine]] = {
+    'sqlite': Sqlite,
+    'parquet': Parquet
+}
+
+
+def get_engine(
+    Database: _generic.Connection,
+    name: Union[str, None] = None
+) -> Engine:
+    """ Returns the named dataset storage engine as an `Engine`. If `name` is `None`, then
+    the engine named by the `ASSEMBLIT_DATASET_ENGINE` environment variable is returned,
+    otherwise the `sqlite` engine.
+
+    Parameters
+    ----------
+    Database : `_generic.Connection`
+        Connection to the data database.
+    name : `Union[str, None]`
+        Name of the dataset storage engine.
+    """
+    if name is None:
+        name = os.environ.get(ENVIRONMENT_VARIABLE, None) or DEFAULT
+
+    try:
+        return ENGINES[str(name).strip().lower()](Database=Database)
+    except KeyError:
+        raise ValueError(
+            'Invalid dataset storage engine {%s}. Currently, `assemblit` supports the following engines, [%s].' % (
+                name,
+                ', '.join(["'%s'" % (i) for i in ENGINES])
+            )
+        )
+
+
+def resolve(
+    Database: _generic.Connection,
+    location: str
+) -> Engine:
+    """ Returns the dataset storage engine that stored the dataset at `location` as an `Engine`.
+
+    Parameters
+    ----------
+    Database : `_generic.Connection`
+        Connection to the data database.
+    location : `str`
+        Physical location of the dataset.
+    """
+    if str(location).endswith(Parquet.suffix):
+        return Parquet(Database=Database)
+    else:
+        return Sqlite(Database=Database)
+
+
+# Define exception classes
+class Unsupported(Exception):
+    pass
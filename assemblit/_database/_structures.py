@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import ClassVar, List, Union
+from typing import Any, ClassVar, List, Sequence, Tuple, Union
+import json
 
 
 # Define database management system options
@@ -115,3 +116,123 @@ class Table():
 
     table_name: Union[str, None] = None
     filtr: Union[Filter, None] = None
+
+
+# Define dataset structures
+class DatasetMetadata():
+    """ A `class` that represents the metadata record of an uploaded dataset within the `data` table.
+
+    Attributes
+    ----------
+    dataset_id : `str`
+        The dataset ID, the query-index value of the record.
+    uploaded_by : `str`
+        The name of the user that uploaded the dataset.
+    created_on : `Any`
+        The date-time when the dataset was uploaded.
+    final : `bool`
+        `True` or `False`, whether the dataset is finalized.
+    version : `int`
+        The version of the dataset.
+    file_name : `str`
+        The file name of the uploaded datafile.
+    dbms : `str`
+        The file-extension of the uploaded datafile, e.g., `.CSV`.
+    datetime : `list`
+        The date-time columns of the dataset and their formats.
+    dimensions : `list`
+        The categorical columns of the dataset.
+    metrics : `list`
+        The numeric columns of the dataset.
+    selected_datetime : `list`
+        The selected date-time column.
+    selected_dimensions : `list`
+        The selected categorical column.
+    selected_metrics : `list`
+        The selected numeric column.
+    selected_aggrules : `list`
+        The selected aggregation rule.
+    size_mb : `float`
+        The size of the uploaded datafile.
+    sha256 : `str`
+        The hash of the uploaded datafile.
+    """
+
+    __slots__ = (
+        'dataset_id',
+        'uploaded_by',
+        'created_on',
+        'final',
+        'version',
+        'file_name',
+        'dbms',
+        'datetime',
+        'dimensions',
+        'metrics',
+        'selected_datetime',
+        'selected_dimensions',
+        'selected_metrics',
+        'selected_aggrules',
+        'size_mb',
+        'sha256'
+    )
+
+    # Define the JSON-encoded attributes
+    JSON: ClassVar[Tuple[str, ...]] = (
+        'datetime',
+        'dimensions',
+        'metrics',
+        'selected_datetime',
+        'selected_dimensions',
+        'selected_metrics',
+        'selected_aggrules'
+    )
+
+    def __init__(self, **kwargs):
+        """ Initializes an instance of the dataset metadata `class`. Missing attributes are `None`. """
+        for name in self.__slots__:
+            setattr(self, name, kwargs.get(name, None))
+
+    def __repr__(self) -> str:
+        return 'DatasetMetadata(dataset_id=%r, file_name=%r, version=%r)' % (
+            self.dataset_id,
+            self.file_name,
+            self.version
+        )
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, DatasetMetadata) and all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    @classmethod
+    def columns(
+        cls,
+        query_index: str
+    ) -> Tuple[str, ...]:
+        """ Returns the `data` table columns of the record attributes as a `tuple`.
+
+        Parameters
+        ----------
+        query_index : `str`
+            Name of the query-index of the `data` table.
+        """
+        return (str(query_index),) + cls.__slots__[1:]
+
+    @classmethod
+    def from_row(
+        cls,
+        row: Sequence[Any]
+    ) -> DatasetMetadata:
+        """ Returns a record selected by `columns` as a `DatasetMetadata`, decoding each JSON-encoded
+        attribute once. Null JSON-encoded attributes are decoded as empty lists.
+
+        Parameters
+        ----------
+        row : `Sequence[Any]`
+            The values of the selected columns.
+        """
+        values = dict(zip(cls.__slots__, row))
+        for name in cls.JSON:
+            values[name] = json.loads(values[name]) if values[name] not in [None, ''] else []
+        return cls(**values)
@@ -1,10 +1,14 @@
 """ Database clause defaults """
 
 from dataclasses import dataclass
-from typing import Any, ClassVar
+from typing import Any, ClassVar, List, Tuple, Union
 import datetime
+import functools
 from assemblit._database import _adapters
 
+# Define the maximum number of cached statement shapes
+STATEMENT_CACHE_SIZE: int = 512
+
 
 @dataclass
 class Conflict():
@@ -45,6 +49,24 @@ class Conflict():
 
         return 'ON CONFLICT %s' % (Conflict.abort)
 
+    def validate(conflict: str) -> str:
+        """ Validates a conflict-resolution policy and returns it as an upper-case `str`.
+
+        conflict : `str`
+            The conflict-resolution policy.
+        """
+        policies = [Conflict.rollback, Conflict.abort, Conflict.fail, Conflict.ignore, Conflict.replace]
+
+        if str(conflict).strip().upper() not in policies:
+            raise ValueError(
+                'Invalid conflict-resolution policy {%s}. Expected one of [%s].' % (
+                    conflict,
+                    ', '.join(["'%s'" % (i) for i in policies])
+                )
+            )
+
+        return str(conflict).strip().upper()
+
 
 class Literal():
     """ A `class` for converting values to their literal string representation """
@@ -69,3 +91,357 @@ class Literal():
             return "'%s'" % (_adapters.Sqlite.adapt_timedelta(value))
         else:
             return "'%s'" % (value)
+
+    def param(value: Any) -> Any:
+        """ Converts a value to its bound-parameter value. Values of the datatypes supported by
+        `_adapters.Sqlite` are bound natively, all other values are bound as `str`.
+
+        value : `Any`
+            The value to convert.
+        """
+
+        return _adapters.Sqlite.adapt(value)
+
+
+class Statement():
+    """ A `class` that builds parameterized sqlite3-statements with `?` placeholders.
+
+    Statements are cached by their shape, the table name, the column names and the
+    arity bucket of any `IN` list, so that repeated queries re-use the same SQL text
+    and therefore the compiled statement cache of the sqlite3-connection.
+    """
+
+    def bucket(arity: int) -> int:
+        """ Returns the arity bucket of an `IN` list, the smallest power of two
+        that is greater than or equal to `arity`.
+
+        Parameters
+        ----------
+        arity : `int`
+            The number of values within the `IN` list.
+        """
+        if arity < 1:
+            return 0
+
+        size = 1
+        while size < arity:
+            size *= 2
+
+        return size
+
+    def params(values: Union[List[Any], Any]) -> List[Any]:
+        """ Returns the bound-parameter values of a filter value, padded to the arity bucket
+        by repeating the last value. Repeated values do not change the result of an `IN` list.
+
+        Parameters
+        ----------
+        values : `Union[List[Any], Any]`
+            The filter value(s).
+        """
+        if not isinstance(values, (list, tuple)):
+            values = [values]
+
+        params = [Literal.param(value) for value in values]
+        if params:
+            params += [params[-1]] * (Statement.bucket(arity=len(params)) - len(params))
+
+        return params
+
+    def placeholders(arity: int) -> str:
+        """ Returns a comma-separated list of `arity` placeholders.
+
+        Parameters
+        ----------
+        arity : `int`
+            The number of placeholders.
+        """
+        return ', '.join(['?'] * arity)
+
+    def where(
+        col: Union[str, None],
+        arity: Union[int, None] = None,
+        contains: bool = True
+    ) -> str:
+        """ Returns a parameterized `WHERE` clause.
+
+        Parameters
+        ----------
+        col : `Union[str, None]`
+            The column to filter. If `None`, an empty clause is returned.
+        arity : `Union[int, None]`
+            The arity bucket of the `IN` list, or `None` to filter by equality.
+        contains : `bool`
+            `True` or `False`, whether to filter where the column values are in
+                or not in the filter value(s).
+        """
+        if col is None:
+            return ''
+        elif arity is None:
+            return ' WHERE %s %s ?' % (col, '=' if contains else '<>')
+        else:
+            return ' WHERE %s %s (%s)' % (
+                col,
+                'IN' if contains else 'NOT IN',
+                Statement.placeholders(arity=arity)
+            )
+
+    @functools.lru_cache(maxsize=STATEMENT_CACHE_SIZE)
+    def select(
+        table_name: str,
+        cols: Tuple[str, ...],
+        col: Union[str, None] = None,
+        arity: Union[int, None] = None,
+        contains: bool = True,
+        order: Union[str, None] = None
+    ) -> str:
+        """ Returns a parameterized `SELECT` statement.
+
+        Parameters
+        ----------
+        table_name : `str`
+            Name of the database table.
+        cols : `Tuple[str, ...]`
+            Names of the database table columns to select.
+        col : `Union[str, None]`
+            The column to filter.
+        arity : `Union[int, None]`
+            The arity bucket of the `IN` list, or `None` to filter by equality.
+        contains : `bool`
+            `True` or `False`, whether to filter where the column values are in
+                or not in the filter value(s).
+        order : `Union[str, None]`
+            The sorting method (`ASC`, `DESC`) of the first selected column.
+        """
+        return 'SELECT %s FROM %s%s%s;' % (
+            ', '.join(cols),
+            table_name,
+            Statement.where(col=col, arity=arity, contains=contains),
+            ' ORDER BY %s %s' % (cols[0], order) if order else ''
+        )
+
+    @functools.lru_cache(maxsize=STATEMENT_CACHE_SIZE)
+    def changed(
+        table_name: str,
+        cols: Tuple[str, ...],
+        col: str
+    ) -> str:
+        """ Returns a parameterized statement that selects, for each of `cols`, whether the stored
+        value differs from a bound value. Values are compared by sqlite3, so that the column affinity
+        is applied to the bound values. The last parameter is the filter value.
+
+        Parameters
+        ----------
+        table_name : `str`
+            Name of the database table.
+        cols : `Tuple[str, ...]`
+            Names of the database table columns to compare.
+        col : `str`
+            The column to filter.
+        """
+        return 'SELECT %s FROM %s%s;' % (
+            ', '.join(['%s IS NOT ?' % (c) for c in cols]),
+            table_name,
+            Statement.where(col=col)
+        )
+
+    @functools.lru_cache(maxsize=STATEMENT_CACHE_SIZE)
+    def exists(
+        table_name: str,
+        col: str,
+        arity: Union[int, None] = None
+    ) -> str:
+        """ Returns a parameterized statement that selects at most one filtered record.
+
+        Parameters
+        ----------
+        table_name : `str`
+            Name of the database table.
+        col : `str`
+            The column to filter.
+        arity : `Union[int, None]`
+            The arity bucket of the `IN` list, or `None` to filter by equality.
+        """
+        return 'SELECT 1 FROM %s%s LIMIT 1;' % (
+            table_name,
+            Statement.where(col=col, arity=arity)
+        )
+
+    @functools.lru_cache(maxsize=STATEMENT_CACHE_SIZE)
+    def count(
+        table_name: str,
+        col: str,
+        arity: Union[int, None] = None
+    ) -> str:
+        """ Returns a parameterized statement that counts the filtered records.
+
+        Parameters
+        ----------
+        table_name : `str`
+            Name of the database table.
+        col : `str`
+            The column to filter.
+        arity : `Union[int, None]`
+            The arity bucket of the `IN` list, or `None` to filter by equality.
+        """
+        return 'SELECT COUNT(*) FROM %s%s;' % (
+            table_name,
+            Statement.where(col=col, arity=arity)
+        )
+
+    @functools.lru_cache(maxsize=STATEMENT_CACHE_SIZE)
+    def insert(
+        table_name: str,
+        arity: int,
+        conflict: Union[str, None] = None
+    ) -> str:
+        """ Returns a parameterized `INSERT` statement.
+
+        Parameters
+        ----------
+        table_name : `str`
+            Name of the database table.
+        arity : `int`
+            The number of values within the row.
+        conflict : `Union[str, None]`
+            The conflict-resolution policy (`ROLLBACK`, `ABORT`, `FAIL`, `IGNORE`, `REPLACE`)
+                applied when a row violates a constraint, or `None` for the table default.
+        """
+        return 'INSERT %sINTO %s VALUES (%s);' % (
+            'OR %s ' % (Conflict.validate(conflict=conflict)) if conflict else '',
+            table_name,
+            Statement.placeholders(arity=arity)
+        )
+
+    @functools.lru_cache(maxsize=STATEMENT_CACHE_SIZE)
+    def update(
+        table_name: str,
+        cols: Tuple[str, ...],
+        col: Union[str, None] = None,
+        arity: Union[int, None] = None
+    ) -> str:
+        """ Returns a parameterized `UPDATE` statement.
+
+        Parameters
+        ----------
+        table_name : `str`
+            Name of the database table.
+        cols : `Tuple[str, ...]`
+            Names of the database table columns to update.
+        col : `Union[str, None]`
+            The column to filter.
+        arity : `Union[int, None]`
+            The arity bucket of the `IN` list, or `None` to filter by equality.
+        """
+        return 'UPDATE %s SET %s%s;' % (
+            table_name,
+            ', '.join(['%s = ?' % (c) for c in cols]),
+            Statement.where(col=col, arity=arity)
+        )
+
+    @functools.lru_cache(maxsize=STATEMENT_CACHE_SIZE)
+    def delete(
+        table_name: str,
+        col: str,
+        arity: Union[int, None] = None
+    ) -> str:
+        """ Returns a parameterized `DELETE` statement.
+
+        Parameters
+        ----------
+        table_name : `str`
+            Name of the database table.
+        col : `str`
+            The column to filter.
+        arity : `Union[int, None]`
+            The arity bucket of the `IN` list, or `None` to filter by equality.
+        """
+        return 'DELETE FROM %s%s;' % (
+            table_name,
+            Statement.where(col=col, arity=arity)
+        )
+
+    @functools.lru_cache(maxsize=STATEMENT_CACHE_SIZE)
+    def orphans(
+        table_name: str,
+        col: str,
+        filtr_col: str,
+        arity: Union[int, None] = None
+    ) -> str:
+        """ Returns a parameterized statement that selects the `col` values that belong only
+        to the filtered `filtr_col` value(s).
+
+        Parameters
+        ----------
+        table_name : `str`
+            Name of the database table.
+        col : `str`
+            The dependent column to select.
+        filtr_col : `str`
+            The column to filter.
+        arity : `Union[int, None]`
+            The arity bucket of the `IN` list, or `None` to filter by equality.
+        """
+        return 'SELECT %s FROM (SELECT %s, %s, COUNT(%s) AS COUNT FROM %s GROUP BY %s)%s AND COUNT = 1;' % (
+            col,
+            col,
+            filtr_col,
+            col,
+            table_name,
+            col,
+            Statement.where(col=filtr_col, arity=arity)
+        )
+
+    @functools.lru_cache(maxsize=STATEMENT_CACHE_SIZE)
+    def scoped(
+        schema: str,
+        table_name: str,
+        cols: Tuple[str, ...],
+        query_index: str,
+        scope_schema: str,
+        scope_query_index: str,
+        col: Union[str, None] = None,
+        aggregate: Union[str, None] = None,
+        order: Union[str, None] = None
+    ) -> str:
+        """ Returns a parameterized statement that selects the records of `table_name` within
+        `schema` that belong to a scope, by joining `table_name` within `scope_schema` on
+        `query_index`. The first parameter is the `scope_query_index` value, and the second
+        parameter, if `col` is provided, is the filter value.
+
+        Parameters
+        ----------
+        schema : `str`
+            Name of the attached database that contains the scoped table.
+        table_name : `str`
+            Name of the database table within both `schema` and `scope_schema`.
+        cols : `Tuple[str, ...]`
+            Names of the scoped table columns to select, or `('*',)` to select all columns.
+        query_index : `str`
+            Name of the index that joins the scoped table to the scope table.
+        scope_schema : `str`
+            Name of the attached database that contains the scope table.
+        scope_query_index : `str`
+            Name of the scope index to filter.
+        col : `Union[str, None]`
+            The scoped table column to filter by equality.
+        aggregate : `Union[str, None]`
+            The aggregate function applied to each selected column, e.g., `MAX`.
+        order : `Union[str, None]`
+            The sorting method (`ASC`, `DESC`) of the first selected column.
+        """
+        columns = ['t.%s' % (i) for i in cols]
+        if aggregate:
+            columns = ['%s(%s)' % (str(aggregate).upper(), i) for i in columns]
+
+        return 'SELECT %s FROM "%s".%s AS t INNER JOIN "%s".%s AS s ON s.%s = t.%s WHERE s.%s = ?%s%s;' % (
+            ', '.join(columns),
+            schema,
+            table_name,
+            scope_schema,
+            table_name,
+            query_index,
+            query_index,
+            scope_query_index,
+            ' AND t.%s = ?' % (col) if col else '',
+            ' ORDER BY %s %s' % (columns[0], order) if order else ''
+        )
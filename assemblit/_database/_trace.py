@@ -0,0 +1,304 @@
+""" Database query tracing
+
+Records the shape, duration, number of rows and caller of each statement executed
+through `Connection`. Statements are traced while a re-run summary is being collected
+on the current thread, e.g., when `setup.DEBUG` is enabled, and while the slow-query
+log is enabled.
+
+The slow-query log is enabled within '/.assemblit/config.yaml' by setting the
+`ASSEMBLIT_DB_SLOW_QUERY_MS` environment variable to a threshold in milliseconds.
+Statements whose duration exceeds the threshold are appended as JSON-lines to
+'slow_queries.jsonl' within the database directory.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass, field, asdict
+from typing import Dict, List, Union
+import os
+import sys
+import json
+import time
+import threading
+from assemblit._database import _cache
+
+# Define the environment variable that sets the slow-query threshold
+ENVIRONMENT_VARIABLE: str = 'ASSEMBLIT_DB_SLOW_QUERY_MS'
+
+# Define the name of the slow-query log
+LOG_NAME: str = 'slow_queries.jsonl'
+
+
+# Define the trace record `class`
+@dataclass
+class Record():
+    """ A `class` that represents a single traced statement.
+
+    Attributes
+    ----------
+    database : `str`
+        Local file path of the database.
+    statement : `str`
+        The statement shape, the SQL-statement string with normalized white-space.
+    duration : `float`
+        The duration of the statement in milliseconds.
+    rows : `Union[int, None]`
+        The number of rows returned or modified, or `None` if unknown.
+    caller : `str`
+        The module and function outside of the database layer that issued the statement.
+    cached : `bool`
+        `True` or `False`, whether the result was answered from the read cache.
+    """
+
+    database: str
+    statement: str
+    duration: float
+    rows: Union[int, None]
+    caller: str
+    cached: bool = False
+
+    def to_dict(self) -> dict:
+        """ Returns the trace record as a `dict`. """
+        return asdict(self)
+
+
+# Define the re-run summary `class`
+@dataclass
+class Summary():
+    """ A `class` that aggregates the traced statements of a single page re-run.
+
+    Attributes
+    ----------
+    statements : `int`
+        The number of traced statements.
+    duration : `float`
+        The total duration of the traced statements in milliseconds.
+    rows : `int`
+        The total number of rows returned or modified.
+    cached : `int`
+        The number of statements answered from the read cache.
+    slow : `int`
+        The number of statements that exceeded the slow-query threshold.
+    shapes : `Dict[str, dict]`
+        The number of executions, total duration, total rows and callers of each statement shape.
+    """
+
+    statements: int = 0
+    duration: float = 0.0
+    rows: int = 0
+    cached: int = 0
+    slow: int = 0
+    shapes: Dict[str, dict] = field(default_factory=dict)
+
+    def add(
+        self,
+        record: Record,
+        slow: bool = False
+    ):
+        """ Adds a traced statement to the summary.
+
+        Parameters
+        ----------
+        record : `Record`
+            The traced statement.
+        slow : `bool`
+            `True` or `False`, whether the statement exceeded the slow-query threshold.
+        """
+        self.statements += 1
+        self.duration += record.duration
+        self.rows += record.rows or 0
+        self.cached += int(record.cached)
+        self.slow += int(slow)
+
+        shape = self.shapes.setdefault(
+            record.statement,
+            {'statement': record.statement, 'count': 0, 'duration': 0.0, 'rows': 0, 'callers': []}
+        )
+        shape['count'] += 1
+        shape['duration'] += record.duration
+        shape['rows'] += record.rows or 0
+        if record.caller not in shape['callers']:
+            shape['callers'].append(record.caller)
+
+    def top(
+        self,
+        n: int = 10
+    ) -> List[dict]:
+        """ Returns the `n` statement shapes with the greatest total duration as a `list`.
+
+        Parameters
+        ----------
+        n : `int`
+            The number of statement shapes.
+        """
+        return sorted(self.shapes.values(), key=lambda i: i['duration'], reverse=True)[:n]
+
+
+# Define the trace span `class`
+class Span():
+    """ A `class` that times a single statement as a context manager. """
+
+    __slots__ = ('tracer', 'database', 'query', 'rows', 'cached', '_start')
+
+    def __init__(
+        self,
+        tracer: Union[Tracer, None],
+        database: str,
+        query: str
+    ):
+        """ Initializes an instance of the trace span `class`.
+
+        Parameters
+        ----------
+        tracer : `Union[Tracer, None]`
+            The tracer that records the statement, or `None` when tracing is disabled.
+        database : `str`
+            Local file path of the database.
+        query : `str`
+            SQL-statement string.
+        """
+
+        # Assign class variables
+        self.tracer: Union[Tracer, None] = tracer
+        self.database: str = database
+        self.query: str = query
+        self.rows: Union[int, None] = None
+        self.cached: bool = False
+        self._start: float = 0.0
+
+    def __enter__(self) -> Span:
+        if self.tracer is not None:
+            self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *args):
+        if self.tracer is not None:
+            self.tracer.record(
+                Record(
+                    database=self.database,
+                    statement=_cache.normalize(query=self.query),
+                    duration=(time.perf_counter() - self._start) * 1000,
+                    rows=self.rows if self.rows is None or self.rows >= 0 else None,
+                    caller=caller(),
+                    cached=self.cached
+                )
+            )
+
+
+# Define the query tracer `class`
+class Tracer():
+    """ A `class` that traces statements, writes the slow-query log and collects re-run summaries. """
+
+    def __init__(
+        self,
+        threshold: Union[float, None] = None
+    ):
+        """ Initializes an instance of the query tracer `class`.
+
+        Parameters
+        ----------
+        threshold : `Union[float, None]`
+            The slow-query threshold in milliseconds, or `None` to disable the slow-query log.
+        """
+
+        # Assign class variables
+        self.threshold: Union[float, None] = threshold
+        self._local: threading.local = threading.local()
+        self._lock: threading.Lock = threading.Lock()
+
+    def begin(self) -> Summary:
+        """ Begins collecting a new re-run summary on the current thread and returns it. """
+        self._local.summary = Summary()
+        return self._local.summary
+
+    def end(self) -> Union[Summary, None]:
+        """ Ends collecting the re-run summary on the current thread and returns it, or `None`. """
+        summary = self.summary()
+        self._local.summary = None
+        return summary
+
+    def summary(self) -> Union[Summary, None]:
+        """ Returns the re-run summary collected on the current thread, or `None`. """
+        return getattr(self._local, 'summary', None)
+
+    def span(
+        self,
+        database: str,
+        query: str
+    ) -> Span:
+        """ Returns a `Span` that times a statement, which records nothing when tracing is disabled.
+
+        Parameters
+        ----------
+        database : `str`
+            Local file path of the database.
+        query : `str`
+            SQL-statement string.
+        """
+        if self.threshold is None and self.summary() is None:
+            return Span(tracer=None, database=database, query=query)
+        return Span(tracer=self, database=database, query=query)
+
+    def record(
+        self,
+        record: Record
+    ):
+        """ Adds a traced statement to the re-run summary and appends it to the slow-query log
+        when its duration exceeds the threshold.
+
+        Parameters
+        ----------
+        record : `Record`
+            The traced statement.
+        """
+        slow = self.threshold is not None and not record.cached and record.duration >= self.threshold
+
+        summary = self.summary()
+        if summary is not None:
+            summary.add(record=record, slow=slow)
+
+        if slow:
+            with self._lock:
+                with open(os.path.join(os.path.dirname(record.database), LOG_NAME), 'a') as file:
+                    file.write(json.dumps({'time': time.time(), **record.to_dict()}) + '\n')
+
+
+def caller() -> str:
+    """ Returns the module and function of the innermost frame outside of the database layer as a `str`. """
+    frame = sys._getframe(1)
+    while frame is not None:
+        module = frame.f_globals.get('__name__', '')
+        if not (module.startswith('assemblit._database') or module == 'contextlib'):
+            return '%s.%s' % (module, frame.f_code.co_name)
+        frame = frame.f_back
+    return 'unknown'
+
+
+# Define the process-wide tracer
+_TRACER: Union[Tracer, None] = None
+_TRACER_LOCK: threading.Lock = threading.Lock()
+
+
+def get_tracer() -> Tracer:
+    """ Returns the process-wide `Tracer`, creating it if it does not exist. The slow-query threshold
+    is read from the `ASSEMBLIT_DB_SLOW_QUERY_MS` environment variable when the tracer is first created.
+    """
+    global _TRACER
+    with _TRACER_LOCK:
+        if _TRACER is None:
+            try:
+                threshold = float(os.environ.get(ENVIRONMENT_VARIABLE, None) or 0)
+            except ValueError:
+                raise ValueError(
+                    'Invalid slow-query threshold {%s}. The threshold must be a number of milliseconds.' % (
+                        os.environ.get(ENVIRONMENT_VARIABLE)
+                    )
+                )
+            _TRACER = Tracer(threshold=threshold if threshold > 0 else None)
+        return _TRACER
+
+
+def dispose():
+    """ Discards the process-wide tracer. """
+    global _TRACER
+    with _TRACER_LOCK:
+        _TRACER = None
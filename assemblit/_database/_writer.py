@@ -0,0 +1,366 @@
+""" Single-writer queue
+
+An optional write-serialization service for sqlite3-databases. Each database file is
+written by a single background thread that owns a dedicated sqlite3-connection. Page
+scripts submit write requests to a bounded queue and await their completion futures.
+Requests that are queued while a transaction is being committed are coalesced into the
+next transaction, so a burst of small writes from many `streamlit` sessions is committed
+with a few grouped transactions instead of contending for the write-lock. Each request
+is applied within its own savepoint, so a failed request does not roll back the other
+requests of its group. Reads proceed concurrently on pooled connections under write-ahead
+logging.
+
+The writer is enabled within '/.assemblit/config.yaml' by setting the
+`ASSEMBLIT_DB_WRITER` environment variable to `True`.
+"""
+
+from __future__ import annotations
+from concurrent.futures import Future, TimeoutError
+from dataclasses import dataclass, asdict
+from typing import Callable, Dict, List, Sequence, Tuple, Union
+import os
+import queue
+import sqlite3
+import threading
+from assemblit._database import _profiles
+
+# Define the environment variable that enables the writer
+ENVIRONMENT_VARIABLE: str = 'ASSEMBLIT_DB_WRITER'
+
+# Define writer defaults
+DEFAULT_MAX_QUEUE: int = 1024
+DEFAULT_MAX_BATCH: int = 256
+DEFAULT_TIMEOUT: float = 30.0
+
+
+# Define the write request `class`
+class Request():
+    """ A `class` that represents a group of statements committed atomically by the writer. """
+
+    __slots__ = ('statements', 'callback', 'future')
+
+    def __init__(
+        self,
+        statements: List[Tuple[str, List[tuple]]],
+        callback: Union[Callable[[], None], None] = None
+    ):
+        """ Initializes an instance of the write request `class`.
+
+        Parameters
+        ----------
+        statements : `List[Tuple[str, List[tuple]]]`
+            SQL-statement strings containing `?` placeholders, each with the sequences of values
+                bound to its placeholders. Each statement is executed once for each sequence of values.
+        callback : `Union[Callable[[], None], None]`
+            Function called once the request is committed, before its future is resolved.
+        """
+
+        # Assign class variables
+        self.statements: List[Tuple[str, List[tuple]]] = statements
+        self.callback: Union[Callable[[], None], None] = callback
+        self.future: Future = Future()
+
+
+# Define the writer statistics `class`
+@dataclass
+class Statistics():
+    """ A `class` that contains the statistics of a writer.
+
+    Attributes
+    ----------
+    queued : `int`
+        The number of requests waiting to be committed.
+    requests : `int`
+        The total number of submitted requests.
+    commits : `int`
+        The total number of committed transactions.
+    failures : `int`
+        The total number of requests that raised an exception.
+    max_batch : `int`
+        The greatest number of requests coalesced into a single transaction.
+    """
+
+    queued: int = 0
+    requests: int = 0
+    commits: int = 0
+    failures: int = 0
+    max_batch: int = 0
+
+    def to_dict(self) -> dict:
+        """ Returns the writer statistics as a `dict`. """
+        return asdict(self)
+
+
+# Define the single-writer `class`
+class Writer():
+    """ A `class` that serializes the writes to a single database on a background daemon-thread. """
+
+    def __init__(
+        self,
+        database: Union[str, os.PathLike],
+        profile: Union[_profiles.Profile, None] = None,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        timeout: float = DEFAULT_TIMEOUT
+    ):
+        """ Initializes an instance of the single-writer `class`.
+
+        Parameters
+        ----------
+        database : `Union[str, os.PathLike]`
+            Local file path of the database.
+        profile : `Union[_profiles.Profile, None]`
+            The database performance profile applied to the writer connection.
+        max_queue : `int`
+            The maximum number of queued requests. Submitting to a full queue waits for
+                up to `timeout` seconds before a `WriterTimeout` is raised.
+        max_batch : `int`
+            The maximum number of requests coalesced into a single transaction.
+        timeout : `float`
+            The number of seconds to wait for a queue slot, and for the write-lock.
+        """
+
+        # Validate
+        if int(max_batch) < 1:
+            raise ValueError('The maximum batch size must be greater than 0.')
+
+        # Assign class variables
+        self.database: str = os.path.abspath(database)
+        self.profile: Union[_profiles.Profile, None] = profile
+        self.max_batch: int = int(max_batch)
+        self.timeout: float = float(timeout)
+        self.queue: queue.Queue = queue.Queue(maxsize=int(max_queue))
+        self.stats: Statistics = Statistics()
+
+        self._lock: threading.Lock = threading.Lock()
+        self._thread: threading.Thread = threading.Thread(
+            target=self._run,
+            name='assemblit-writer',
+            daemon=True
+        )
+        self._thread.start()
+
+    def submit(
+        self,
+        statements: List[Tuple[str, Sequence[Sequence]]],
+        callback: Union[Callable[[], None], None] = None
+    ) -> Future:
+        """ Queues a group of statements that are committed atomically and returns a `Future` that
+        resolves to the number of modified rows.
+
+        Parameters
+        ----------
+        statements : `List[Tuple[str, Sequence[Sequence]]]`
+            SQL-statement strings containing `?` placeholders, each with the sequences of values
+                bound to its placeholders.
+        callback : `Union[Callable[[], None], None]`
+            Function called once the request is committed, before its future is resolved.
+        """
+        request = Request(
+            statements=[(str(query), [tuple(i) for i in params]) for query, params in statements],
+            callback=callback
+        )
+
+        try:
+            self.queue.put(request, timeout=self.timeout)
+        except queue.Full:
+            raise WriterTimeout(
+                'Timed-out after %s seconds waiting to queue a write to {%s}.' % (
+                    self.timeout,
+                    self.database
+                )
+            )
+
+        with self._lock:
+            self.stats.requests += 1
+
+        return request.future
+
+    def result(
+        self,
+        future: Future
+    ) -> int:
+        """ Waits for up to `timeout` seconds for a submitted request to be committed and returns the number
+        of modified rows as an `int`. Raises the exception of a failed request, or `WriterTimeout`.
+
+        Parameters
+        ----------
+        future : `Future`
+            The future returned by `submit`.
+        """
+        try:
+            return future.result(timeout=self.timeout)
+        except TimeoutError:
+            raise WriterTimeout(
+                'Timed-out after %s seconds waiting for a write to {%s} to be committed.' % (
+                    self.timeout,
+                    self.database
+                )
+            )
+
+    def statistics(self) -> dict:
+        """ Returns the writer statistics as a `dict`. """
+        with self._lock:
+            self.stats.queued = self.queue.qsize()
+            return self.stats.to_dict()
+
+    def stop(self):
+        """ Commits the queued requests and stops the writer thread. """
+        self.queue.put(None)
+        self._thread.join()
+
+    def _run(self):
+        """ Commits queued requests in groups until the writer is stopped. Requests fail, and the writer
+        keeps running, when the writer connection cannot be opened or a group cannot be committed.
+        """
+        try:
+            connection, error = self._connect(), None
+        except Exception as e:
+            connection, error = None, e
+
+        try:
+            while True:
+                batch: List[Request] = [self.queue.get()]
+                if batch[0] is None:
+                    return
+
+                # Coalesce the requests queued while the previous group was committed
+                stop = False
+                while len(batch) < self.max_batch:
+                    try:
+                        request = self.queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if request is None:
+                        stop = True
+                        break
+                    batch.append(request)
+
+                try:
+                    if connection is None:
+                        raise error
+                    self._commit(connection=connection, batch=batch)
+                except Exception as e:
+                    for request in batch:
+                        if not request.future.done():
+                            request.future.set_exception(e)
+
+                if stop:
+                    return
+        finally:
+            if connection is not None:
+                connection.close()
+
+    def _commit(
+        self,
+        connection: sqlite3.Connection,
+        batch: List[Request]
+    ):
+        """ Applies each request within its own savepoint and commits the group as a single transaction. """
+        results: List[Tuple[Request, Union[int, None], Union[BaseException, None]]] = []
+
+        try:
+            connection.execute('BEGIN IMMEDIATE;')
+            for request in batch:
+                connection.execute('SAVEPOINT request;')
+                try:
+                    rows = 0
+                    for query, params in request.statements:
+                        rows += max(connection.executemany(query, params).rowcount, 0)
+                except Exception as e:
+                    connection.execute('ROLLBACK TO request;')
+                    connection.execute('RELEASE request;')
+                    results.append((request, None, e))
+                else:
+                    connection.execute('RELEASE request;')
+                    results.append((request, rows, None))
+            connection.execute('COMMIT;')
+
+        except Exception as e:
+            if connection.in_transaction:
+                connection.execute('ROLLBACK;')
+            results = [(request, None, e) for request in batch]
+
+        with self._lock:
+            self.stats.commits += int(any(error is None for _, _, error in results))
+            self.stats.failures += sum(error is not None for _, _, error in results)
+            self.stats.max_batch = max(self.stats.max_batch, len(batch))
+
+        for request, rows, error in results:
+            if error is None and request.callback is not None:
+                try:
+                    request.callback()
+                except Exception as e:
+                    error = e
+
+            if error is None:
+                request.future.set_result(rows)
+            else:
+                request.future.set_exception(error)
+
+    def _connect(self) -> sqlite3.Connection:
+        """ Opens the writer sqlite3-connection. """
+        connection = sqlite3.connect(
+            self.database,
+            timeout=self.timeout,
+            isolation_level=None,
+            check_same_thread=False
+        )
+        if self.profile is not None:
+            self.profile.apply(connection=connection)
+        return connection
+
+
+# Define the process-wide writer registry
+_WRITERS: Dict[str, Writer] = {}
+_WRITERS_LOCK: threading.Lock = threading.Lock()
+
+
+def enabled() -> bool:
+    """ Returns `True` when the `ASSEMBLIT_DB_WRITER` environment variable enables the writer. """
+    return str(os.environ.get(ENVIRONMENT_VARIABLE, None) or 'False').strip().lower() in ['true', '1', 'yes']
+
+
+def get_writer(
+    database: Union[str, os.PathLike],
+    **kwargs
+) -> Union[Writer, None]:
+    """ Returns the process-wide `Writer` of `database`, creating it if it does not exist, or
+    `None` when the writer is disabled.
+
+    Parameters
+    ----------
+    database : `Union[str, os.PathLike]`
+        Local file path of the database.
+    **kwargs
+        Keyword arguments passed to `Writer` when the writer is created.
+    """
+    if not enabled():
+        return None
+
+    key = os.path.abspath(database)
+    with _WRITERS_LOCK:
+        if key not in _WRITERS:
+            _WRITERS[key] = Writer(database=database, **kwargs)
+        return _WRITERS[key]
+
+
+def statistics() -> Dict[str, dict]:
+    """ Returns the statistics of every writer as a `dict`, keyed by database file path. """
+    with _WRITERS_LOCK:
+        writers = dict(_WRITERS)
+    return {key: writer.statistics() for key, writer in writers.items()}
+
+
+def dispose():
+    """ Commits the queued requests, stops every writer and removes them from the registry. """
+    with _WRITERS_LOCK:
+        writers = list(_WRITERS.values())
+        _WRITERS.clear()
+    for writer in writers:
+        writer.stop()
+
+
+# Define exception classes
+class WriterTimeout(sqlite3.OperationalError):
+    pass
@@ -52,7 +52,8 @@ class Schemas():
             'state': pandera.Column(
                 str,
                 nullable=True,
-                unique=False
+                unique=False,
+                metadata={'index': True}
             ),
             'start_time': pandera.Column(
                 datetime.datetime,
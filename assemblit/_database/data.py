@@ -1,11 +1,12 @@
 """ Database table """
 
-from typing import ClassVar
+from typing import ClassVar, List
 from dataclasses import dataclass
 import pandera
 import datetime
 from assemblit import setup
-from assemblit._database import _generic
+from assemblit._database import _generic, _datasets
+from assemblit._database._structures import DatasetMetadata
 
 
 # Define the `data` database table schemas
@@ -17,6 +18,8 @@ class Schemas():
     ----------
     data : `assemblit.database._generic.Schema`
         The `data.data` database table schema.
+    catalog : `assemblit.database._generic.Schema`
+        The `data.dataset_catalog` database table schema.
     """
 
     # The `data` table Schema.
@@ -52,7 +55,8 @@ class Schemas():
             'file_name': pandera.Column(
                 str,
                 nullable=False,
-                unique=False
+                unique=False,
+                metadata={'index': True}
             ),
             'dbms': pandera.Column(
                 str,
@@ -107,6 +111,11 @@ class Schemas():
         }
     )
 
+    # The `dataset_catalog` table Schema.
+    catalog: ClassVar[_generic.Schema] = _datasets.schema(
+        query_index=setup.DATA_DB_QUERY_INDEX
+    )
+
 
 # Define the `data` database connection
 class Connection(_generic.Connection):
@@ -121,3 +130,89 @@ class Connection(_generic.Connection):
             db_name=setup.DATA_DB_NAME,
             dir_name=setup.DB_DIR
         )
+
+    def create_dataset_catalog(
+        self
+    ):
+        """ Creates the dataset catalog table if it does not exist and records any
+        previously uploaded datasets that are missing from the catalog. Otherwise, adds
+        the catalog columns that are missing from a catalog created by an earlier version.
+        """
+        if self.table_exists(table_name=Schemas.catalog.name):
+            _datasets.upgrade(
+                Database=self,
+                query_index=setup.DATA_DB_QUERY_INDEX
+            )
+        else:
+            self.create_table(
+                table_name=Schemas.catalog.name,
+                schema=Schemas.catalog
+            )
+            if self.table_exists(table_name=Schemas.data.name):
+                _datasets.backfill(
+                    Database=self,
+                    query_index=setup.DATA_DB_QUERY_INDEX,
+                    table_name=Schemas.data.name
+                )
+
+    def drop_datasets(
+        self,
+        dataset_ids: List[str]
+    ):
+        """ Drops the database tables of the selected datasets and removes them from the dataset catalog.
+
+        Parameters
+        ----------
+        dataset_ids : `List[str]`
+            Dataset IDs of the selected datasets.
+        """
+        _datasets.drop(
+            Database=self,
+            query_index=setup.DATA_DB_QUERY_INDEX,
+            dataset_ids=dataset_ids
+        )
+
+    def select_dataset_metadata(
+        self,
+        dataset_id: str,
+        cache: bool = True
+    ) -> DatasetMetadata:
+        """ Returns the metadata record of a dataset within the `data` table as a `DatasetMetadata`.
+
+        Parameters
+        ----------
+        dataset_id : `str`
+            Dataset ID of the dataset.
+        cache : `bool`
+            `True` or `False`, whether the record may be answered from the read cache, when it is
+                enabled, until the `data` table is written to.
+        """
+        return _datasets.metadata(
+            Database=self,
+            table_name=Schemas.data.name,
+            query_index=setup.DATA_DB_QUERY_INDEX,
+            dataset_id=dataset_id,
+            cache=cache
+        )
+
+    def select_all_tables_with_column_name(
+        self,
+        col: str
+    ) -> list:
+        """ Returns all table names from the `data` database that contain some column
+        name as a `list`. Dataset tables recorded within the dataset catalog are skipped,
+        so their columns are never read.
+
+        Parameters
+        ----------
+        col : `str`
+            Name of the database table column.
+        """
+        return self.catalog.tables_with_column(
+            connection=self.conn,
+            col=col,
+            exclude=_datasets.locations(
+                Database=self,
+                query_index=setup.DATA_DB_QUERY_INDEX
+            ).values()
+        )
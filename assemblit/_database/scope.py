@@ -0,0 +1,92 @@
+""" Cross-database query layer """
+
+import os
+from typing import List
+from assemblit import setup
+from assemblit._database import _cascade, _generic, users, sessions, data, analysis
+from assemblit._database._structures import Filter
+
+
+# Define the cross-database connection
+class Connection(_generic.Connection):
+    """ The cross-database sqlite3-database Connection. The `users`, `data` and `analysis`
+    databases are attached to the `sessions` database, so that scoped queries join tables
+    across databases in a single query.
+    """
+
+    def __init__(
+        self
+    ):
+        """ Initializes an instance of the cross-database sqlite3-database Connection. """
+
+        super().__init__(
+            db_name=setup.SESSIONS_DB_NAME,
+            dir_name=setup.DB_DIR,
+            attach=[
+                setup.USERS_DB_NAME,
+                setup.DATA_DB_NAME,
+                setup.ANALYSIS_DB_NAME
+            ]
+        )
+
+
+def cascade() -> _cascade.Planner:
+    """ Returns the cascade delete planner of the `users`, `sessions`, `data` and `analysis`
+    databases as a `_cascade.Planner`. Users own sessions, and sessions own datasets and
+    analysis runs. Dataset tables are dropped, and the workspace folders of analysis runs
+    are removed by the background cleaner once the deletion of their runs is committed.
+    """
+
+    # Initialize connections to each database
+    Users = users.Connection()
+    Sessions = sessions.Connection()
+    Data = data.Connection()
+    Analysis = analysis.Connection()
+
+    def drop_datasets(dataset_ids: List[str]):
+        Data.drop_datasets(dataset_ids=dataset_ids)
+
+    def remove_workspaces(run_ids: List[str]):
+        try:
+            names = Analysis.select_table_column_value(
+                table_name=setup.ANALYSIS_DB_NAME,
+                col='name',
+                filtr=Filter(
+                    col=setup.ANALYSIS_DB_QUERY_INDEX,
+                    val=run_ids
+                ),
+                return_dtype='str',
+                multi=True
+            )
+        except _generic.NullReturnValue:
+            names = []
+
+        # Remove the workspace folders only once the runs are deleted, as the removal cannot be rolled back
+        paths = [os.path.join(setup.ROOT_DIR, 'workspace', setup.ANALYSIS_DB_NAME, name) for name in names]
+        Analysis.after_commit(lambda: _cascade.get_cleaner().remove(paths=paths))
+
+    return (
+        _cascade.Planner()
+        .purge(query_index=setup.USERS_DB_QUERY_INDEX, Database=Users)
+        .purge(query_index=setup.SESSIONS_DB_QUERY_INDEX, Database=Users)
+        .purge(query_index=setup.SESSIONS_DB_QUERY_INDEX, Database=Sessions)
+        .purge(query_index=setup.DATA_DB_QUERY_INDEX, Database=Sessions)
+        .purge(query_index=setup.DATA_DB_QUERY_INDEX, Database=Data, callback=drop_datasets)
+        .purge(query_index=setup.ANALYSIS_DB_QUERY_INDEX, Database=Sessions)
+        .purge(query_index=setup.ANALYSIS_DB_QUERY_INDEX, Database=Analysis, callback=remove_workspaces)
+        .cascade(
+            query_index=setup.USERS_DB_QUERY_INDEX,
+            dependent_query_index=setup.SESSIONS_DB_QUERY_INDEX,
+            Database=Users
+        )
+        .cascade(
+            query_index=setup.SESSIONS_DB_QUERY_INDEX,
+            dependent_query_index=setup.DATA_DB_QUERY_INDEX,
+            Database=Sessions
+        )
+        .cascade(
+            query_index=setup.SESSIONS_DB_QUERY_INDEX,
+            dependent_query_index=setup.ANALYSIS_DB_QUERY_INDEX,
+            Database=Sessions
+        )
+    )
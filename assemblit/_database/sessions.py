@@ -34,7 +34,7 @@ class Schemas():
                 str,
                 nullable=False,
                 unique=False,
-                metadata={'primary_key': True}
+                metadata={'primary_key': True, 'index': True}
             )
         }
     )
@@ -53,7 +53,7 @@ class Schemas():
                 str,
                 nullable=False,
                 unique=False,
-                metadata={'primary_key': True}
+                metadata={'primary_key': True, 'index': True}
             )
         }
     )
@@ -62,7 +62,7 @@ class Schemas():
                 str,
                 nullable=False,
                 unique=False,
-                metadata={'primary_key': True}
+                metadata={'primary_key': True, 'index': True}
             )
         }
     )
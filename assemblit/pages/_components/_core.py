@@ -6,6 +6,7 @@ import copy
 import streamlit as st
 from assemblit import setup
 from assemblit._auth import vault
+from assemblit._database import _trace
 from assemblit.blocks.structures import Setting
 
 
@@ -14,6 +15,11 @@ def initialize_session_state_defaults():
     """
     Initializes the session state with the default setup parameter(s).
     """
+
+    # Begin collecting the database statements of the re-run
+    if setup.DEBUG:
+        _trace.get_tracer().begin()
+
     if setup.NAME not in st.session_state:
         st.session_state[setup.NAME] = {}
     for _, (key, value) in enumerate(
@@ -264,3 +270,45 @@ def display_page_status(
 
     # Reset session state
     st.session_state[setup.NAME][db_name]['successes'] = []
+
+    # Database statements
+    if setup.DEBUG:
+        display_query_trace()
+
+
+def display_query_trace():
+    """
+    Displays the totals of the database statements executed during the re-run, and the
+    statement shapes with the greatest total duration.
+    """
+
+    # Layout columns
+    _, col2 = st.columns(setup.CONTENT_COLUMNS)
+
+    summary = _trace.get_tracer().summary()
+    if summary is None:
+        return
+
+    with col2.expander('Database statements', expanded=False):
+        st.caption(
+            '%s statement(s) in %.1f ms, %s row(s), %s answered from the read cache, %s slow.' % (
+                summary.statements,
+                summary.duration,
+                summary.rows,
+                summary.cached,
+                summary.slow
+            )
+        )
+        st.dataframe(
+            data=[
+                {
+                    'statement': shape['statement'],
+                    'count': shape['count'],
+                    'duration (ms)': round(shape['duration'], 2),
+                    'rows': shape['rows'],
+                    'callers': ', '.join(shape['callers'])
+                } for shape in summary.top()
+            ],
+            hide_index=True,
+            use_container_width=True
+        )
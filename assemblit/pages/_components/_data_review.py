@@ -8,7 +8,7 @@ import streamlit as st
 from assemblit import setup
 from assemblit.toolkit import aggregator, plotter
 from assemblit.pages._components import _core, _selector
-from assemblit._database import _generic, sessions, data
+from assemblit._database import _generic, _datasets, sessions, data, scope
 from assemblit._database._structures import Filter, Value
 
 # --TODO Remove scope_db_name and scope_query_index from all function(s).
@@ -643,6 +643,19 @@ def display_data_review_summary(
             (selected_metrics) and (selected_aggrules)
         ):
 
+            # Reference the stored dataset, which is aggregated where it is stored rather than in-memory,
+            #   by the analytical engine named by the `ASSEMBLIT_ANALYTICS_ENGINE` environment variable
+            reference = _datasets.Reference(
+                Database=data.Connection(),
+                query_index=query_index,
+                dataset_id=hashlib.md5(
+                    ''.join(
+                        [str(st.session_state[setup.NAME][scope_db_name][scope_query_index])]
+                        + [str(st.session_state[setup.NAME][db_name]['name'])]
+                    ).lower().encode('utf-8')
+                ).hexdigest()
+            )
+
             # Plot timeseries
             if selected_datetime:
                 with st.container(border=True):
@@ -664,7 +677,7 @@ def display_data_review_summary(
                     # Display plotly plot
                     st.plotly_chart(
                         figure_or_data=plotter.timeseries_line_plot(
-                            df=df,
+                            df=reference,
                             datetime=selected_datetime_object,
                             dimension=selected_dimensions,
                             metrics=selected_metrics,
@@ -689,7 +702,7 @@ def display_data_review_summary(
                 # Display plotly table
                 st.plotly_chart(
                     figure_or_data=plotter.descriptives_table(
-                        df=df,
+                        df=reference,
                         dimension=selected_dimensions,
                         metrics=selected_metrics,
                         aggrules=selected_aggrules
@@ -827,112 +840,68 @@ def retrieve_data_from_database(
 
         if dataset_id in ids:
 
-            # Import the datafile
-            df = pd.read_sql(
-                sql="""
-                    SELECT * FROM '%s';
-                """ % dataset_id,
-                con=Data.connection()
+            # Select the dataset metadata with a single query
+            metadata = _datasets.metadata(
+                Database=Data,
+                table_name=table_name,
+                query_index=query_index,
+                dataset_id=dataset_id
             )
 
             # Set selector options
-            datetime = Data.select_generic_query(
-                query="""
-                    SELECT datetime FROM %s
-                        WHERE %s = '%s';
-                """ % (
-                    table_name,
-                    query_index,
-                    dataset_id
-                ),
-                return_dtype='list'
-            )
-            dimensions = Data.select_generic_query(
-                query="""
-                    SELECT dimensions FROM %s
-                        WHERE %s = '%s';
-                """ % (
-                    table_name,
-                    query_index,
-                    dataset_id
-                ),
-                return_dtype='list'
-            )
-            metrics = Data.select_generic_query(
-                query="""
-                    SELECT metrics FROM %s
-                        WHERE %s = '%s';
-                """ % (
-                    table_name,
-                    query_index,
-                    dataset_id
-                ),
-                return_dtype='list'
-            )
+            datetime = metadata.datetime
+            dimensions = metadata.dimensions
+            metrics = metadata.metrics
 
             # Set selector defaults
-            try:
-                selected_datetime = Data.select_generic_query(
-                    query="""
-                        SELECT selected_datetime FROM %s
-                            WHERE %s = '%s';
-                    """ % (
-                        table_name,
-                        query_index,
-                        dataset_id
-                    ),
-                    return_dtype='list'
+            selected_datetime = metadata.selected_datetime
+            selected_dimensions = metadata.selected_dimensions
+            selected_metrics = metadata.selected_metrics
+            selected_aggrules = metadata.selected_aggrules
+
+            # Import only the selected columns of the datafile, or its first row when none are selected
+            columns = list(dict.fromkeys(selected_datetime + selected_dimensions + selected_metrics))
+            if columns:
+                df = _datasets.read(
+                    Database=Data,
+                    query_index=query_index,
+                    dataset_id=dataset_id,
+                    columns=columns
+                )
+            else:
+                df = next(
+                    iter(_datasets.read(
+                        Database=Data,
+                        query_index=query_index,
+                        dataset_id=dataset_id,
+                        chunksize=1
+                    )),
+                    pd.DataFrame()
                 )
-            except _generic.NullReturnValue:
-                selected_datetime = []
-            selected_dimensions = Data.select_generic_query(
-                query="""
-                    SELECT selected_dimensions FROM %s
-                        WHERE %s = '%s';
-                """ % (
-                    table_name,
-                    query_index,
-                    dataset_id
-                ),
-                return_dtype='list'
-            )
-            selected_metrics = Data.select_generic_query(
-                query="""
-                    SELECT selected_metrics FROM %s
-                        WHERE %s = '%s';
-                """ % (
-                    table_name,
-                    query_index,
-                    dataset_id
-                ),
-                return_dtype='list'
-            )
-            selected_aggrules = Data.select_generic_query(
-                query="""
-                    SELECT selected_aggrules FROM %s
-                        WHERE %s = '%s';
-                """ % (
-                    table_name,
-                    query_index,
-                    dataset_id
-                ),
-                return_dtype='list'
-            )
 
-            # Check that the datafile hash matches
-            if not hashlib.sha256(
-                df.to_string().encode('utf8')
-            ).hexdigest() == Data.select_generic_query(
-                query="""
-                    SELECT sha256 FROM %s
-                        WHERE %s = '%s';
-                """ % (
-                    table_name,
-                    query_index,
-                    dataset_id
-                ),
-                return_dtype='str'
-            ):
+            # Check that the selected columns match the per-column digest recorded when the datafile was
+            #   stored, once per upload and selection. Datafiles stored by earlier versions have no digest,
+            #   and their hash requires the entire datafile.
+            verified = st.session_state[setup.NAME][db_name].setdefault('verified', {})
+            if verified.get(dataset_id, (None, None))[0] != (metadata.sha256, tuple(columns)):
+                matches = True
+                if columns:
+                    matches = _datasets.verify(
+                        Database=Data,
+                        query_index=query_index,
+                        dataset_id=dataset_id,
+                        df=df
+                    )
+                if matches is None:
+                    matches = hashlib.sha256(
+                        _datasets.read(
+                            Database=Data,
+                            query_index=query_index,
+                            dataset_id=dataset_id
+                        ).to_string().encode('utf8')
+                    ).hexdigest() == metadata.sha256
+                verified[dataset_id] = ((metadata.sha256, tuple(columns)), matches)
+            if not verified[dataset_id][1]:
                 st.warning("""
                         Modified content. The hash of the most recently uploaded datafile ```%s```
                             does not match the hash of the original data. There may be un-expected
@@ -1062,45 +1031,14 @@ def save_dataset(
     Data = data.Connection()
 
     # Update the database with the latest selected values
-    Data.update(
-        table_name=table_name,
-        value=Value(
-            col='selected_datetime',
-            val=json.dumps(selected_datetime)
-        ),
-        filtr=Filter(
-            col=query_index,
-            val=dataset_id
-        )
-    )
-    Data.update(
+    Data.update_columns(
         table_name=table_name,
-        value=Value(
-            col='selected_dimensions',
-            val=json.dumps(selected_dimensions)
-        ),
-        filtr=Filter(
-            col=query_index,
-            val=dataset_id
-        )
-    )
-    Data.update(
-        table_name=table_name,
-        value=Value(
-            col='selected_metrics',
-            val=json.dumps(selected_metrics)
-        ),
-        filtr=Filter(
-            col=query_index,
-            val=dataset_id
-        )
-    )
-    Data.update(
-        table_name=table_name,
-        value=Value(
-            col='selected_aggrules',
-            val=json.dumps(selected_aggrules)
-        ),
+        values=[
+            Value(col='selected_datetime', val=json.dumps(selected_datetime)),
+            Value(col='selected_dimensions', val=json.dumps(selected_dimensions)),
+            Value(col='selected_metrics', val=json.dumps(selected_metrics)),
+            Value(col='selected_aggrules', val=json.dumps(selected_aggrules))
+        ],
         filtr=Filter(
             col=query_index,
             val=dataset_id
@@ -1119,43 +1057,10 @@ def delete_dataset(
         Dataset ID of the selected dataset
     """
 
-    # Initialize connection to the sessions database
-    Sessions = sessions.Connection()
-
-    # Initialize connection to the data-ingestion database
-    Data = data.Connection()
-
-    # Build database table objects to remove datasets from the sessions database
-    sessions_db_query_index_objects_to_delete = Sessions.build_database_table_objects_to_delete(
-        table_names=Sessions.select_all_tables_with_column_name(
-            col=setup.DATA_DB_QUERY_INDEX
-        ),
+    # Delete the dataset
+    scope.cascade().delete(
         query_index=setup.DATA_DB_QUERY_INDEX,
-        query_index_values=[dataset_id]
-    )
-
-    # Build database table objects to remove datasets from the data-ingestion database
-    data_db_query_index_objects_to_delete = Data.build_database_table_objects_to_delete(
-        table_names=Data.select_all_tables_with_column_name(
-            col=setup.DATA_DB_QUERY_INDEX
-        ),
-        query_index=setup.DATA_DB_QUERY_INDEX,
-        query_index_values=[dataset_id]
-    )
-
-    # Drop all data-ingestion database tables
-    Data.drop_table(
-        table_name=dataset_id
-    )
-
-    # Delete all data-ingestion database table values
-    Data.delete(
-        tables=data_db_query_index_objects_to_delete
-    )
-
-    # Delete all sessions database table values
-    Sessions.delete(
-        tables=sessions_db_query_index_objects_to_delete
+        values=[dataset_id]
     )
 
     # Reset session state
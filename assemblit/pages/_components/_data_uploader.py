@@ -4,14 +4,13 @@ import os
 import hashlib
 import json
 import datetime as dt
+from typing import Iterable
 import pandas as pd
-import pandera as pa
-from pandera.engines import pandas_engine
 import streamlit as st
 from assemblit import setup
-from assemblit.toolkit import _dataframe
-from assemblit._database import _generic, sessions, data
-from assemblit._database._structures import Filter, Validate, Row
+from assemblit.toolkit import _exceptions, _ingestion
+from assemblit._database import _generic, _datasets, sessions, data, scope
+from assemblit._database._structures import Validate, Row
 
 # --TODO Remove scope_db_name and scope_query_index from all function(s).
 #       Scope for data is not dynamic, it can only be the sessions-db.
@@ -199,115 +198,26 @@ def display_data_preview(
 
             # Read the datafile
             if dbms in ['.CSV', '.PARQUET']:
-                if dbms == '.CSV':
-
-                    # Read '.csv'
-                    df = pd.read_csv(
-                        st.session_state['FormSubmitter:%s' % (
-                            generate_form_key(
-                                db_name=db_name,
-                                table_name=table_name
-                            )
-                        )],
-                        sep=','
-                    )
-
-                if dbms == '.PARQUET':
 
-                    # Read '.parquet'
-                    df = pd.read_parquet(
-                        st.session_state['FormSubmitter:%s' % (
-                            generate_form_key(
-                                db_name=db_name,
-                                table_name=table_name
-                            )
-                        )],
-                        engine='pyarrow'
-                    )
-
-                # Normalize column names
-                df.columns = [c.lower() for c in df.columns]
-
-                # Identify and format the datetime dimension
-                datetime = _dataframe.datetime_dimension(df=df)
-
-                # Identify categorical dimensions
-                #   If the datatype is a(n),
-                #       <b> boolean
-                #       <O> object
-                #       <S> (byte-)string
-                #       <U> unicode
-                #
-                #   > Then the column is a dimension
-                dimensions = [
-                    dim for dim in set(df.columns) if (
-                        (df[dim].dtype.kind in 'bOSU')
-                        and (dim not in [date_object[0] for date_object in datetime])
-                    )
-                ]
-
-                # Identify metrics
-                #   If the datatype is a(n),
-                #       <i> signed integer
-                #       <u> unsighted integer
-                #       <f> floating-point
-                #       <c> complex floating-point
-                #
-                #   > Then the column is a metric
-                metrics = [
-                    dim for dim in set(df.columns) if (
-                        (df[dim].dtype.kind in 'iufc')
-                    )
-                ]
-
-                # Compile schema validation rules
-                rules = {}
-
-                # Add datetime rules
-                for date_object in datetime:
-                    rules[date_object[0]] = pa.Column(
-                        pandas_engine.DateTime(
-                            to_datetime_kwargs={
-                                "format": date_object[1]
-                            }
-                        )
-                    )
-
-                # Add dimension rules
-                for col in dimensions:
-                    rules[col] = pa.Column(
-                        str,
-                        nullable=False
-                    )
-
-                # Add metric rules
-                for col in metrics:
-                    rules[col] = pa.Column(
-                        float,
-                        nullable=True
+                # Retrieve the datafile
+                file = st.session_state['FormSubmitter:%s' % (
+                    generate_form_key(
+                        db_name=db_name,
+                        table_name=table_name
                     )
+                )]
 
-                # Create unique dimensions
-                if datetime:
-                    unique_dimensions = (
-                        [d[0] for d in datetime] + dimensions
-                    )
-                else:
-                    unique_dimensions = dimensions
-
-                # Check the dataframe schema and column data-types
-                schema = pa.DataFrameSchema(
-                    rules,
-                    strict=True,
-                    coerce=True,
-                    unique=unique_dimensions,
-                    report_duplicates='all',
-                    checks=pa.Check(
-                        lambda df: df.shape[0] > 0,
-                        name='not_empty'
+                # Infer the `data contract` from a leading sample of the datafile
+                contract = _ingestion.Contract.infer(
+                    sample=_ingestion.sample(
+                        file=file,
+                        file_format=dbms
                     )
                 )
 
+                # Fingerprint the bytes of the datafile
+                sha256 = _ingestion.checksum(file=file)
+
                 # Display the schema validation content
                 st.subheader('Schema validation')
                 st.write(
@@ -317,31 +227,11 @@ def display_data_preview(
                             `data contract`.
                     """
                 )
+                status = st.container()
 
-                # Apply schema
+                # Apply schema, validating and promoting the datafile chunk-by-chunk
                 try:
-                    df = schema.validate(df, lazy=True)
-
-                    # Apply datetime formatting
-                    for date_object in datetime:
-                        df[date_object[0]] = df[date_object[0]].dt.strftime(date_object[1])
-
-                    # Display the status
-                    st.success(
-                        body='Schema validation completed successfully.',
-                        icon='✅'
-                    )
-
-                    # Display the data-preview content
-                    st.subheader(
-                        'Preview'
-                    )
-                    st.write('Preview of the first 5 observations.')
-                    st.dataframe(
-                        df.head(5),
-                        hide_index=True,
-                        use_container_width=True
-                    )
+                    validator = _ingestion.Validator(contract=contract)
 
                     # Promote the uploaded datafile to the database
                     promote_data_to_database(
@@ -350,32 +240,59 @@ def display_data_preview(
                         query_index=query_index,
                         scope_db_name=scope_db_name,
                         scope_query_index=scope_query_index,
-                        datetime=datetime,
+                        datetime=contract.datetime,
                         selected_datetime=[],
-                        dimensions=dimensions,
+                        dimensions=contract.dimensions,
                         selected_dimensions=[],
-                        metrics=metrics,
+                        metrics=contract.metrics,
                         selected_metrics=[],
                         selected_aggrules=[],
-                        df=df.copy(),
+                        chunks=_ingestion.read(
+                            file=file,
+                            file_format=dbms,
+                            dtype=contract.dtype,
+                            arrow=True
+                        ),
+                        validator=validator,
                         dbms=dbms,
-                        file_name=st.session_state['FormSubmitter:%s' % (
-                            generate_form_key(
-                                db_name=db_name,
-                                table_name=table_name
-                            )
-                        )].name,
-                        file_size=st.session_state['FormSubmitter:%s' % (
-                            generate_form_key(
-                                db_name=db_name,
-                                table_name=table_name
-                            )
-                        )].size
+                        file_name=file.name,
+                        file_size=file.size,
+                        sha256=sha256
+                    )
+
+                    # Display the status
+                    status.success(
+                        body='Schema validation completed successfully.',
+                        icon='✅'
+                    )
+
+                    # Read the data-preview from the stored dataset when the datafile was not re-read
+                    preview = validator.head
+                    if not validator.rows:
+                        preview = next(
+                            iter(_datasets.read(
+                                Database=data.Connection(),
+                                query_index=query_index,
+                                dataset_id=st.session_state[setup.NAME][db_name][query_index],
+                                chunksize=validator.preview
+                            )),
+                            pd.DataFrame()
+                        )
+
+                    # Display the data-preview content
+                    status.subheader(
+                        'Preview'
+                    )
+                    status.write('Preview of the first 5 observations.')
+                    status.dataframe(
+                        preview,
+                        hide_index=True,
+                        use_container_width=True
                     )
 
                 # Raise schema errors
-                except pa.errors.SchemaErrors as e:
-                    st.error(
+                except _exceptions.InvalidSchema as e:
+                    status.error(
                         body="""
                             Schema validation failed. The dataframe structure does not
                              comply with the `data contract` requirements. See the dataframe
@@ -383,7 +300,7 @@ def display_data_preview(
                         """,
                         icon='⛔'
                     )
-                    col1, col2 = st.columns([0.25, 6.75])
+                    col1, col2 = status.columns([0.25, 6.75])
                     col2.dataframe(
                         e.failure_cases,
                         hide_index=True,
@@ -495,10 +412,12 @@ def promote_data_to_database(
     metrics: list,
     selected_metrics: list,
     selected_aggrules: list,
-    df: pd.DataFrame,
+    chunks: Iterable[pd.DataFrame],
+    validator: _ingestion.Validator,
     dbms: str,
     file_name: str,
-    file_size: float
+    file_size: float,
+    sha256: str
 ):
     """ Promotes an uploaded datafile to the database.
 
@@ -530,14 +449,18 @@ def promote_data_to_database(
         Ordered list of aggregation rules that determine the aggregation of the `metrics`.
     selected_aggrules : `list`
         Ordered list of the selected aggregation rule that determines the aggregation of the `selected_metrics`.
-    df : `pd.DataFrame`
-        Pandas dataframe object to promote to the database.
+    chunks : `Iterable[pd.DataFrame]`
+        The chunks of the datafile to promote to the database.
+    validator : `_ingestion.Validator`
+        The streaming schema validator of the datafile, which validates each chunk as it is promoted.
     dbms : `str`
         Data management system name of the data to promote ('csv', 'parquet').
     file_name : `str`
         Name of the datafile.
     file_size : `str`
         Size of the datafile.
+    sha256 : `str`
+        The sha256 hash of the bytes of the datafile.
     """
 
     # Initialize the connection to the scope database
@@ -546,29 +469,23 @@ def promote_data_to_database(
     # Initialize connection to the data-ingestion database
     Data = data.Connection()
 
+    # Initialize the cross-database connection
+    Scope = scope.Connection()
+
     # Retrieve the latest data version number
     try:
-        version = int(
-            Data.select_generic_query(
-                query="""
-                    SELECT MAX(version) FROM %s
-                        WHERE %s in (%s);
-                """ % (
-                    table_name,
-                    query_index,
-                    ', '.join(["'%s'" % (i) for i in Sessions.select_table_column_value(
-                        table_name=table_name,
-                        col=query_index,
-                        filtr=Filter(
-                            col=scope_query_index,
-                            val=st.session_state[setup.NAME][scope_db_name][scope_query_index]
-                        ),
-                        multi=True
-                    )])
-                ),
-                return_dtype='int'
-            ) + 1
-        )
+        version = Scope.select_scoped_table_column_value(
+            db_name=db_name,
+            table_name=table_name,
+            col='version',
+            query_index=query_index,
+            scope_db_name=scope_db_name,
+            scope_query_index=scope_query_index,
+            scope_value=st.session_state[setup.NAME][scope_db_name][scope_query_index],
+            return_dtype='int',
+            aggregate='MAX',
+            order=None
+        )[0] + 1
 
     except (TypeError, _generic.NullReturnValue):
         version = 1
@@ -585,55 +502,65 @@ def promote_data_to_database(
     ).hexdigest()
 
     # Check if the file name already exists
-    if not Data.table_exists(table_name=id):
-
-        # Update the scope database
-        Sessions.insert(
-            table_name=table_name,
-            row=Row(
-                cols=sessions.Schemas.data.cols(),
-                vals=[
-                    st.session_state[setup.NAME][scope_db_name][scope_query_index],
-                    id
-                ]
+    if not _datasets.exists(Database=Data, query_index=query_index, dataset_id=id):
+
+        # Record the metadata of the datafile within the transaction that records it within the dataset
+        #   catalog, so that a datafile whose metadata cannot be recorded is not catalogued
+        def record():
+            # Update the data ingestion database
+            Data.insert(
+                table_name=table_name,
+                row=Row(
+                    cols=data.Schemas.data.cols(),
+                    vals=[
+                        id,
+                        st.session_state[setup.NAME][setup.USERS_DB_NAME]['name'],
+                        dt.datetime.now(),
+                        False,
+                        version,
+                        file_name,
+                        dbms,
+                        json.dumps(datetime),
+                        json.dumps(dimensions),
+                        json.dumps(metrics),
+                        json.dumps(selected_datetime),
+                        json.dumps(selected_dimensions),
+                        json.dumps(selected_metrics),
+                        json.dumps(selected_aggrules),
+                        round(file_size / 1024, 6),
+                        sha256
+                    ]
+                ),
+                validate=Validate(
+                    col=query_index,
+                    val=id
+                )
             )
-        )
 
-        # Update the data ingestion database
-        Data.insert(
-            table_name=table_name,
-            row=Row(
-                cols=data.Schemas.data.cols(),
-                vals=[
-                    id,
-                    st.session_state[setup.NAME][setup.USERS_DB_NAME]['name'],
-                    dt.datetime.now(),
-                    False,
-                    version,
-                    file_name,
-                    dbms,
-                    json.dumps(datetime),
-                    json.dumps(dimensions),
-                    json.dumps(metrics),
-                    json.dumps(selected_datetime),
-                    json.dumps(selected_dimensions),
-                    json.dumps(selected_metrics),
-                    json.dumps(selected_aggrules),
-                    round(file_size / 1024, 6),
-                    hashlib.sha256(df.to_string().encode('utf8')).hexdigest()
-                ]
-            ),
-            validate=Validate(
-                col=query_index,
-                val=id
+            # Update the scope database last, as it is committed separately, so that a failure
+            #   rolls back the data ingestion database
+            Sessions.insert(
+                table_name=table_name,
+                row=Row(
+                    cols=sessions.Schemas.data.cols(),
+                    vals=[
+                        st.session_state[setup.NAME][scope_db_name][scope_query_index],
+                        id
+                    ]
+                )
             )
-        )
 
-        # Promote the datafile to the data-ingestion database as a table
-        df.to_sql(
-            name=id,
-            con=Data.connection(),
-            index=False
+        # Validate and promote the datafile to the dataset storage engine chunk-by-chunk, and record
+        #   it within the dataset catalog with its metadata. A datafile with the same bytes as a
+        #   previous upload shares its stored dataset and is not re-read. The storage engine is named
+        #   by the `ASSEMBLIT_DATASET_ENGINE` environment variable.
+        _datasets.write(
+            Database=Data,
+            query_index=query_index,
+            dataset_id=id,
+            df=validator.stream(chunks=chunks),
+            key=sha256,
+            hook=record
         )
 
         # Set the session state
@@ -652,6 +579,10 @@ def promote_data_to_database(
 
         # ADD CONDITION TO "UPDATE" A PREVIOUSLY UPLOADED FILE
 
+        # Validate the datafile
+        for _ in validator.stream(chunks=chunks):
+            pass
+
         # Log successes
         st.success(
             body="""
@@ -402,14 +402,14 @@ def display_key_value_pair_setting(
             setting.value = select_setting_table_column_value(
                 db_name=db_name,
                 query="""
-                    SELECT %s FROM %s WHERE %s = '%s';
+                    SELECT %s FROM %s WHERE %s = ?;
                 """ % (
                     setting.parameter,
                     table_name,
-                    query_index,
-                    st.session_state[setup.NAME][db_name][query_index]
+                    query_index
                 ),
-                return_dtype=setting.dtype
+                return_dtype=setting.dtype,
+                params=[st.session_state[setup.NAME][db_name][query_index]]
             )
         except _generic.NullReturnValue:
             setting.value = ''
@@ -493,7 +493,8 @@ def display_key_value_pair_setting(
 def select_setting_table_column_value(
     db_name: str,
     query: str,
-    return_dtype: str
+    return_dtype: str,
+    params: Union[list, None] = None
 ) -> Union[str, int, float, bool, list, dict]:
     """ Submits {query} to {db_name} and returns the value in the
     {return_dtype}.
@@ -506,6 +507,8 @@ def select_setting_table_column_value(
         SQL query as a string
     return_dtype : `str`
         Data-type of the returned value
+    params : `Union[list, None]`
+        Values bound to the `?` placeholders of {query}
     """
 
     # Initialize the connection to the Database
@@ -518,7 +521,8 @@ def select_setting_table_column_value(
     return (
         Database.select_generic_query(
             query=query,
-            return_dtype=return_dtype
+            return_dtype=return_dtype,
+            params=params or []
         )
     )
 
@@ -553,53 +557,53 @@ def update_settings(
             dir_name=setup.DB_DIR
         )
 
-        # Update database settings
-        for parameter in list(response.keys()):
-
-            if Database.table_record_exists(
-                table_name=table_name,
-                filtr=Filter(
-                    col=query_index,
-                    val=st.session_state[setup.NAME][db_name][query_index]
-                )
-            ):
-                try:
-                    Database.update(
-                        table_name=table_name,
-                        value=Value(
+        # Update the changed database settings
+        if Database.table_record_exists(
+            table_name=table_name,
+            filtr=Filter(
+                col=query_index,
+                val=st.session_state[setup.NAME][db_name][query_index]
+            )
+        ):
+            try:
+                changed = Database.update_columns(
+                    table_name=table_name,
+                    values=[
+                        Value(
                             col=parameter,
                             val=str(response[parameter]).strip()
-                        ),
-                        filtr=Filter(
-                            col=query_index,
-                            val=st.session_state[setup.NAME][db_name][query_index]
-                        )
-                    )
-
-                    # Log success
-                    st.session_state[setup.NAME][db_name]['successes'] = (
-                        st.session_state[setup.NAME][db_name]['successes'] + [
-                            """
-                                {%s} successfully changed to %s.
-                            """ % (
-                                parameter,
-                                response[parameter]
-                            )
-                        ]
+                        ) for parameter in list(response.keys())
+                    ],
+                    filtr=Filter(
+                        col=query_index,
+                        val=st.session_state[setup.NAME][db_name][query_index]
                     )
+                )
 
-                except ValueError as e:
-
-                    # Log error
-                    st.session_state[setup.NAME][db_name]['errors'] = (
-                        st.session_state[setup.NAME][db_name]['errors'] + [str(e)]
-                    )
+                # Log success
+                st.session_state[setup.NAME][db_name]['successes'] = (
+                    st.session_state[setup.NAME][db_name]['successes'] + [
+                        """
+                            {%s} successfully changed to %s.
+                        """ % (
+                            parameter,
+                            response[parameter]
+                        ) for parameter in changed
+                    ]
+                )
 
-            else:
+            except ValueError as e:
 
                 # Log error
                 st.session_state[setup.NAME][db_name]['errors'] = (
-                    st.session_state[setup.NAME][db_name]['errors'] + [
-                        'No table record found.'
-                    ]
+                    st.session_state[setup.NAME][db_name]['errors'] + [str(e)]
                 )
+
+        else:
+
+            # Log error
+            st.session_state[setup.NAME][db_name]['errors'] = (
+                st.session_state[setup.NAME][db_name]['errors'] + [
+                    'No table record found.'
+                ]
+            )
@@ -4,12 +4,11 @@ import os
 import hashlib
 import datetime
 import json
-import pandas as pd
 import streamlit as st
 from assemblit import setup
 from assemblit.blocks.structures import Setting
 from assemblit.pages._components import _core, _selector
-from assemblit._database import _generic, sessions, data, analysis
+from assemblit._database import _generic, _datasets, sessions, data, analysis, scope
 from assemblit._database._structures import Filter, Validate, Row
 from assemblit._orchestrator import layer
 from assemblit._orchestrator import setup as server_setup
@@ -355,85 +354,30 @@ def run_job(
             if not os.path.isdir(os.path.join(setup.ROOT_DIR, 'workspace', db_name, name, 'outputs')):
                 os.mkdir(os.path.join(setup.ROOT_DIR, 'workspace', db_name, name, 'outputs'))
 
-        # Get dataset id
-        dataset_id = Data.select_generic_query(
-            query="""
-                SELECT %s FROM (
-                    SELECT file_name, %s, dbms
-                        FROM %s
-                            WHERE %s IN (%s)
-                )
-                    WHERE file_name = '%s';
-            """ % (
-                setup.DATA_DB_QUERY_INDEX,
-                setup.DATA_DB_QUERY_INDEX,
-                setup.DATA_DB_NAME,
-                setup.DATA_DB_QUERY_INDEX,
-                ', '.join(["'%s'" % (i) for i in Sessions.select_table_column_value(
-                    table_name=setup.DATA_DB_NAME,
-                    col=setup.DATA_DB_QUERY_INDEX,
-                    filtr=Filter(
-                        col=scope_query_index,
-                        val=st.session_state[setup.NAME][scope_db_name][scope_query_index]
-                    ),
-                    multi=True
-                )]),
-                response['dataset']
-            ),
-            return_dtype='str'
-        )
-
-        # Get dataset dbms
-        dataset_dbms = Data.select_generic_query(
-            query="""
-                SELECT %s FROM (
-                    SELECT file_name, %s, dbms
-                        FROM %s
-                            WHERE %s IN (%s)
-                )
-                    WHERE file_name = '%s';
-            """ % (
-                'dbms',
-                setup.DATA_DB_QUERY_INDEX,
-                setup.DATA_DB_NAME,
-                setup.DATA_DB_QUERY_INDEX,
-                ', '.join(["'%s'" % (i) for i in Sessions.select_table_column_value(
-                    table_name=setup.DATA_DB_NAME,
-                    col=setup.DATA_DB_QUERY_INDEX,
-                    filtr=Filter(
-                        col=scope_query_index,
-                        val=st.session_state[setup.NAME][scope_db_name][scope_query_index]
-                    ),
-                    multi=True
-                )]),
-                response['dataset']
-            ),
-            return_dtype='str'
-        )
-
-        # Unload the data
-        df = pd.read_sql(
-            sql="SELECT * FROM '%s'" % (dataset_id),
-            con=Data.connection()
+        # Get the dataset id & dbms
+        dataset = scope.Connection().select_scoped_multi_table_column_value(
+            db_name=setup.DATA_DB_NAME,
+            table_name=setup.DATA_DB_NAME,
+            cols=[setup.DATA_DB_QUERY_INDEX, 'dbms'],
+            query_index=setup.DATA_DB_QUERY_INDEX,
+            scope_db_name=scope_db_name,
+            scope_query_index=scope_query_index,
+            scope_value=st.session_state[setup.NAME][scope_db_name][scope_query_index],
+            filtr=Filter(
+                col='file_name',
+                val=response['dataset']
+            )
         )
+        dataset_id = str(dataset[setup.DATA_DB_QUERY_INDEX])
+        dataset_dbms = str(dataset['dbms'])
 
-        if dataset_dbms == '.CSV':
-            df.to_csv(
-                os.path.join(
-                    setup.ROOT_DIR,
-                    'workspace',
-                    db_name,
-                    name,
-                    'inputs',
-                    setup.DATA_DB_NAME,
-                    response['dataset']
-                ),
-                sep=',',
-                index=False
-            )
-        elif dataset_dbms == '.PARQUET':
-            df.to_parquet(
-                os.path.join(
+        # Unload the data, streaming it to the datafile format
+        if dataset_dbms in ['.CSV', '.PARQUET']:
+            _datasets.export(
+                Database=Data,
+                query_index=setup.DATA_DB_QUERY_INDEX,
+                dataset_id=dataset_id,
+                path=os.path.join(
                     setup.ROOT_DIR,
                     'workspace',
                     db_name,
@@ -442,7 +386,7 @@ def run_job(
                     setup.DATA_DB_NAME,
                     response['dataset']
                 ),
-                index=False
+                file_format='parquet' if dataset_dbms == '.PARQUET' else 'csv'
             )
 
         # Build the run-request
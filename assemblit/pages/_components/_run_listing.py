@@ -5,7 +5,7 @@ import pandas as pd
 import streamlit as st
 from assemblit import setup
 from assemblit.pages._components import _core, _selector
-from assemblit._database import _generic, sessions, analysis
+from assemblit._database import _generic, analysis, scope
 from assemblit._database._structures import Filter, Value
 from assemblit._orchestrator import layer
 from assemblit._orchestrator import setup as server_setup
@@ -38,11 +38,8 @@ def display_run_listing_table(
         Name of the index within `scope_db_name` & `table_name`. May only be one column.
     '''
 
-    # Initialize the connection to the scope database
-    Sessions = sessions.Connection()
-
-    # Initialize connection to the analysis database
-    Analysis = analysis.Connection()
+    # Initialize the cross-database connection
+    Scope = scope.Connection()
 
     # Check server-health
     server_health = layer.health_check(
@@ -58,22 +55,16 @@ def display_run_listing_table(
 
         # Get analysis-runs
         try:
-            df = pd.read_sql(
-                sql="SELECT * FROM %s WHERE %s IN (%s)" % (
-                    table_name,
-                    query_index,
-                    ', '.join(["'%s'" % (i) for i in Sessions.select_table_column_value(
-                        table_name=table_name,
-                        col=query_index,
-                        filtr=Filter(
-                            col=scope_query_index,
-                            val=st.session_state[setup.NAME][scope_db_name][scope_query_index]
-                        ),
-                        multi=True
-                    )])
-                ),
-                con=Analysis.connection()
+            df = Scope.select_scoped_table(
+                db_name=db_name,
+                table_name=table_name,
+                query_index=query_index,
+                scope_db_name=scope_db_name,
+                scope_query_index=scope_query_index,
+                scope_value=st.session_state[setup.NAME][scope_db_name][scope_query_index]
             )
+            if df.empty:
+                raise _generic.NullReturnValue
             df = df[[
                 'created_on',
                 'file_name',
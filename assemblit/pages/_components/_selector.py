@@ -1,16 +1,13 @@
 """ Contains the generic methods for a session-selector """
 
-import os
-import shutil
 from typing import List
 import hashlib
 import streamlit as st
 from assemblit import setup
 from assemblit.blocks.structures import Setting, Selector
 from assemblit.pages._components import _core, _key_value
-from assemblit._database import _generic, users, sessions, data, analysis
+from assemblit._database import _generic, scope
 from assemblit._database._structures import Filter, Value, Row
-from pytensils import utils
 
 
 # Define core-component selector function(s)
@@ -144,47 +141,23 @@ def select_selector_dropdown_options(
         Name of the index within `scope_db_name` & `table_name`. May only be one column.
     """
 
-    # Initialize connection to the scope-database
-    Scope = _generic.Connection(
-        db_name=scope_db_name,
-        dir_name=setup.DB_DIR
-    )
-
-    # Initialize the connection to the session-selector database
-    Database = _generic.Connection(
-        db_name=db_name,
-        dir_name=setup.DB_DIR
-    )
+    # Initialize the cross-database connection
+    Scope = scope.Connection()
 
     # Select session-selector drop-down options
     selector: Selector = st.session_state[setup.NAME][db_name][table_name]['selector']
 
-    if Scope.table_record_exists(
-        table_name=table_name,
-        filtr=Filter(
-            col=scope_query_index,
-            val=st.session_state[setup.NAME][scope_db_name][scope_query_index]
-        )
-    ):
-        options = Database.select_table_column_value(
+    try:
+        options = Scope.select_scoped_table_column_value(
+            db_name=db_name,
             table_name=table_name,
             col=selector.parameter,
-            filtr=Filter(
-                col=query_index,
-                val=Scope.select_table_column_value(
-                    table_name=table_name,
-                    col=query_index,
-                    filtr=Filter(
-                        col=scope_query_index,
-                        val=st.session_state[setup.NAME][scope_db_name][scope_query_index]
-                    ),
-                    multi=True
-                )
-            ),
-            multi=True
+            query_index=query_index,
+            scope_db_name=scope_db_name,
+            scope_query_index=scope_query_index,
+            scope_value=st.session_state[setup.NAME][scope_db_name][scope_query_index]
         )
-
-    else:
+    except _generic.NullReturnValue:
         options = []
 
     return options
@@ -341,49 +314,21 @@ def select_query_index_value(
             }
     """
 
-    # Initialize connection to the scope-database
-    Scope = _generic.Connection(
-        db_name=scope_db_name,
-        dir_name=setup.DB_DIR
-    )
+    # Initialize the cross-database connection
+    Scope = scope.Connection()
 
-    # Initialize connection to the session-selector database
-    Database = _generic.Connection(
+    # Select the scoped query index value
+    return Scope.select_scoped_table_column_value(
         db_name=db_name,
-        dir_name=setup.DB_DIR
-    )
-
-    values = Database.conn.cursor().execute(
-        """
-            SELECT %s
-            FROM %s
-            WHERE %s IN (%s)
-                AND %s = '%s';
-        """ % (
-            str(query_index),
-            str(table_name),
-            str(query_index),
-            ', '.join(
-                ["'%s'" % (i) for i in Scope.select_table_column_value(
-                    table_name=table_name,
-                    col=query_index,
-                    filtr=Filter(
-                        col=scope_query_index,
-                        val=st.session_state[setup.NAME][scope_db_name][scope_query_index]
-                    ),
-                    return_dtype='str',
-                    multi=True
-                )]
-            ),
-            str(filtr.col),
-            _generic.normalize(string=filtr.val)
-        )
-    ).fetchall()
-
-    return utils.as_type(
-        [i[0] for i in values][0],
+        table_name=table_name,
+        col=query_index,
+        query_index=query_index,
+        scope_db_name=scope_db_name,
+        scope_query_index=scope_query_index,
+        scope_value=st.session_state[setup.NAME][scope_db_name][scope_query_index],
+        filtr=filtr,
         return_dtype='str'
-    )
+    )[0]
 
 
 # Define function(s) for handling call-backs
@@ -583,56 +528,56 @@ def update_session(
         # Check for empty form entries
         if '' not in [str(i).strip() for i in response.values()]:
 
-            # Update session-selector parameters
-            for parameter in list(response.keys()):
-
-                if Database.table_record_exists(
-                    table_name=table_name,
-                    filtr=Filter(
-                        col=query_index,
-                        val=st.session_state[setup.NAME][db_name][query_index]
-                    )
-                ):
+            # Update the changed session-selector parameters
+            if Database.table_record_exists(
+                table_name=table_name,
+                filtr=Filter(
+                    col=query_index,
+                    val=st.session_state[setup.NAME][db_name][query_index]
+                )
+            ):
 
-                    try:
-                        Database.update(
-                            table_name=table_name,
-                            value=Value(
+                try:
+                    changed = Database.update_columns(
+                        table_name=table_name,
+                        values=[
+                            Value(
                                 col=parameter,
                                 val=response[parameter]
-                            ),
-                            filtr=Filter(
-                                col=query_index,
-                                val=st.session_state[setup.NAME][db_name][query_index]
-                            )
-                        )
-
-                        # Log success
-                        st.session_state[setup.NAME][db_name]['successes'] = (
-                            st.session_state[setup.NAME][db_name]['successes'] + [
-                                "{%s} successfully changed to '%s'." % (
-                                    parameter,
-                                    response[parameter]
-                                )
-                            ]
+                            ) for parameter in list(response.keys())
+                        ],
+                        filtr=Filter(
+                            col=query_index,
+                            val=st.session_state[setup.NAME][db_name][query_index]
                         )
+                    )
 
-                    except ValueError as e:
-
-                        # Log error
-                        st.session_state[setup.NAME][db_name]['errors'] = (
-                            st.session_state[setup.NAME][db_name]['errors'] + [str(e)]
-                        )
+                    # Log success
+                    st.session_state[setup.NAME][db_name]['successes'] = (
+                        st.session_state[setup.NAME][db_name]['successes'] + [
+                            "{%s} successfully changed to '%s'." % (
+                                parameter,
+                                response[parameter]
+                            ) for parameter in changed
+                        ]
+                    )
 
-                else:
+                except ValueError as e:
 
                     # Log error
                     st.session_state[setup.NAME][db_name]['errors'] = (
-                        st.session_state[setup.NAME][db_name]['errors'] + [
-                            'No table record found.'
-                        ]
+                        st.session_state[setup.NAME][db_name]['errors'] + [str(e)]
                     )
 
+            else:
+
+                # Log error
+                st.session_state[setup.NAME][db_name]['errors'] = (
+                    st.session_state[setup.NAME][db_name]['errors'] + [
+                        'No table record found.'
+                    ]
+                )
+
         else:
 
             # Log error
@@ -666,119 +611,10 @@ def delete_session(
         Session ID of the selected session.
     """
 
-    # Initialize connection to the users database
-    Users = users.Connection()
-
-    # Initialize connection to the sessions database
-    Sessions = sessions.Connection()
-
-    # Initialize connection to the data-ingestion database
-    Data = data.Connection()
-
-    # Initialize connection to the analysis database
-    Analysis = analysis.Connection()
-
-    # Build database table objects to remove sessions from the users database
-    users_db_query_index_objects_to_delete = Users.build_database_table_objects_to_delete(
-        table_names=Users.select_all_tables_with_column_name(
-            col=setup.SESSIONS_DB_QUERY_INDEX
-        ),
-        query_index=setup.SESSIONS_DB_QUERY_INDEX,
-        query_index_values=[session_id]
-    )
-
-    # Build database table objects to remove sessions from the sessions database
-    sessions_db_query_index_objects_to_delete = Sessions.build_database_table_objects_to_delete(
-        table_names=Sessions.select_all_tables_with_column_name(
-            col=setup.SESSIONS_DB_QUERY_INDEX
-        ),
-        query_index=setup.SESSIONS_DB_QUERY_INDEX,
-        query_index_values=[session_id]
-    )
-
-    # Get all orphaned data-db-query-index values
-    data_to_delete = Sessions.create_database_table_dependencies(
-        table_names=Sessions.select_all_tables_with_column_name(
-            col=setup.DATA_DB_QUERY_INDEX
-        ),
+    # Delete the session, and all datasets and analysis runs owned by the session
+    scope.cascade().delete(
         query_index=setup.SESSIONS_DB_QUERY_INDEX,
-        query_index_value=session_id,
-        dependent_query_index=setup.DATA_DB_QUERY_INDEX
-    )
-
-    # Build database table objects to remove datasets from the data database
-    if data_to_delete:
-        data_db_query_index_objects_to_delete = Data.build_database_table_objects_to_delete(
-            table_names=Data.select_all_tables_with_column_name(
-                col=setup.DATA_DB_QUERY_INDEX
-            ),
-            query_index=setup.DATA_DB_QUERY_INDEX,
-            query_index_values=data_to_delete
-        )
-
-        # Drop all data-ingestion database tables
-        for table in data_to_delete:
-            Data.drop_table(
-                table_name=table
-            )
-
-        # Delete all data-ingestion database table values
-        Data.delete(
-            tables=data_db_query_index_objects_to_delete
-        )
-
-    # Get all orphaned analysis-db-query-index values
-    analysis_runs_to_delete = Sessions.create_database_table_dependencies(
-        table_names=Sessions.select_all_tables_with_column_name(
-            col=setup.ANALYSIS_DB_QUERY_INDEX
-        ),
-        query_index=setup.SESSIONS_DB_QUERY_INDEX,
-        query_index_value=session_id,
-        dependent_query_index=setup.ANALYSIS_DB_QUERY_INDEX
-    )
-
-    # Build database table objects to remove analysis runs from the analysis database
-    if analysis_runs_to_delete:
-        analysis_db_query_index_objects_to_delete = Analysis.build_database_table_objects_to_delete(
-            table_names=Analysis.select_all_tables_with_column_name(
-                col=setup.ANALYSIS_DB_QUERY_INDEX
-            ),
-            query_index=setup.ANALYSIS_DB_QUERY_INDEX,
-            query_index_values=analysis_runs_to_delete
-        )
-
-        # Get all orphaned analysis run names from the analysis database
-        analysis_names_to_delete = Analysis.select_table_column_value(
-            table_name=setup.ANALYSIS_DB_NAME,
-            col='name',
-            filtr=Filter(
-                col=setup.ANALYSIS_DB_QUERY_INDEX,
-                val=analysis_runs_to_delete
-            ),
-            return_dtype='str',
-            multi=True
-        )
-
-        # Delete all analysis run workspace folders
-        for name in analysis_names_to_delete:
-            try:
-                shutil.rmtree(os.path.join(setup.ROOT_DIR, 'workspace', setup.ANALYSIS_DB_NAME, name))
-            except FileNotFoundError:
-                pass
-
-        # Delete all analysis database table values
-        Analysis.delete(
-            tables=analysis_db_query_index_objects_to_delete
-        )
-
-    # Delete all sessions database table values
-    Sessions.delete(
-        tables=sessions_db_query_index_objects_to_delete
-    )
-
-    # Delete all user database table values
-    Users.delete(
-        tables=users_db_query_index_objects_to_delete
+        values=[session_id]
     )
 
     # Reset session state
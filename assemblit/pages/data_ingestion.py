@@ -173,6 +173,9 @@ class Content():
                     schema=data.Schemas.data
                 )
 
+                # Initialize the dataset-catalog table
+                data.Connection().create_dataset_catalog()
+
                 # Display the data-contract expander
                 _data_uploader.display_data_contract(
                     data_dictionary=self.data_dictionary,
@@ -52,6 +52,13 @@ if 'ASSEMBLIT_APP_TYPE' not in os.environ:
 
     # Db settings
     DB_DIR,
+    DB_PROFILE,
+    DB_POOL_SIZE,
+    DATASET_ENGINE,
+    DB_CACHE_SIZE,
+    DB_SLOW_QUERY_MS,
+    DB_WRITER,
+    ANALYTICS_ENGINE,
 
     # Users db settings
     USERS_DB_NAME,
@@ -99,5 +106,12 @@ if 'ASSEMBLIT_APP_TYPE' not in os.environ:
     data_db_name=os.environ.get('ASSEMBLIT_DATA_DB_NAME', None),
     data_db_query_index=os.environ.get('ASSEMBLIT_DATA_DB_QUERY_INDEX', None),
     analysis_db_name=os.environ.get('ASSEMBLIT_ANALYSIS_DB_NAME', None),
-    analysis_db_query_index=os.environ.get('ASSEMBLIT_ANALYSIS_DB_QUERY_INDEX', None)
+    analysis_db_query_index=os.environ.get('ASSEMBLIT_ANALYSIS_DB_QUERY_INDEX', None),
+    db_profile=os.environ.get('ASSEMBLIT_DB_PROFILE', None),
+    db_pool_size=os.environ.get('ASSEMBLIT_DB_POOL_SIZE', None),
+    dataset_engine=os.environ.get('ASSEMBLIT_DATASET_ENGINE', None),
+    db_cache_size=os.environ.get('ASSEMBLIT_DB_CACHE_SIZE', None),
+    db_slow_query_ms=os.environ.get('ASSEMBLIT_DB_SLOW_QUERY_MS', None),
+    db_writer=os.environ.get('ASSEMBLIT_DB_WRITER', None),
+    analytics_engine=os.environ.get('ASSEMBLIT_ANALYTICS_ENGINE', None)
 )
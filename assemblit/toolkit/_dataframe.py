@@ -1,9 +1,18 @@
-""" Dimension classification """
+""" Dimension classification
 
-from typing import List, Tuple
+Classifies the columns of a `pandas.DataFrame` as date-time dimensions, categorical
+dimensions or metrics in a single pass. Candidate date-time formats are first tested
+against a bounded head and random sample of each text column with precompiled patterns,
+exiting on the first non-matching value, and only the surviving candidates are confirmed
+against the unique values of the entire column.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Tuple, Union
 import pandas
 
-DATETIME_REGEX_PATTERNS = {
+DATETIME_REGEX_PATTERNS: Dict[str, str] = {
     "%d/%m/%Y": '|'.join([
         r'^(0[1-9]|[12][0-9]|3[01])/(0[1-9]|1[0-2])/\d\d\d\d$',
         r'^([1-9]|[12][0-9]|3[01])/([1-9]|1[0-2])/\d\d\d\d$'
@@ -13,11 +22,11 @@ DATETIME_REGEX_PATTERNS = {
         r'^([1-9]|1[0-2])/([1-9]|[12][0-9]|3[01])/\d\d\d\d$'
     ]),
     "%Y-%m-%d": '|'.join([
-        r'^\d\d\d\d-(0[1-9]|1[0-2])-(0[1-9]|[12][0-9]|3[01])$'
+        r'^\d\d\d\d-(0[1-9]|1[0-2])-(0[1-9]|[12][0-9]|3[01])$',
         r'^\d\d\d\d-([1-9]|1[0-2])-([1-9]|[12][0-9]|3[01])$'
     ]),
     "%Y/%m/%d": '|'.join([
-        r'^\d\d\d\d/(0[1-9]|1[0-2])/(0[1-9]|[12][0-9]|3[01])$'
+        r'^\d\d\d\d/(0[1-9]|1[0-2])/(0[1-9]|[12][0-9]|3[01])$',
         r'^\d\d\d\d/([1-9]|1[0-2])/([1-9]|[12][0-9]|3[01])$'
     ]),
     "%d %b %Y": '|'.join([
@@ -58,32 +67,128 @@ DATETIME_REGEX_PATTERNS = {
     ])
 }
 
+# Define the precompiled date-time patterns, in order of precedence
+DATETIME_PATTERNS: Dict[str, re.Pattern] = {
+    fmt: re.compile(pattern) for fmt, pattern in DATETIME_REGEX_PATTERNS.items()
+}
+
+# Define the default number of leading and of randomly sampled values of each column
+DEFAULT_SAMPLE_SIZE: int = 1000
+
 
-def datetime_dimension(
-    df: pandas.DataFrame
-) -> List[Tuple[str, str]]:
-    """ Parses `df` and returns a list of date-time columns and formats as a `List[Tuple[str, str]]`.
+# Define the column profile `class`
+@dataclass
+class Profile():
+    """ A `class` that represents the classification of the columns of a `pandas.DataFrame`.
+
+    Parameters
+    ----------
+    datetime : `List[Tuple[str, str]]`
+        Ordered list of the date-time columns and their formats.
+    dimensions : `List[str]`
+        Ordered list of the categorical columns.
+    metrics : `List[str]`
+        Ordered list of the numeric columns.
+    """
+
+    datetime: List[Tuple[str, str]]
+    dimensions: List[str]
+    metrics: List[str]
+
+
+def profile(
+    df: pandas.DataFrame,
+    sample_size: int = DEFAULT_SAMPLE_SIZE,
+    random_state: int = 0
+) -> Profile:
+    """ Classifies the columns of `df` and returns the date-time columns and formats, the categorical
+    columns and the numeric columns as a `Profile`.
 
     Parameters
     ----------
     df : `pandas.DataFrame`
         Pandas dataframe object to describe.
+    sample_size : `int`
+        The number of leading and of randomly sampled values of each column that are tested before
+            a candidate date-time format is confirmed against the entire column.
+    random_state : `int`
+        Seed of the random sample.
     """
+    datetime, dimensions, metrics = [], [], []
 
-    date_dimensions = []
-
-    # Retain column and datatype
     for col in df.columns:
-        for pattern in DATETIME_REGEX_PATTERNS.values():
-            if all(df[col].astype(str).str.match(pattern, na=False)):
-                date_dimensions.append(
-                    (
-                        col,
-                        list(DATETIME_REGEX_PATTERNS.keys())[
-                            list(DATETIME_REGEX_PATTERNS.values()).index(pattern)
-                        ]
-                    )
-                )
-                break
-
-    return date_dimensions
+
+        # Identify metrics
+        #   If the datatype is a(n),
+        #       <i> signed integer
+        #       <u> unsighted integer
+        #       <f> floating-point
+        #       <c> complex floating-point
+        #
+        #   > Then the column is a metric
+        if df[col].dtype.kind in 'iufc':
+            metrics.append(col)
+            continue
+
+        # Identify and format the datetime dimension
+        fmt = datetime_format(column=df[col], sample_size=sample_size, random_state=random_state)
+        if fmt is not None:
+            datetime.append((col, fmt))
+
+        # Identify categorical dimensions
+        #   If the datatype is a(n),
+        #       <b> boolean
+        #       <O> object
+        #       <S> (byte-)string
+        #       <U> unicode
+        #
+        #   > Then the column is a dimension
+        elif df[col].dtype.kind in 'bOSU':
+            dimensions.append(col)
+
+    return Profile(datetime=datetime, dimensions=dimensions, metrics=metrics)
+
+
+def datetime_format(
+    column: pandas.Series,
+    sample_size: int = DEFAULT_SAMPLE_SIZE,
+    random_state: int = 0
+) -> Union[str, None]:
+    """ Returns the first date-time format that matches every value of `column` as a `str`, or `None`.
+
+    Parameters
+    ----------
+    column : `pandas.Series`
+        The column to classify.
+    sample_size : `int`
+        The number of leading and of randomly sampled values that are tested before a candidate
+            date-time format is confirmed against the entire column.
+    random_state : `int`
+        Seed of the random sample.
+    """
+
+    # Only text columns without missing values can be date-times
+    if column.dtype.kind not in 'OSU' or column.empty or column.isna().any():
+        return None
+
+    # Test the candidates against the sample, exiting on the first non-matching value
+    sample = [
+        str(value) for value in pandas.concat([
+            column.head(sample_size),
+            column.sample(n=min(sample_size, len(column)), random_state=random_state)
+        ]).unique()
+    ]
+    candidates = [
+        fmt for fmt, pattern in DATETIME_PATTERNS.items() if all(
+            pattern.match(value) for value in sample
+        )
+    ]
+
+    # Confirm the surviving candidates against the unique values of the entire column
+    if candidates:
+        values = pandas.Series(column.unique()).astype(str)
+        for fmt in candidates:
+            if values.str.match(DATETIME_PATTERNS[fmt].pattern).all():
+                return fmt
+
+    return None
@@ -1,6 +1,7 @@
 """ Assemblit web-application exceptions """
 
 from typing import List
+import pandas
 import assemblit
 
 
@@ -9,6 +10,35 @@ class InvalidAggregationRule(Exception):
     pass
 
 
+# ingestion - Streaming datafile ingestion exceptions
+class InvalidSchema(ValueError):
+
+    def __init__(
+        self,
+        failure_cases: pandas.DataFrame,
+        *args,
+        **kwargs
+    ):
+        """ Raises a schema validation error.
+
+        Parameters
+        ----------
+        failure_cases : `pandas.DataFrame`
+            The failure cases of the schema validation, with the columns of
+                `pandera.errors.SchemaErrors.failure_cases`.
+        """
+        default_message = ''.join([
+            "Invalid schema.",
+            " The datafile does not comply with the `data contract`, see `failure_cases`."
+        ])
+
+        if not args:
+            args = (default_message,)
+
+        self.failure_cases = failure_cases
+        super().__init__(*args, **kwargs)
+
+
 # yaml - Configuration utility exceptions
 class MissingConfiguration(FileNotFoundError):
     """ Raises a missing configuration error."""
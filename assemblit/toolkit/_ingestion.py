@@ -0,0 +1,764 @@
+""" Streaming datafile ingestion
+
+Reads an uploaded '.csv' or '.parquet' datafile as an iterator of fixed-size chunks,
+infers the `data contract` from a leading sample and validates each chunk against it
+as the chunk is consumed, so that memory is bounded by the chunk size rather than by
+the size of the datafile. As the date-time formats are inferred from the sample alone,
+each chunk is confirmed against the inferred formats, and a datafile whose later rows
+contradict its sample fails validation rather than being parsed with another format.
+The checks that span the entire datafile, i.e., that the
+date-time and categorical dimensions are unique and that the datafile is not empty,
+are kept as streaming state.
+
+'.parquet' datafiles are read and validated as `pyarrow.Table` chunks with Arrow
+compute kernels, and are stored by the `parquet` dataset storage engine without
+converting their values to Python objects. Chunks that fail a check are validated
+with `pandera`, so that their failure cases are reported identically.
+
+Datafiles are fingerprinted by the sha256 hash of their bytes, read block-by-block,
+and stored datasets by a per-column digest of the canonical serialization of their
+rows, so that the integrity of the columns that are read back can be checked without
+rendering or re-reading the entire dataset. The serialization is versioned, so that
+the digests recorded by earlier versions are checked with the serialization that they
+were recorded with.
+"""
+
+import bisect
+import hashlib
+from dataclasses import dataclass, field
+from typing import IO, Any, Dict, Iterable, Iterator, List, Tuple, Union
+import numpy
+import pandas
+import pandera
+from pandera.engines import pandas_engine
+from assemblit.toolkit import _dataframe, _exceptions
+
+try:
+    import pyarrow
+    import pyarrow.compute
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover
+    pyarrow = None
+
+# Define the default number of rows of each chunk and of the leading sample
+DEFAULT_CHUNKSIZE: int = 100000
+DEFAULT_SAMPLE_SIZE: int = 10000
+
+# Define the default number of bytes of each block of a datafile that is hashed
+DEFAULT_BLOCKSIZE: int = 1 << 20
+
+# Define the columns of the schema validation failure cases
+FAILURE_CASES: List[str] = ['schema_context', 'column', 'check', 'check_number', 'failure_case', 'index']
+
+# Define the version of the canonical serialization of the per-column digests
+#   1: the `pandas.util.hash_pandas_object` values of each `float64` or `str` column
+#   2: the bytes of the `float64` values, or the lengths and the utf8 bytes of the `str` values, of each column
+DIGEST_VERSION: int = 2
+
+# Define the separator of the keys of each row that are joined to check their uniqueness
+SEPARATOR: str = '\x1f'
+
+
+def read(
+    file: IO,
+    file_format: str,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    dtype: Union[Dict[str, type], None] = None,
+    arrow: bool = False
+) -> Iterator[Union[pandas.DataFrame, 'pyarrow.Table']]:
+    """ Reads a datafile and returns an iterator of `chunksize`-row chunks, with lower-case
+    column names, as an `Iterator[Union[pandas.DataFrame, pyarrow.Table]]`.
+
+    Parameters
+    ----------
+    file : `IO`
+        The datafile, e.g., a `streamlit.runtime.uploaded_file_manager.UploadedFile`.
+    file_format : `str`
+        Format of the datafile ('.csv', '.parquet').
+    chunksize : `int`
+        The number of rows of each chunk.
+    dtype : `Union[Dict[str, type], None]`
+        The datatype of each lower-case column name of a '.csv' datafile, that is read as text otherwise inferred.
+    arrow : `bool`
+        `True` or `False`, whether the chunks of a '.parquet' datafile are returned as `pyarrow.Table`.
+    """
+    file_format = str(file_format).strip().lower().lstrip('.')
+
+    if file_format == 'csv':
+
+        # Map the datatypes onto the column names of the header
+        if dtype:
+            header = pandas.read_csv(file, sep=',', nrows=0).columns
+            file.seek(0)
+            dtype = {col: dtype[str(col).lower()] for col in header if str(col).lower() in dtype}
+
+        with pandas.read_csv(file, sep=',', chunksize=int(chunksize), dtype=dtype) as reader:
+            for chunk in reader:
+                chunk.columns = [str(c).lower() for c in chunk.columns]
+                yield chunk
+
+    elif file_format == 'parquet':
+        offset = 0
+        for batch in pyarrow.parquet.ParquetFile(file).iter_batches(batch_size=int(chunksize)):
+            if arrow:
+                yield pyarrow.Table.from_batches([batch]).rename_columns([str(c).lower() for c in batch.schema.names])
+                continue
+
+            chunk = batch.to_pandas()
+            chunk.columns = [str(c).lower() for c in chunk.columns]
+
+            # Index each row by its position within the datafile, as for '.csv' datafiles
+            chunk.index = pandas.RangeIndex(offset, offset + len(chunk))
+            offset += len(chunk)
+            yield chunk
+
+    else:
+        raise ValueError(
+            "Invalid file format {%s}. Currently, `assemblit` ingests the following file formats, ['csv', 'parquet']." % (
+                file_format
+            )
+        )
+
+
+def sample(
+    file: IO,
+    file_format: str,
+    nrows: int = DEFAULT_SAMPLE_SIZE
+) -> pandas.DataFrame:
+    """ Reads the leading `nrows` rows of a datafile, with lower-case column names, as a `pandas.DataFrame`
+    and rewinds the datafile.
+
+    Parameters
+    ----------
+    file : `IO`
+        The datafile.
+    file_format : `str`
+        Format of the datafile ('.csv', '.parquet').
+    nrows : `int`
+        The number of rows of the sample.
+    """
+    chunks = read(file=file, file_format=file_format, chunksize=nrows)
+    try:
+        return next(chunks, pandas.DataFrame())
+    finally:
+        chunks.close()
+        file.seek(0)
+
+
+def checksum(
+    file: IO,
+    blocksize: int = DEFAULT_BLOCKSIZE
+) -> str:
+    """ Returns the sha256 hash of the bytes of a datafile, read incrementally in `blocksize`-byte blocks,
+    as a `str` and rewinds the datafile.
+
+    Parameters
+    ----------
+    file : `IO`
+        The datafile.
+    blocksize : `int`
+        The number of bytes of each block.
+    """
+    digest = hashlib.sha256()
+    file.seek(0)
+    for block in iter(lambda: file.read(int(blocksize)), b''):
+        digest.update(block)
+    file.seek(0)
+    return digest.hexdigest()
+
+
+def serialize(
+    column: Union[pandas.Series, 'pyarrow.Array', 'pyarrow.ChunkedArray'],
+    version: int = DIGEST_VERSION
+) -> Dict[str, Any]:
+    """ Returns the canonical serialization of a column as a `Dict[str, bytes]`, so that a column has the
+    same digest whether it is a `pandas.Series` or an Arrow array, and whether it is uploaded or read back
+    from a dataset storage engine. Boolean, numeric and entirely missing columns are serialized as the
+    bytes of their `float64` values, and other columns as the lengths and the bytes of their utf8 encoded
+    `str` values, with missing values as 'None'.
+
+    Parameters
+    ----------
+    column : `Union[pandas.Series, pyarrow.Array, pyarrow.ChunkedArray]`
+        The column of a dataset.
+    version : `int`
+        The version of the serialization, see `DIGEST_VERSION`.
+    """
+    if version == 1:
+        if not isinstance(column, pandas.Series):
+            column = column.to_pandas()
+        if column.dtype.kind in 'biuf' or column.isna().all():
+            column = column.astype('float64')
+        else:
+            column = column.astype(str)
+        return {'hash': pandas.util.hash_pandas_object(column, index=False).to_numpy().tobytes()}
+
+    if version != DIGEST_VERSION:
+        raise ValueError(
+            "Invalid digest version {%s}. Currently, `assemblit` serializes the following versions, %s." % (
+                version,
+                list(range(1, DIGEST_VERSION + 1))
+            )
+        )
+
+    if isinstance(column, pandas.Series):
+        if column.dtype.kind in 'biuf' or column.isna().all():
+            return {'values': column.astype('float64').to_numpy().tobytes()}
+
+        # Encode the values with Arrow, when it is installed, rather than value-by-value
+        if pyarrow is None:
+            encoded = [value.encode('utf8') for value in column.astype(str)]
+            return {
+                'lengths': numpy.fromiter((len(value) for value in encoded), dtype=numpy.int64, count=len(encoded)).tobytes(),
+                'data': b''.join(encoded)
+            }
+        column = pyarrow.array(column.astype(str).to_numpy(dtype=object), type=pyarrow.large_string())
+
+    if isinstance(column, pyarrow.ChunkedArray):
+        column = column.combine_chunks()
+
+    if (
+        pyarrow.types.is_boolean(column.type) or pyarrow.types.is_integer(column.type)
+        or pyarrow.types.is_floating(column.type) or column.null_count == len(column)
+    ):
+        return {'values': column.cast(pyarrow.float64()).to_numpy(zero_copy_only=False).tobytes()}
+
+    # Read the offsets and the bytes of the values from the buffers of a `large_string` array
+    text = pyarrow.compute.fill_null(column.cast(pyarrow.string()), 'None').cast(pyarrow.large_string())
+    offsets = numpy.frombuffer(text.buffers()[1], dtype=numpy.int64)[text.offset:text.offset + len(text) + 1]
+    data = text.buffers()[2]
+    return {
+        'lengths': numpy.diff(offsets).tobytes(),
+        'data': memoryview(data)[offsets[0]:offsets[-1]] if data is not None else b''
+    }
+
+
+# Define the per-column digest `class`
+class Digest():
+    """ A `class` that folds the canonical serialization of each column of a dataset, chunk-by-chunk,
+    into a sha256 hash per column, independent of the size of the chunks.
+    """
+
+    def __init__(
+        self,
+        version: int = DIGEST_VERSION
+    ):
+        """ Initializes an instance of the per-column digest `class`.
+
+        Parameters
+        ----------
+        version : `int`
+            The version of the canonical serialization, see `DIGEST_VERSION`.
+        """
+        self.version: int = version
+        self._columns: Dict[str, Dict[str, Any]] = {}
+
+    def update(
+        self,
+        chunk: Union[pandas.DataFrame, 'pyarrow.Table']
+    ):
+        """ Folds the rows of a chunk into the digest of each column.
+
+        Parameters
+        ----------
+        chunk : `Union[pandas.DataFrame, pyarrow.Table]`
+            The chunk of a dataset.
+        """
+        names = chunk.columns if isinstance(chunk, pandas.DataFrame) else chunk.column_names
+        for col in names:
+            parts = self._columns.setdefault(str(col), {})
+            for part, value in serialize(column=chunk[col], version=self.version).items():
+                parts.setdefault(part, hashlib.sha256()).update(value)
+
+    def stream(
+        self,
+        chunks: Iterable[Union[pandas.DataFrame, 'pyarrow.Table']]
+    ) -> Iterator[Union[pandas.DataFrame, 'pyarrow.Table']]:
+        """ Folds and yields each chunk of a dataset as it is consumed, as an
+        `Iterator[Union[pandas.DataFrame, pyarrow.Table]]`.
+
+        Parameters
+        ----------
+        chunks : `Iterable[Union[pandas.DataFrame, pyarrow.Table]]`
+            The chunks of the dataset.
+        """
+        for chunk in chunks:
+            self.update(chunk=chunk)
+            yield chunk
+
+    def hexdigest(self) -> Dict[str, str]:
+        """ Returns the sha256 hash of each column, keyed by column name, as a `Dict[str, str]`. """
+        if self.version == 1:
+            return {col: parts['hash'].hexdigest() for col, parts in self._columns.items()}
+
+        return {
+            col: hashlib.sha256(
+                ''.join([parts[part].hexdigest() for part in sorted(parts)]).encode('utf8')
+            ).hexdigest() for col, parts in self._columns.items()
+        }
+
+
+def digest(
+    chunks: Iterable[Union[pandas.DataFrame, 'pyarrow.Table']],
+    version: int = DIGEST_VERSION
+) -> Dict[str, str]:
+    """ Returns the sha256 hash of each column of a dataset, keyed by column name, as a `Dict[str, str]`.
+
+    Parameters
+    ----------
+    chunks : `Iterable[Union[pandas.DataFrame, pyarrow.Table]]`
+        The chunks of the dataset.
+    version : `int`
+        The version of the canonical serialization, see `DIGEST_VERSION`.
+    """
+    value = Digest(version=version)
+    for chunk in chunks:
+        value.update(chunk=chunk)
+    return value.hexdigest()
+
+
+# Define the data contract `class`
+@dataclass
+class Contract():
+    """ A `class` that represents the `data contract` of a datafile.
+
+    Parameters
+    ----------
+    datetime : `List[Tuple[str, str]]`
+        Ordered list of the date-time columns and their formats.
+    dimensions : `List[str]`
+        Ordered list of the categorical columns.
+    metrics : `List[str]`
+        Ordered list of the numeric columns.
+    dtype : `Dict[str, type]`
+        The datatype of the columns that are read as text.
+    """
+
+    datetime: List[Tuple[str, str]]
+    dimensions: List[str]
+    metrics: List[str]
+    dtype: Dict[str, type] = field(default_factory=dict)
+
+    @classmethod
+    def infer(
+        cls,
+        sample: pandas.DataFrame
+    ) -> 'Contract':
+        """ Infers the `data contract` from a leading sample of a datafile and returns it as a `Contract`.
+        The date-time formats are only confirmed against the sample, and are confirmed against the rest
+        of the datafile chunk-by-chunk by the `Validator`.
+
+        Parameters
+        ----------
+        sample : `pandas.DataFrame`
+            The leading sample of the datafile.
+        """
+
+        # Classify the date-time dimensions, categorical dimensions and metrics
+        profile = _dataframe.profile(df=sample)
+
+        # Read the date-time and non-boolean categorical dimensions as text, so that the
+        #   datatypes of the subsequent chunks do not depend upon their content
+        dtype = {
+            dim: str for dim in [date_object[0] for date_object in profile.datetime] + profile.dimensions if (
+                sample[dim].dtype.kind != 'b'
+            )
+        }
+
+        return cls(datetime=profile.datetime, dimensions=profile.dimensions, metrics=profile.metrics, dtype=dtype)
+
+    def keys(self) -> List[str]:
+        """ Returns the columns that uniquely identify each row as a `List[str]`. """
+        return [date_object[0] for date_object in self.datetime] + self.dimensions
+
+    def schema(self) -> pandera.DataFrameSchema:
+        """ Returns the schema that validates each chunk of a datafile as a `pandera.DataFrameSchema`. """
+
+        # Compile schema validation rules
+        rules = {}
+
+        # Add datetime rules
+        for date_object in self.datetime:
+            rules[date_object[0]] = pandera.Column(
+                pandas_engine.DateTime(
+                    to_datetime_kwargs={
+                        "format": date_object[1]
+                    }
+                )
+            )
+
+        # Add dimension rules
+        for col in self.dimensions:
+            rules[col] = pandera.Column(
+                str,
+                nullable=False
+            )
+
+        # Add metric rules
+        for col in self.metrics:
+            rules[col] = pandera.Column(
+                float,
+                nullable=True
+            )
+
+        return pandera.DataFrameSchema(
+            rules,
+            strict=True,
+            coerce=True,
+            unique=self.keys() or None,
+            report_duplicates='all'
+        )
+
+
+# Define the streaming schema validator `class`
+class Validator():
+    """ A `class` that validates the chunks of a datafile against a `Contract`, keeping the checks that
+    span the entire datafile as streaming state. The uniqueness of the rows across chunks is checked
+    against the sorted 64-bit hashes of the keys of the preceding rows, for both `pandas.DataFrame` and
+    `pyarrow.Table` chunks.
+    """
+
+    # Define the number of leading rows that are retained for the data-preview
+    preview: int = 5
+
+    def __init__(
+        self,
+        contract: Contract
+    ):
+        """ Initializes an instance of the streaming schema validator `class`.
+
+        Parameters
+        ----------
+        contract : `Contract`
+            The `data contract` of the datafile.
+        """
+
+        # Assign class variables
+        self.contract: Contract = contract
+        self.schema: pandera.DataFrameSchema = contract.schema()
+        self.rows: int = 0
+        self.head: pandas.DataFrame = pandas.DataFrame()
+
+        # Assign streaming state
+        self._keys: numpy.ndarray = numpy.empty(0, dtype=numpy.uint64)
+        self._rows: numpy.ndarray = numpy.empty(0, dtype=numpy.int64)
+        self._values: List[pandas.DataFrame] = []
+        self._offsets: List[int] = []
+
+    def stream(
+        self,
+        chunks: Iterable[Union[pandas.DataFrame, 'pyarrow.Table']]
+    ) -> Iterator[Union[pandas.DataFrame, 'pyarrow.Table']]:
+        """ Validates and yields each chunk of a datafile as it is consumed, as an
+        `Iterator[Union[pandas.DataFrame, pyarrow.Table]]`. Raises `InvalidSchema` with the failure cases
+        of the first invalid chunk, or when the datafile is empty.
+
+        Parameters
+        ----------
+        chunks : `Iterable[Union[pandas.DataFrame, pyarrow.Table]]`
+            The chunks of the datafile.
+        """
+        for chunk in chunks:
+            if isinstance(chunk, pandas.DataFrame):
+                yield self.validate(chunk=chunk)
+            else:
+                yield self.validate_table(table=chunk)
+
+        # Check that the datafile is not empty
+        if self.rows == 0:
+            raise _exceptions.InvalidSchema(
+                failure_cases=failures(
+                    column=[None],
+                    check='not_empty',
+                    failure_case=[False],
+                    index=[None]
+                )
+            )
+
+    def validate(
+        self,
+        chunk: pandas.DataFrame
+    ) -> pandas.DataFrame:
+        """ Validates a chunk of a datafile and returns it, with formatted date-time dimensions, as a
+        `pandas.DataFrame`. Raises `InvalidSchema` with the failure cases of the chunk.
+
+        Parameters
+        ----------
+        chunk : `pandas.DataFrame`
+            The chunk of the datafile.
+        """
+
+        chunk = self.coerce(chunk=chunk)
+
+        # Check that the keys are unique across chunks
+        keys = self.contract.keys()
+        if keys:
+            positions = self._update_keys(keys=chunk[keys])
+
+            if len(positions):
+                duplicates = chunk[keys].iloc[positions]
+                raise _exceptions.InvalidSchema(
+                    failure_cases=failures(
+                        column=numpy.repeat(keys, len(duplicates)),
+                        check='multiple_fields_uniqueness',
+                        failure_case=numpy.concatenate([duplicates[col].to_numpy(dtype=object) for col in keys]),
+                        index=numpy.tile(duplicates.index.to_numpy(), len(keys))
+                    )
+                )
+
+        # Update the streaming state
+        if self.rows == 0:
+            self.head = chunk.head(self.preview)
+        self.rows += len(chunk)
+
+        return chunk
+
+    def coerce(
+        self,
+        chunk: pandas.DataFrame
+    ) -> pandas.DataFrame:
+        """ Applies the schema to a chunk of a datafile and returns it, with formatted date-time dimensions,
+        as a `pandas.DataFrame`. Raises `InvalidSchema` with the failure cases of the chunk.
+
+        Parameters
+        ----------
+        chunk : `pandas.DataFrame`
+            The chunk of the datafile.
+        """
+
+        # Confirm the date-time formats inferred from the leading sample
+        for col, fmt in self.contract.datetime:
+            if col in chunk.columns:
+                values = chunk[col].dropna().astype(str)
+                mismatched = values[~values.str.match(_dataframe.DATETIME_PATTERNS[fmt].pattern)]
+                if not mismatched.empty:
+                    raise _exceptions.InvalidSchema(
+                        failure_cases=failures(
+                            column=[col] * len(mismatched),
+                            check="datetime_format('%s')" % (fmt),
+                            failure_case=mismatched.to_numpy(dtype=object),
+                            index=mismatched.index.to_numpy()
+                        )
+                    )
+
+        # Apply schema
+        try:
+            chunk = self.schema.validate(chunk, lazy=True)
+        except pandera.errors.SchemaErrors as e:
+            raise _exceptions.InvalidSchema(failure_cases=e.failure_cases) from e
+
+        # Apply datetime formatting
+        for date_object in self.contract.datetime:
+            chunk[date_object[0]] = chunk[date_object[0]].dt.strftime(date_object[1])
+
+        return chunk
+
+    def validate_table(
+        self,
+        table: 'pyarrow.Table'
+    ) -> 'pyarrow.Table':
+        """ Validates a chunk of a datafile with Arrow compute kernels and returns it, with formatted date-time
+        dimensions, as a `pyarrow.Table`. Chunks that fail a check are coerced with `coerce`, which raises
+        `InvalidSchema` with the failure cases of the chunk.
+
+        Parameters
+        ----------
+        table : `pyarrow.Table`
+            The chunk of the datafile.
+        """
+        coerced = self._coerce_table(table=table)
+        if coerced is None:
+            chunk = table.to_pandas()
+            chunk.index = pandas.RangeIndex(self.rows, self.rows + len(chunk))
+            coerced = pyarrow.Table.from_pandas(self.coerce(chunk=chunk), preserve_index=False)
+
+        # Check that the keys are unique across chunks
+        keys = self.contract.keys()
+        if keys:
+            positions = self._update_keys(keys=coerced.select(keys).to_pandas())
+
+            if len(positions):
+                duplicates = coerced.take(positions)
+                raise _exceptions.InvalidSchema(
+                    failure_cases=failures(
+                        column=numpy.repeat(keys, len(positions)),
+                        check='multiple_fields_uniqueness',
+                        failure_case=[value for col in keys for value in duplicates[col].to_pylist()],
+                        index=numpy.tile(positions + self.rows, len(keys))
+                    )
+                )
+
+        # Update the streaming state
+        if self.rows == 0:
+            self.head = coerced.slice(0, self.preview).to_pandas()
+        self.rows += coerced.num_rows
+
+        return coerced
+
+    def _update_keys(
+        self,
+        keys: pandas.DataFrame
+    ) -> numpy.ndarray:
+        """ Returns the positions of the rows of a chunk whose keys equal the keys of a preceding row as a
+        `numpy.ndarray`. Rows are matched by the 64-bit hash of their keys, and each match is confirmed
+        against the key values of the preceding rows, so that a hash collision is not reported as a duplicate.
+        When there are none, the hashes of the chunk are merged into the sorted hashes of the preceding rows.
+
+        Parameters
+        ----------
+        keys : `pandas.DataFrame`
+            The formatted keys of the chunk of the datafile.
+        """
+        hashes = pandas.util.hash_pandas_object(keys, index=False).to_numpy()
+        start = numpy.searchsorted(self._keys, hashes, side='left')
+        stop = numpy.searchsorted(self._keys, hashes, side='right')
+
+        # Confirm each hash match against the key values of the preceding rows with the same hash
+        duplicated = numpy.zeros(len(hashes), dtype=bool)
+        for position in numpy.flatnonzero(stop > start):
+            value = keys.iloc[position].tolist()
+            duplicated[position] = any(
+                _equal(self._value(row=row), value) for row in self._rows[start[position]:stop[position]]
+            )
+
+        if not duplicated.any():
+            order = numpy.argsort(hashes, kind='stable')
+            position = numpy.searchsorted(self._keys, hashes[order])
+            self._keys = numpy.insert(self._keys, position, hashes[order])
+            self._offsets += [len(self._rows)]
+            self._rows = numpy.insert(self._rows, position, self._offsets[-1] + order)
+            self._values += [keys]
+
+        return numpy.flatnonzero(duplicated)
+
+    def _value(
+        self,
+        row: int
+    ) -> list:
+        """ Returns the key values of a preceding row as a `list`.
+
+        Parameters
+        ----------
+        row : `int`
+            The position of the row within the datafile.
+        """
+        chunk = bisect.bisect_right(self._offsets, row) - 1
+        return self._values[chunk].iloc[row - self._offsets[chunk]].tolist()
+
+    def _coerce_table(
+        self,
+        table: 'pyarrow.Table'
+    ) -> Union['pyarrow.Table', None]:
+        """ Applies the schema to a chunk of a datafile with Arrow compute kernels and returns it, with formatted
+        date-time dimensions, as a `pyarrow.Table`, or `None` when the chunk fails a check.
+        """
+        if sorted(table.column_names) != sorted(self.contract.keys() + self.contract.metrics):
+            return None
+
+        columns = {}
+        try:
+
+            # Parse and format the date-time dimensions
+            for col, fmt in self.contract.datetime:
+                if not (pyarrow.types.is_string(table[col].type) or pyarrow.types.is_large_string(table[col].type)):
+                    return None
+                if not pyarrow.compute.all(
+                    pyarrow.compute.match_substring_regex(table[col], pattern=_dataframe.DATETIME_PATTERNS[fmt].pattern)
+                ).as_py():
+                    return None
+                parsed = pyarrow.compute.strptime(table[col], format=fmt, unit='s', error_is_null=True)
+                if parsed.null_count:
+                    return None
+                columns[col] = pyarrow.compute.strftime(parsed, format=fmt)
+
+            # Check the categorical dimensions
+            for col in self.contract.dimensions:
+                if table[col].null_count:
+                    return None
+                if pyarrow.types.is_boolean(table[col].type):
+                    columns[col] = pyarrow.compute.if_else(table[col], 'True', 'False')
+                elif pyarrow.types.is_string(table[col].type) or pyarrow.types.is_large_string(table[col].type):
+                    columns[col] = table[col]
+                else:
+                    return None
+
+            # Cast the metrics
+            for col in self.contract.metrics:
+                columns[col] = table[col].cast(pyarrow.float64())
+
+        except (pyarrow.ArrowInvalid, pyarrow.ArrowNotImplementedError):
+            return None
+
+        table = pyarrow.table({col: columns[col] for col in table.column_names})
+
+        # Check that the keys are unique within the chunk
+        keys = self.contract.keys()
+        if keys and pyarrow.compute.count_distinct(join(table=table, columns=keys)).as_py() < table.num_rows:
+            return None
+
+        return table
+
+
+def join(
+    table: 'pyarrow.Table',
+    columns: List[str]
+) -> 'pyarrow.Array':
+    """ Returns the values of `columns` of each row, joined by `SEPARATOR`, as a `pyarrow.Array`.
+
+    Parameters
+    ----------
+    table : `pyarrow.Table`
+        The chunk of a datafile.
+    columns : `List[str]`
+        Names of the text columns to join.
+    """
+    return pyarrow.compute.binary_join_element_wise(
+        *[table[col].cast(pyarrow.string()) for col in columns],
+        SEPARATOR
+    ).combine_chunks()
+
+
+def failures(
+    column: Iterable,
+    check: str,
+    failure_case: Iterable,
+    index: Iterable
+) -> pandas.DataFrame:
+    """ Returns the failure cases of a check that spans the entire datafile as a `pandas.DataFrame`,
+    with the columns of `pandera.errors.SchemaErrors.failure_cases`.
+
+    Parameters
+    ----------
+    column : `Iterable`
+        Name of the column of each failure case.
+    check : `str`
+        Name of the check.
+    failure_case : `Iterable`
+        The value of each failure case.
+    index : `Iterable`
+        The index of the row of each failure case.
+    """
+    return pandas.DataFrame({
+        'schema_context': 'DataFrameSchema',
+        'column': list(column),
+        'check': check,
+        'check_number': None,
+        'failure_case': list(failure_case),
+        'index': list(index)
+    }, columns=FAILURE_CASES)
+
+
+def _equal(
+    a: list,
+    b: list
+) -> bool:
+    """ Returns `True` when the key values `a` and `b` are equal, where missing values are equal, as a `bool`.
+
+    Parameters
+    ----------
+    a : `list`
+        The key values of a row.
+    b : `list`
+        The key values of another row.
+    """
+    return all((x == y) or (pandas.isna(x) and pandas.isna(y)) for x, y in zip(a, b))
@@ -1,6 +1,6 @@
 """ `pandas` based data aggregator """
 
-from typing import Literal, List, Union
+from typing import Any, Literal, List, Union
 import pandas
 from assemblit.toolkit import _exceptions
 
@@ -17,8 +17,29 @@ AGGRULES = {
 }
 
 
+def parse_aggrules(
+    aggrules: List[str]
+) -> List[str]:
+    """ Returns the `pandas` aggregation function names of `aggrules` as a `list`.
+
+    Parameters
+    ----------
+    aggrules : `List[str]`
+        Ordered list of aggregation rules, the keys of `AGGRULES`.
+    """
+    try:
+        return [AGGRULES[r] for r in aggrules]
+    except KeyError:
+        raise _exceptions.InvalidAggregationRule(
+            "Invalid agg. rule(s) {%s}. Acceptable agg. rules are [%s]." % (
+                aggrules[0],
+                ', '.join(list(AGGRULES.keys()))
+            )
+        )
+
+
 def agg_df(
-    df: pandas.DataFrame,
+    df: Union[pandas.DataFrame, Any],
     datetime: Union[list, None] = None,
     dimension: Union[list, None] = None,
     metrics: Union[list, None] = None,
@@ -34,8 +55,10 @@ def agg_df(
 
     Parameters
     ----------
-    df : `pandas.DataFrame`
-        Pandas dataframe object to aggregate.
+    df : `Union[pandas.DataFrame, Any]`
+        Pandas dataframe object to aggregate, or a stored dataset reference, e.g.,
+            `assemblit._database._datasets.Reference`, which is aggregated with a group-by query
+            where it is stored, falling back to `pandas` for the agg. rules that the storage lacks.
     datetime : `Union[list, None]`
         Ordered list of the date-time columns in `df`.
     dimension : `Union[list, None]`
@@ -46,17 +69,18 @@ def agg_df(
         Ordered list of aggregation rules that determine the aggregation of the `metrics`.
     """
 
-    # Parse aggregation rules
-    try:
-        aggrules = [AGGRULES[r] for r in aggrules]
-    except KeyError:
-        raise _exceptions.InvalidAggregationRule(
-            "Invalid agg. rule(s) {%s}. Acceptable agg. rules are [%s]." % (
-                aggrules[0],
-                ', '.join(list(AGGRULES.keys()))
-            )
+    # Aggregate a stored dataset reference where it is stored
+    if not isinstance(df, pandas.DataFrame):
+        return df.agg_df(
+            datetime=datetime,
+            dimension=dimension,
+            metrics=metrics,
+            aggrules=aggrules
         )
 
+    # Parse aggregation rules
+    aggrules = parse_aggrules(aggrules=aggrules)
+
     # Build aggregation rules
     f = {
         key: val for (key, val) in zip(
@@ -113,7 +137,7 @@ def agg_df(
 
 
 def describe_df(
-    df: pandas.DataFrame,
+    df: Union[pandas.DataFrame, Any],
     dimension: Union[list, None] = None,
     metrics: Union[list, None] = None,
     aggrules: Union[
@@ -128,8 +152,9 @@ def describe_df(
 
     Parameters
     ----------
-    df : `pandas.DataFrame`
-        Pandas dataframe object to describe.
+    df : `Union[pandas.DataFrame, Any]`
+        Pandas dataframe object to describe, or a stored dataset reference, e.g.,
+            `assemblit._database._datasets.Reference`.
     dimension : `Union[list, None]`
         Ordered list of categorical columns in `df` to group the records.
     metrics : `Union[list, None]`
@@ -138,6 +163,14 @@ def describe_df(
         Ordered list of aggregation rules that determine the aggregation of the `metrics`.
     """
 
+    # Describe a stored dataset reference where it is stored
+    if not isinstance(df, pandas.DataFrame):
+        return df.describe_df(
+            dimension=dimension,
+            metrics=metrics,
+            aggrules=aggrules
+        )
+
     # Create a copy to describe
     descriptives_df: pandas.DataFrame = df.copy()
 
@@ -1,6 +1,6 @@
 """ `plotly` based plotting """
 
-from typing import Literal, List, Union
+from typing import Any, Literal, List, Union
 import pandas
 import plotly.express
 import plotly.graph_objects
@@ -8,7 +8,7 @@ from assemblit.toolkit import aggregator
 
 
 def timeseries_line_plot(
-    df: pandas.DataFrame,
+    df: Union[pandas.DataFrame, Any],
     datetime: Union[list, None] = None,
     dimension: Union[list, None] = None,
     metrics: Union[list, None] = None,
@@ -23,8 +23,9 @@ def timeseries_line_plot(
 
     Parameters
     ----------
-    df : `pandas.DataFrame`
-        Pandas dataframe object to plot.
+    df : `Union[pandas.DataFrame, Any]`
+        Pandas dataframe object to plot, or a stored dataset reference, e.g.,
+            `assemblit._database._datasets.Reference`, which is aggregated where it is stored.
     datetime : `Union[list, None]`
         Ordered list of the date-time columns in `df`.
     dimension : `Union[list, None]`
@@ -35,15 +36,18 @@ def timeseries_line_plot(
         Ordered list of aggregation rules that determine the aggregation of the `metrics`.
     """
 
+    # Aggregate
+    df = aggregator.agg_df(
+        df=df,
+        datetime=datetime,
+        dimension=dimension if dimension else None,
+        metrics=metrics,
+        aggrules=aggrules
+    )
+
     if dimension:
         return plotly.express.line(
-            data_frame=aggregator.agg_df(
-                df=df,
-                datetime=datetime,
-                dimension=dimension,
-                metrics=metrics,
-                aggrules=aggrules
-            ),
+            data_frame=df,
             x=datetime[0][0],
             y=metrics,
             line_group=dimension[0],
@@ -59,13 +63,7 @@ def timeseries_line_plot(
         )
     else:
         return plotly.express.line(
-            data_frame=aggregator.agg_df(
-                df=df,
-                datetime=datetime,
-                dimension=None,
-                metrics=metrics,
-                aggrules=aggrules
-            ),
+            data_frame=df,
             x=datetime[0][0],
             y=metrics
         ).update_layout(
@@ -80,7 +78,7 @@ def timeseries_line_plot(
 
 
 def descriptives_table(
-    df: pandas.DataFrame,
+    df: Union[pandas.DataFrame, Any],
     dimension: Union[list, None] = None,
     metrics: Union[list, None] = None,
     aggrules: Union[
@@ -94,8 +92,9 @@ def descriptives_table(
 
     Parameters
     ----------
-    df : `pandas.DataFrame`
-        Pandas dataframe object to plot.
+    df : `Union[pandas.DataFrame, Any]`
+        Pandas dataframe object to plot, or a stored dataset reference, e.g.,
+            `assemblit._database._datasets.Reference`, which is aggregated where it is stored.
     dimension : `Union[list, None]`
         Ordered list of categorical columns in `df` to group the records.
     metrics : `Union[list, None]`
@@ -0,0 +1,174 @@
+""" Benchmarks the database performance profiles
+
+Runs a mixed workload of concurrent reader and writer threads against a fresh
+database for each performance profile within `assemblit._database._profiles`,
+as well as the sqlite3 defaults, and reports the throughput of each.
+
+Usage
+-----
+python -m benchmarks.sqlite_profiles --readers 8 --writers 4 --duration 5
+"""
+
+import os
+import time
+import random
+import sqlite3
+import argparse
+import tempfile
+import threading
+from typing import Dict, Union
+from assemblit._database import _profiles
+
+# Define benchmark defaults
+ROWS: int = 10000
+
+
+def setup(
+    database: str,
+    profile: Union[_profiles.Profile, None]
+):
+    """ Creates and populates the benchmark table.
+
+    Parameters
+    ----------
+    database : `str`
+        Local file path of the database.
+    profile : `Union[_profiles.Profile, None]`
+        The database performance profile, or `None` for the sqlite3 defaults.
+    """
+    connection = connect(database=database, profile=profile)
+    connection.execute(
+        'CREATE TABLE IF NOT EXISTS data (id INTEGER PRIMARY KEY, session_id TEXT, value TEXT);'
+    )
+    connection.execute('CREATE INDEX IF NOT EXISTS data_session_id ON data (session_id);')
+    connection.executemany(
+        'INSERT INTO data (session_id, value) VALUES (?, ?);',
+        [('session-%s' % (i % 100), 'value-%s' % i) for i in range(ROWS)]
+    )
+    connection.commit()
+    connection.close()
+
+
+def connect(
+    database: str,
+    profile: Union[_profiles.Profile, None]
+) -> sqlite3.Connection:
+    """ Opens a sqlite3-connection and applies the database performance profile.
+
+    Parameters
+    ----------
+    database : `str`
+        Local file path of the database.
+    profile : `Union[_profiles.Profile, None]`
+        The database performance profile, or `None` for the sqlite3 defaults.
+    """
+    connection = sqlite3.connect(database, check_same_thread=False)
+    if profile is not None:
+        profile.apply(connection=connection)
+    return connection
+
+
+def run(
+    profile: Union[_profiles.Profile, None],
+    readers: int,
+    writers: int,
+    duration: float
+) -> Dict[str, float]:
+    """ Runs the mixed workload and returns the throughput as a `dict`.
+
+    Parameters
+    ----------
+    profile : `Union[_profiles.Profile, None]`
+        The database performance profile, or `None` for the sqlite3 defaults.
+    readers : `int`
+        The number of concurrent reader threads.
+    writers : `int`
+        The number of concurrent writer threads.
+    duration : `float`
+        The number of seconds to run the workload.
+    """
+    with tempfile.TemporaryDirectory() as dir_name:
+        database = os.path.join(dir_name, 'benchmark.db')
+        setup(database=database, profile=profile)
+
+        counts = {'reads': 0, 'writes': 0, 'errors': 0}
+        lock = threading.Lock()
+        stop = threading.Event()
+
+        def read():
+            connection = connect(database=database, profile=profile)
+            reads, errors = 0, 0
+            while not stop.is_set():
+                try:
+                    connection.execute(
+                        'SELECT COUNT(*), MAX(value) FROM data WHERE session_id = ?;',
+                        ['session-%s' % random.randrange(100)]
+                    ).fetchall()
+                    reads += 1
+                except sqlite3.OperationalError:
+                    errors += 1
+            connection.close()
+            with lock:
+                counts['reads'] += reads
+                counts['errors'] += errors
+
+        def write():
+            connection = connect(database=database, profile=profile)
+            writes, errors = 0, 0
+            while not stop.is_set():
+                try:
+                    connection.execute(
+                        'UPDATE data SET value = ? WHERE id = ?;',
+                        ['value-%s' % time.monotonic(), random.randrange(1, ROWS)]
+                    )
+                    connection.commit()
+                    writes += 1
+                except sqlite3.OperationalError:
+                    connection.rollback()
+                    errors += 1
+            connection.close()
+            with lock:
+                counts['writes'] += writes
+                counts['errors'] += errors
+
+        threads = (
+            [threading.Thread(target=read) for _ in range(readers)]
+            + [threading.Thread(target=write) for _ in range(writers)]
+        )
+        for thread in threads:
+            thread.start()
+        time.sleep(duration)
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+    return {
+        'reads/s': counts['reads'] / duration,
+        'writes/s': counts['writes'] / duration,
+        'errors': counts['errors']
+    }
+
+
+def main():
+    """ Runs the benchmark for each database performance profile. """
+    parser = argparse.ArgumentParser(description='Benchmarks the `assemblit` database performance profiles.')
+    parser.add_argument('--readers', type=int, default=8, help='The number of concurrent reader threads.')
+    parser.add_argument('--writers', type=int, default=4, help='The number of concurrent writer threads.')
+    parser.add_argument('--duration', type=float, default=5.0, help='The number of seconds to run each workload.')
+    args = parser.parse_args()
+
+    profiles = {'sqlite3-defaults': None, **_profiles.PROFILES}
+
+    print('%-18s %12s %12s %8s' % ('profile', 'reads/s', 'writes/s', 'errors'))
+    for name, profile in profiles.items():
+        result = run(
+            profile=profile,
+            readers=args.readers,
+            writers=args.writers,
+            duration=args.duration
+        )
+        print('%-18s %12.0f %12.0f %8d' % (name, result['reads/s'], result['writes/s'], result['errors']))
+
+
+if __name__ == '__main__':
+    main()
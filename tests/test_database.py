@@ -0,0 +1,1197 @@
+""" Tests the `assemblit._database` subpackage """
+
+import io
+import os
+import json
+import hashlib
+import datetime
+import sqlite3
+import threading
+import contextlib
+import pytest
+import numpy
+import pandas as pd
+import pandera
+from assemblit.toolkit import _exceptions, _ingestion, aggregator
+from assemblit._database import (
+    _analytics, _cache, _cascade, _datasets, _generic, _pool, _profiles, _storage, _syntax, _trace, _writer
+)
+from assemblit._database._structures import DatasetMetadata, Filter, Row, Value
+
+
+@pytest.fixture
+def SCHEMA_FIXTURE() -> _generic.Schema:
+    return _generic.Schema(
+        name='test',
+        columns={
+            'id': pandera.Column(str, nullable=False, unique=True, metadata={'primary_key': True}),
+            'name': pandera.Column(str, nullable=False, unique=False),
+            'value': pandera.Column(str, nullable=True, unique=False)
+        }
+    )
+
+
+@pytest.fixture
+def DB_FIXTURE(tmp_path, SCHEMA_FIXTURE: _generic.Schema) -> _generic.Connection:
+    Database = _generic.Connection(db_name='test', dir_name=str(tmp_path))
+    Database.create_table(table_name='test', schema=SCHEMA_FIXTURE)
+    yield Database
+    Database.close()
+    _pool.dispose()
+
+
+def test_pool_reuses_connection_within_thread(DB_FIXTURE: _generic.Connection):
+    Database = _generic.Connection(db_name='test', dir_name=DB_FIXTURE.dir_name)
+    assert Database.conn is DB_FIXTURE.conn
+    assert DB_FIXTURE.statistics()['created'] == 1
+    Database.close()
+    assert DB_FIXTURE.conn.leases == 1
+
+
+def test_pool_returns_connection_on_close(DB_FIXTURE: _generic.Connection):
+    connection = DB_FIXTURE.conn
+    DB_FIXTURE.close()
+    statistics = _pool.get_pool(database=connection.pool.database).statistics()
+    assert statistics['idle'] == 1
+    assert statistics['in_use'] == 0
+
+    # Re-acquire the idle connection
+    Database = _generic.Connection(db_name='test', dir_name=DB_FIXTURE.dir_name)
+    assert Database.conn is connection
+    Database.close()
+
+
+def test_pool_size_is_configurable_and_released_on_context_exit(tmp_path, monkeypatch):
+    monkeypatch.setenv('ASSEMBLIT_DB_POOL_SIZE', '2')
+    with _generic.Connection(db_name='sized', dir_name=str(tmp_path)) as Database:
+        assert Database.pool.max_size == 2
+        assert Database.statistics()['in_use'] == 1
+    assert Database.conn is None
+    assert Database.pool.statistics()['in_use'] == 0
+    _pool.dispose()
+
+    monkeypatch.setenv('ASSEMBLIT_DB_POOL_SIZE', 'many')
+    with pytest.raises(ValueError):
+        _pool.Pool(database=str(tmp_path / 'invalid.db'))
+
+
+def test_pool_timeout(tmp_path):
+    pool = _pool.Pool(database=str(tmp_path / 'timeout.db'), max_size=1, timeout=0.05)
+    connection = pool.acquire()
+
+    errors = []
+
+    def acquire():
+        try:
+            pool.acquire()
+        except _pool.PoolTimeout as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=acquire)
+    thread.start()
+    thread.join()
+
+    assert errors
+    assert pool.statistics()['timeouts'] == 1
+    pool.release(connection=connection)
+    pool.dispose()
+
+
+def test_insert_and_select_success(DB_FIXTURE: _generic.Connection):
+    with contextlib.closing(DB_FIXTURE.connection()) as connection:
+        assert connection is DB_FIXTURE.conn
+    DB_FIXTURE.insert(
+        table_name='test',
+        row=Row(cols=['id', 'name', 'value'], vals=['1', "O'Brien", 'A'])
+    )
+    assert DB_FIXTURE.select_table_column_value(
+        table_name='test',
+        col='name',
+        filtr=Filter(col='id', val='1')
+    ) == "O'Brien"
+    assert DB_FIXTURE.conn.leases == 1
+
+
+def test_values_are_bound_natively(tmp_path):
+    Database = _generic.Connection(db_name='typed', dir_name=str(tmp_path))
+    Database.create_table(
+        table_name='typed',
+        schema=_generic.Schema(
+            name='typed',
+            columns={
+                'id': pandera.Column(str, nullable=False, unique=True, metadata={'primary_key': True}),
+                'final': pandera.Column(bool, nullable=False, unique=False),
+                'version': pandera.Column(int, nullable=False, unique=False),
+                'size_mb': pandera.Column(float, nullable=False, unique=False),
+                'created_on': pandera.Column(datetime.datetime, nullable=False, unique=False),
+                'run_time': pandera.Column(datetime.timedelta, nullable=True, unique=False)
+            }
+        )
+    )
+    created_on = datetime.datetime(2024, 1, 2, 3, 4, 5)
+    Database.insert(
+        table_name='typed',
+        row=Row(
+            cols=['id', 'final', 'version', 'size_mb', 'created_on', 'run_time'],
+            vals=['1', False, numpy.int64(2), 0.5, created_on, datetime.timedelta(seconds=90.5)]
+        )
+    )
+    Database.update(table_name='typed', value=Value(col='final', val=numpy.bool_(True)), filtr=Filter(col='id', val='1'))
+
+    assert Database.execute(
+        query='SELECT typeof(final), typeof(version), typeof(size_mb), typeof(run_time) FROM typed;'
+    ).fetchone() == ('integer', 'integer', 'real', 'real')
+    assert Database.execute(query='SELECT final, created_on, run_time FROM typed;').fetchone() == (
+        True, created_on, datetime.timedelta(seconds=90.5)
+    )
+    assert Database.select_table_column_value(
+        table_name='typed', col='final', filtr=Filter(col='id', val='1'), return_dtype='bool'
+    ) is True
+    assert Database.select_table_column_value(
+        table_name='typed', col='version', filtr=Filter(col='id', val='1'), return_dtype='int'
+    ) == 2
+
+    # Date-time ranges compare natively, and booleans written as text by earlier versions are converted
+    assert Database.execute(
+        query='SELECT COUNT(*) FROM typed WHERE created_on BETWEEN ? AND ?;',
+        params=[datetime.datetime(2024, 1, 1), datetime.date(2024, 1, 3)]
+    ).fetchone() == (1,)
+    Database.execute(query="UPDATE typed SET final = 'False';")
+    assert Database.execute(query='SELECT final FROM typed;').fetchone() == (False,)
+    assert _syntax.Literal.param({'a': 1}) == "{'a': 1}" and _syntax.Literal.param(pd.NaT) is None
+    Database.close()
+    _pool.dispose()
+
+
+def test_datasets_are_read_without_declared_type_converters(DB_FIXTURE: _generic.Connection):
+    DB_FIXTURE.create_table(table_name=_datasets.TABLE_NAME, schema=_datasets.schema(query_index='id'))
+    df = pd.DataFrame({
+        'ts': pd.to_datetime(['2024-01-02 03:04:05']).tz_localize('UTC'),
+        'day': [datetime.date(2024, 1, 2)]
+    })
+    _datasets.write(Database=DB_FIXTURE, query_index='id', dataset_id='dataset-1', df=df, engine='sqlite')
+
+    # `pandas` declares `TIMESTAMP` and `DATE` columns, whose values may not be ISO-formatted
+    DB_FIXTURE.execute(query="INSERT INTO \"dataset-1\" VALUES ('01/02/2024', '2024-01-03');")
+    pd.testing.assert_frame_equal(
+        _datasets.read(Database=DB_FIXTURE, query_index='id', dataset_id='dataset-1'),
+        pd.DataFrame({'ts': ['2024-01-02 03:04:05+00:00', '01/02/2024'], 'day': ['2024-01-02', '2024-01-03']})
+    )
+    assert DB_FIXTURE.reader.pool is not DB_FIXTURE.pool
+
+
+def test_booleans_keep_their_text_form_in_legacy_columns(DB_FIXTURE: _generic.Connection):
+
+    # Tables created by earlier versions declare boolean columns as `TEXT`
+    DB_FIXTURE.execute(query='CREATE TABLE legacy (id TEXT PRIMARY KEY, final TEXT);')
+    DB_FIXTURE.execute(query="INSERT INTO legacy VALUES ('1', 'True');")
+    DB_FIXTURE.execute(query="INSERT INTO legacy VALUES ('3', '0');")
+    DB_FIXTURE.invalidate_catalog()
+
+    DB_FIXTURE.insert(table_name='legacy', row=Row(cols=['id', 'final'], vals=['2', numpy.bool_(False)]))
+    DB_FIXTURE.update(table_name='legacy', value=Value(col='final', val=False), filtr=Filter(col='id', val='1'))
+    assert DB_FIXTURE.update_columns(
+        table_name='legacy', values=[Value(col='final', val=False)], filtr=Filter(col='id', val='2')
+    ) == []
+    assert DB_FIXTURE.execute(query='SELECT final FROM legacy ORDER BY id;').fetchall() == [('False',), ('False',), ('0',)]
+    assert DB_FIXTURE.select_table_column_value(
+        table_name='legacy', col='final', filtr=Filter(col='id', val=['1', '2', '3']), return_dtype='bool', multi=True
+    ) == [False, False, False]
+
+
+def test_statement_arity_bucket():
+    assert [_syntax.Statement.bucket(arity=i) for i in [0, 1, 2, 3, 5, 8, 9]] == [0, 1, 2, 4, 8, 8, 16]
+    assert _syntax.Statement.params(values=['a', 'b', 'c']) == ['a', 'b', 'c', 'c']
+    assert _syntax.Statement.params(values=True) == [True]
+
+
+def test_statement_shape_cached():
+    assert _syntax.Statement.select(
+        table_name='test', cols=('name',), col='id', arity=4
+    ) is _syntax.Statement.select(
+        table_name='test', cols=('name',), col='id', arity=4
+    )
+    assert _syntax.Statement.delete(table_name='test', col='id', arity=2) == 'DELETE FROM test WHERE id IN (?, ?);'
+
+
+def test_parameterized_in_list_and_delete(DB_FIXTURE: _generic.Connection):
+    for i in range(3):
+        DB_FIXTURE.insert(
+            table_name='test',
+            row=Row(cols=['id', 'name', 'value'], vals=[str(i), 'name-%s' % i, None])
+        )
+    assert DB_FIXTURE.select_table_column_value(
+        table_name='test',
+        col='id',
+        filtr=Filter(col='id', val=['0', '1', '2']),
+        multi=True
+    ) == ['0', '1', '2']
+    assert DB_FIXTURE.table_record_exists(table_name='test', filtr=Filter(col='id', val=['2', "'; DROP TABLE test; --"]))
+
+    DB_FIXTURE.delete_table_column_value(table_name='test', filtr=Filter(col='id', val=['0', '1']))
+    assert DB_FIXTURE.select_table_column_value(
+        table_name='test',
+        col='value',
+        filtr=Filter(col='id', val='2')
+    ) == 'None'
+    assert DB_FIXTURE.select_num_table_records(table_name='test', filtr=Filter(col='name', val='name-2')) == 1
+
+
+def test_profile_applied_on_open(DB_FIXTURE: _generic.Connection):
+    assert DB_FIXTURE.execute(query='PRAGMA journal_mode;').fetchone()[0] == 'wal'
+    assert DB_FIXTURE.execute(query='PRAGMA busy_timeout;').fetchone()[0] == _profiles.PROFILES['default'].busy_timeout
+
+
+def test_profile_from_environment(monkeypatch):
+    monkeypatch.setenv(_profiles.ENVIRONMENT_VARIABLE, 'bulk-load')
+    assert _profiles.get_profile() is _profiles.PROFILES['bulk-load']
+    assert _profiles.get_profile(name='Concurrent') is _profiles.PROFILES['concurrent']
+    with pytest.raises(ValueError):
+        _profiles.get_profile(name='not-a-profile')
+
+
+def test_transaction_commits_once(DB_FIXTURE: _generic.Connection):
+    with DB_FIXTURE.transaction():
+        for i in range(3):
+            DB_FIXTURE.insert(
+                table_name='test',
+                row=Row(cols=['id', 'name', 'value'], vals=[str(i), 'name', 'A'])
+            )
+        with DB_FIXTURE.transaction():
+            DB_FIXTURE.update(table_name='test', value=Value(col='value', val='B'), filtr=Filter(col='id', val='0'))
+        assert DB_FIXTURE.conn.in_transaction
+    assert not DB_FIXTURE.conn.in_transaction
+    assert DB_FIXTURE.select_table_column_value(table_name='test', col='value', filtr=Filter(col='id', val='0')) == 'B'
+
+
+def test_transaction_rolls_back_on_error(DB_FIXTURE: _generic.Connection):
+    with pytest.raises(ValueError):
+        with DB_FIXTURE.transaction():
+            DB_FIXTURE.insert(
+                table_name='test',
+                row=Row(cols=['id', 'name', 'value'], vals=['1', 'name', 'A'])
+            )
+            raise ValueError
+    assert not DB_FIXTURE.table_record_exists(table_name='test', filtr=Filter(col='id', val='1'))
+    assert DB_FIXTURE.conn.depth == 0
+    assert DB_FIXTURE.conn.leases == 1
+
+
+def test_insert_many_rows_and_mapping(DB_FIXTURE: _generic.Connection):
+    assert DB_FIXTURE.insert_many(
+        table_name='test',
+        rows=(Row(cols=['id', 'name', 'value'], vals=[str(i), 'name', 'A']) for i in range(100))
+    ) == 100
+    assert DB_FIXTURE.insert_many(
+        table_name='test',
+        rows={'value': ['B', 'B'], 'id': ['0', '100'], 'name': ['name', 'name']},
+        conflict='IGNORE'
+    ) == 1
+    assert DB_FIXTURE.select_num_table_records(table_name='test', filtr=Filter(col='name', val='name')) == 101
+    assert not DB_FIXTURE.conn.in_transaction
+
+
+def test_insert_many_rolls_back_on_invalid_row(DB_FIXTURE: _generic.Connection):
+    with pytest.raises(KeyError):
+        DB_FIXTURE.insert_many(
+            table_name='test',
+            rows=[
+                Row(cols=['id', 'name', 'value'], vals=['1', 'name', 'A']),
+                Row(cols=['name', 'id', 'value'], vals=['name', '2', 'A'])
+            ]
+        )
+    assert not DB_FIXTURE.table_record_exists(table_name='test', filtr=Filter(col='id', val='1'))
+    with pytest.raises(ValueError):
+        _syntax.Statement.insert(table_name='test', arity=3, conflict='UPSERT')
+
+
+def test_update_columns_skips_unchanged(DB_FIXTURE: _generic.Connection):
+    DB_FIXTURE.insert(
+        table_name='test',
+        row=Row(cols=['id', 'name', 'value'], vals=['1', 'name', 'A'])
+    )
+    assert DB_FIXTURE.update_columns(
+        table_name='test',
+        values=[Value(col='name', val='name'), Value(col='value', val='B')],
+        filtr=Filter(col='id', val='1')
+    ) == ['value']
+    assert DB_FIXTURE.select_multi_table_column_value(
+        table_name='test',
+        cols=['name', 'value'],
+        filtr=Filter(col='id', val='1')
+    ) == {'name': 'name', 'value': 'B'}
+    assert DB_FIXTURE.update_columns(
+        table_name='test',
+        values=[Value(col='value', val='B')],
+        filtr=Filter(col='id', val='1')
+    ) == []
+    with pytest.raises(ValueError):
+        DB_FIXTURE.update_columns(
+            table_name='test',
+            values=[Value(col='value', val='C')],
+            filtr=Filter(col='id', val='2')
+        )
+
+    # Values are compared with the affinity of the column, and nulls compare equal
+    DB_FIXTURE.insert(
+        table_name='test',
+        row=Row(cols=['id', 'name', 'value'], vals=['3', '3', None])
+    )
+    assert DB_FIXTURE.update_columns(
+        table_name='test',
+        values=[Value(col='name', val=3), Value(col='value', val=None)],
+        filtr=Filter(col='id', val='3')
+    ) == []
+    assert not DB_FIXTURE.conn.in_transaction
+
+
+def test_schema_secondary_indexes(tmp_path):
+    schema = _generic.Schema(
+        name='runs',
+        columns={
+            'run_id': pandera.Column(str, nullable=False, unique=True, metadata={'primary_key': True}),
+            'state': pandera.Column(str, nullable=True, metadata={'index': True}),
+            'created_on': pandera.Column(str, nullable=True, metadata={'index': ['state_created_on']}),
+            'submitted_by': pandera.Column(str, nullable=True, metadata={'index': 'state_created_on'})
+        }
+    )
+    assert schema.indexes() == {'state': ['state'], 'state_created_on': ['created_on', 'submitted_by']}
+
+    Database = _generic.Connection(db_name='runs', dir_name=str(tmp_path))
+    Database.create_table(table_name='runs', schema=schema)
+    Database.create_table(table_name='runs', schema=schema)
+    assert list(schema.to_sqlite_indexes(table_name='runs')) == ['runs_state_index', 'runs_state_created_on_index']
+    assert sorted(
+        i[0] for i in Database.execute(
+            query="SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL;"
+        ).fetchall()
+    ) == ['runs_state_created_on_index', 'runs_state_index']
+    Database.close()
+    _pool.dispose()
+
+
+def test_catalog_caches_table_metadata(DB_FIXTURE: _generic.Connection):
+    assert DB_FIXTURE.select_table_column_names_as_list(table_name='test') == ['id', 'name', 'value']
+    statistics = DB_FIXTURE.catalog.statistics()
+    for _ in range(3):
+        assert DB_FIXTURE.table_exists(table_name='test')
+        assert DB_FIXTURE.select_table_column_names_as_list(table_name='test') == ['id', 'name', 'value']
+        assert DB_FIXTURE.select_all_tables_with_column_name(col='name') == ['test']
+    assert DB_FIXTURE.catalog.statistics()['loads'] == statistics['loads']
+
+    # Invalidate on schema changes
+    DB_FIXTURE.to_sql(df=pd.DataFrame({'name': ['a']}), table_name='other', index=False)
+    assert DB_FIXTURE.select_all_tables_with_column_name(col='name') == ['other', 'test']
+    assert DB_FIXTURE.catalog.tables_with_column(connection=DB_FIXTURE.conn, col='name', exclude=['test']) == ['other']
+    DB_FIXTURE.drop_table(table_name='other')
+    assert not DB_FIXTURE.table_exists(table_name='other')
+    assert DB_FIXTURE.catalog.statistics()['invalidations'] == statistics['invalidations'] + 2
+
+
+def test_catalog_is_not_cached_before_schema_changes_commit(DB_FIXTURE: _generic.Connection):
+    tables = []
+
+    def lookup():
+        Database = _generic.Connection(db_name='test', dir_name=DB_FIXTURE.dir_name)
+        tables.append(Database.table_exists(table_name='test'))
+        Database.close()
+
+    with DB_FIXTURE.transaction():
+        DB_FIXTURE.drop_table(table_name='test')
+        assert not DB_FIXTURE.table_exists(table_name='test')
+
+        # Another thread reads the committed schema, which is not cached
+        thread = threading.Thread(target=lookup)
+        thread.start()
+        thread.join()
+
+    assert tables == [True]
+    assert not DB_FIXTURE.table_exists(table_name='test')
+    lookup()
+    assert tables == [True, False]
+
+
+def test_dataset_catalog_register_and_drop(DB_FIXTURE: _generic.Connection):
+    DB_FIXTURE.create_table(table_name=_datasets.TABLE_NAME, schema=_datasets.schema(query_index='id'))
+    df = pd.DataFrame({'a': [1, 2, 3], 'b': ['x', 'y', 'z']})
+    DB_FIXTURE.to_sql(df=df, table_name='dataset-1', index=False)
+    _datasets.register(Database=DB_FIXTURE, query_index='id', dataset_id='dataset-1', location='dataset-1', df=df)
+    assert DB_FIXTURE.select_multi_table_column_value(
+        table_name=_datasets.TABLE_NAME,
+        cols=['columns', 'rows'],
+        filtr=Filter(col='id', val='dataset-1')
+    ) == {'columns': '["a", "b"]', 'rows': 3}
+    assert _datasets.locations(Database=DB_FIXTURE, query_index='id') == {'dataset-1': 'dataset-1'}
+
+    # Backfill datasets uploaded before the catalog existed
+    DB_FIXTURE.to_sql(df=df, table_name='dataset-2', index=False)
+    DB_FIXTURE.insert(table_name='test', row=Row(cols=['id', 'name', 'value'], vals=['dataset-2', 'name', None]))
+    assert _datasets.backfill(Database=DB_FIXTURE, query_index='id', table_name='test') == ['dataset-2']
+    assert _datasets.backfill(Database=DB_FIXTURE, query_index='id', table_name='test') == []
+
+    _datasets.drop(Database=DB_FIXTURE, query_index='id', dataset_ids=['dataset-1', 'dataset-2'])
+    assert not DB_FIXTURE.table_exists(table_name='dataset-1')
+    assert not DB_FIXTURE.table_exists(table_name='dataset-2')
+    assert _datasets.locations(Database=DB_FIXTURE, query_index='id') == {}
+
+
+def test_dataset_storage_engine_projection(DB_FIXTURE: _generic.Connection):
+    DB_FIXTURE.create_table(table_name=_datasets.TABLE_NAME, schema=_datasets.schema(query_index='id'))
+    df = pd.DataFrame({'a': [1, 2, 3], 'b': ['x', 'y', 'z']})
+    assert _datasets.write(Database=DB_FIXTURE, query_index='id', dataset_id='dataset-1', df=df, engine='sqlite') == 'dataset-1'
+    assert _datasets.exists(Database=DB_FIXTURE, query_index='id', dataset_id='dataset-1')
+    pd.testing.assert_frame_equal(_datasets.read(Database=DB_FIXTURE, query_index='id', dataset_id='dataset-1'), df)
+    assert list(_datasets.read(Database=DB_FIXTURE, query_index='id', dataset_id='dataset-1', columns=['b']).columns) == ['b']
+    with pytest.raises(ValueError):
+        _storage.get_engine(Database=DB_FIXTURE, name='not-an-engine')
+
+
+def test_dataset_storage_engine_parquet(DB_FIXTURE: _generic.Connection):
+    pytest.importorskip('pyarrow')
+    DB_FIXTURE.create_table(table_name=_datasets.TABLE_NAME, schema=_datasets.schema(query_index='id'))
+    df = pd.DataFrame({'a': [1, 2, 3], 'b': ['x', 'y', 'z']})
+    location = _datasets.write(Database=DB_FIXTURE, query_index='id', dataset_id='dataset-1', df=df, engine='parquet')
+    assert location == 'datasets/dataset-1.parquet'
+    assert not DB_FIXTURE.table_exists(table_name='dataset-1')
+    pd.testing.assert_frame_equal(
+        _datasets.read(Database=DB_FIXTURE, query_index='id', dataset_id='dataset-1', columns=['a']),
+        df[['a']]
+    )
+    _datasets.drop(Database=DB_FIXTURE, query_index='id', dataset_ids=['dataset-1'])
+    assert not _datasets.exists(Database=DB_FIXTURE, query_index='id', dataset_id='dataset-1')
+
+
+@pytest.mark.parametrize('storage', ['sqlite', 'parquet'])
+@pytest.mark.parametrize('engine', ['pandas', 'duckdb'])
+def test_dataset_analytical_engine_aggregate(DB_FIXTURE: _generic.Connection, engine: str, storage: str):
+    pytest.importorskip(engine)
+    if storage == 'parquet':
+        pytest.importorskip('pyarrow')
+    DB_FIXTURE.create_table(table_name=_datasets.TABLE_NAME, schema=_datasets.schema(query_index='id'))
+    df = pd.DataFrame({
+        'day': ['2024-01-02', '2024-01-01', '2024-01-01', '2024-01-02'],
+        'd': ['a', 'a', 'b', None],
+        'm': [1.0, 2.0, 3.0, 4.0]
+    })
+    _datasets.write(Database=DB_FIXTURE, query_index='id', dataset_id='dataset-1', df=df, engine=storage)
+
+    summary = _datasets.aggregate(
+        Database=DB_FIXTURE, query_index='id', dataset_id='dataset-1',
+        datetime=[['day', '%Y-%m-%d']], dimension=['d'], metrics=['m'], aggrules=['Sum'], engine=engine
+    )
+    expected = aggregator.agg_df(df=df, datetime=[['day', '%Y-%m-%d']], dimension=['d'], metrics=['m'], aggrules=['Sum'])
+    pd.testing.assert_frame_equal(summary, expected, check_dtype=False)
+
+    descriptives = _datasets.describe(
+        Database=DB_FIXTURE, query_index='id', dataset_id='dataset-1',
+        dimension=['d'], metrics=['m'], aggrules=['Mean'], engine=engine
+    )
+    expected = aggregator.describe_df(df=df, dimension=['d'], metrics=['m'], aggrules=['Mean'])
+    pd.testing.assert_frame_equal(descriptives, expected, check_dtype=False)
+    with pytest.raises(ValueError):
+        _analytics.get_engine(Database=DB_FIXTURE, name='not-an-engine')
+
+
+def test_duckdb_engine_rejects_sqlite_datasets_without_extension(DB_FIXTURE: _generic.Connection, monkeypatch):
+    pytest.importorskip('duckdb')
+    DB_FIXTURE.create_table(table_name=_datasets.TABLE_NAME, schema=_datasets.schema(query_index='id'))
+    df = pd.DataFrame({'d': ['a', 'b'], 'm': [1.0, 2.0]})
+    _datasets.write(Database=DB_FIXTURE, query_index='id', dataset_id='dataset-1', df=df, engine='sqlite')
+    engine = _analytics.get_engine(Database=DB_FIXTURE, name='duckdb')
+    monkeypatch.setitem(_analytics._FAILURES, 'sqlite', 'IO Error: Failed to download extension')
+    with pytest.raises(_analytics.Unsupported, match='`sqlite` extension'):
+        engine.aggregate(location='dataset-1', dimension=['d'], metrics=['m'], aggrules=['Sum'])
+    summary = _datasets.aggregate(
+        Database=DB_FIXTURE, query_index='id', dataset_id='dataset-1',
+        dimension=['d'], metrics=['m'], aggrules=['Sum'], engine='duckdb'
+    )
+    expected = aggregator.agg_df(df=df, dimension=['d'], metrics=['m'], aggrules=['Sum'])
+    pd.testing.assert_frame_equal(summary, expected, check_dtype=False)
+
+
+@pytest.mark.parametrize('storage', ['sqlite', 'parquet'])
+def test_dataset_reader_projects_filters_and_chunks(DB_FIXTURE: _generic.Connection, tmp_path, storage: str):
+    if storage == 'parquet':
+        pytest.importorskip('pyarrow')
+    DB_FIXTURE.create_table(table_name=_datasets.TABLE_NAME, schema=_datasets.schema(query_index='id'))
+    df = pd.DataFrame({'d': ['a', 'b', 'c', 'a', 'b'], 'm': [1, 2, 3, 4, 5], 'n': [5.0, 4.0, 3.0, 2.0, 1.0]})
+    _datasets.write(Database=DB_FIXTURE, query_index='id', dataset_id='dataset-1', df=df, engine=storage)
+    kwargs = {'Database': DB_FIXTURE, 'query_index': 'id', 'dataset_id': 'dataset-1'}
+
+    assert list(_datasets.read(columns=['m'], **kwargs).columns) == ['m']
+    filtered = _datasets.read(columns=['d', 'm'], filtr=[Filter(col='d', val=['a', 'b']), Filter(col='m', val=4)], **kwargs)
+    assert filtered.to_dict('list') == {'d': ['a'], 'm': [4]}
+    assert _datasets.read(filtr=Filter(col='d', val=[]), **kwargs).empty
+    chunks = list(_datasets.read(columns=['d', 'n'], chunksize=2, **kwargs))
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), df[['d', 'n']])
+
+    _datasets.export(path=str(tmp_path / 'export.csv'), file_format='csv', chunksize=2, **kwargs)
+    pd.testing.assert_frame_equal(pd.read_csv(tmp_path / 'export.csv'), df)
+    if storage == 'parquet':
+        _datasets.export(path=str(tmp_path / 'export.parquet'), file_format='.PARQUET', columns=['m'], chunksize=2, **kwargs)
+        pd.testing.assert_frame_equal(pd.read_parquet(tmp_path / 'export.parquet'), df[['m']])
+    with pytest.raises(ValueError):
+        _datasets.export(path=str(tmp_path / 'export.xlsx'), file_format='xlsx', **kwargs)
+
+
+@pytest.mark.parametrize('storage', ['sqlite', 'parquet'])
+def test_dataset_is_ingested_chunk_by_chunk(DB_FIXTURE: _generic.Connection, storage: str):
+    if storage == 'parquet':
+        pytest.importorskip('pyarrow')
+    DB_FIXTURE.create_table(table_name=_datasets.TABLE_NAME, schema=_datasets.schema(query_index='id'))
+    kwargs = {'Database': DB_FIXTURE, 'query_index': 'id', 'engine': storage}
+    datafile = 'Day,Product,Y\n' + ''.join(
+        ['%s/01/2024,%s,%s\n' % (day, product, day / 2 if day % 3 else '') for day in range(10, 29) for product in ['a', '007']]
+    )
+
+    contract = _ingestion.Contract.infer(
+        sample=_ingestion.sample(file=io.BytesIO(datafile.encode('utf8')), file_format='.CSV', nrows=4)
+    )
+    assert (contract.datetime, contract.dimensions, contract.metrics) == ([('day', '%d/%m/%Y')], ['product'], ['y'])
+
+    # Chunks are validated as they are stored
+    validator = _ingestion.Validator(contract=contract)
+    chunks = _ingestion.read(file=io.BytesIO(datafile.encode('utf8')), file_format='csv', chunksize=5, dtype=contract.dtype)
+    _datasets.write(dataset_id='dataset-1', df=validator.stream(chunks=chunks), **kwargs)
+    df = _datasets.read(Database=DB_FIXTURE, query_index='id', dataset_id='dataset-1')
+    assert len(df) == validator.rows == 38
+    assert set(df['product']) == {'a', '007'}
+    pd.testing.assert_frame_equal(validator.head, df.head(5))
+    assert _datasets.size(
+        Database=DB_FIXTURE,
+        location=_datasets.locations(Database=DB_FIXTURE, query_index='id')['dataset-1']
+    ) > 0
+    assert _datasets.verify(Database=DB_FIXTURE, query_index='id', dataset_id='dataset-1', df=df[['y', 'product']])
+
+    # Duplicates across chunks and empty datafiles fail, and partially stored datasets are removed
+    for datafile, check in [(datafile + '10/01/2024,a,1\n', 'multiple_fields_uniqueness'), ('Day,Product,Y\n', 'not_empty')]:
+        validator = _ingestion.Validator(contract=contract)
+        chunks = _ingestion.read(file=io.BytesIO(datafile.encode('utf8')), file_format='csv', chunksize=5, dtype=contract.dtype)
+        with pytest.raises(_exceptions.InvalidSchema) as e:
+            _datasets.write(dataset_id='dataset-2', df=validator.stream(chunks=chunks), **kwargs)
+        assert set(e.value.failure_cases['check']) == {check}
+        assert not _storage.get_engine(Database=DB_FIXTURE, name=storage).exists(
+            location=_storage.get_engine(Database=DB_FIXTURE, name=storage).location(dataset_id='dataset-2')
+        )
+    assert list(e.value.failure_cases.columns) == list(_ingestion.FAILURE_CASES)
+
+
+@pytest.mark.parametrize('file_format', ['csv', 'parquet'])
+def test_datetime_format_is_confirmed_chunk_by_chunk(file_format: str):
+    if file_format == 'parquet':
+        pytest.importorskip('pyarrow')
+    df = pd.DataFrame({'Day': ['%02d/01/2024' % (day) for day in range(1, 13)] + ['01/13/2024'], 'Y': range(13)})
+    file = io.BytesIO()
+    if file_format == 'csv':
+        df.to_csv(file, index=False)
+    else:
+        df.to_parquet(file, index=False)
+    file.seek(0)
+
+    # The format is inferred from the leading sample alone
+    contract = _ingestion.Contract.infer(sample=_ingestion.sample(file=file, file_format=file_format, nrows=5))
+    assert contract.datetime == [('day', '%d/%m/%Y')]
+
+    # Rows that contradict the sample fail, whichever chunk they are in
+    for arrow in [True, False]:
+        chunks = _ingestion.read(file=file, file_format=file_format, chunksize=5, dtype=contract.dtype, arrow=arrow)
+        with pytest.raises(_exceptions.InvalidSchema) as e:
+            list(_ingestion.Validator(contract=contract).stream(chunks=chunks))
+        file.seek(0)
+        assert e.value.failure_cases[['check', 'failure_case', 'index']].values.tolist() == [
+            ["datetime_format('%d/%m/%Y')", '01/13/2024', 12]
+        ]
+
+
+@pytest.mark.parametrize('storage', ['sqlite', 'parquet'])
+def test_parquet_datafile_is_ingested_as_arrow_tables(DB_FIXTURE: _generic.Connection, storage: str):
+    pytest.importorskip('pyarrow')
+    DB_FIXTURE.create_table(table_name=_datasets.TABLE_NAME, schema=_datasets.schema(query_index='id'))
+    kwargs = {'Database': DB_FIXTURE, 'query_index': 'id', 'engine': storage}
+    df = pd.DataFrame({
+        'Day': ['%s/01/2024' % (day) for day in range(10, 29) for product in ['a', '007']],
+        'Product': [product for day in range(10, 29) for product in ['a', '007']],
+        'Flag': [bool(day % 2) for day in range(10, 29) for product in ['a', '007']],
+        'Y': [day / 2 if day % 3 else None for day in range(10, 29) for product in ['a', '007']]
+    })
+
+    def datafile(df: pd.DataFrame) -> io.BytesIO:
+        file = io.BytesIO()
+        df.to_parquet(file, index=False)
+        file.seek(0)
+        return file
+
+    contract = _ingestion.Contract.infer(sample=_ingestion.sample(file=datafile(df), file_format='.parquet'))
+    assert (contract.datetime, contract.dimensions, contract.metrics) == ([('day', '%d/%m/%Y')], ['product', 'flag'], ['y'])
+
+    # Arrow chunks are validated and stored like pandas chunks
+    validators = {arrow: _ingestion.Validator(contract=contract) for arrow in [True, False]}
+    for arrow, validator in validators.items():
+        chunks = _ingestion.read(file=datafile(df), file_format='.parquet', chunksize=5, dtype=contract.dtype, arrow=arrow)
+        _datasets.write(dataset_id='dataset-%s' % (arrow), df=validator.stream(chunks=chunks), **kwargs)
+    arrow, frame = [_datasets.read(Database=DB_FIXTURE, query_index='id', dataset_id='dataset-%s' % (i)) for i in [True, False]]
+    pd.testing.assert_frame_equal(arrow, frame)
+    pd.testing.assert_frame_equal(validators[True].head, validators[False].head)
+    assert validators[True].rows == len(arrow) == 38
+    assert _datasets.verify(Database=DB_FIXTURE, query_index='id', dataset_id='dataset-True', df=frame)
+
+    # Arrow chunks report the failure cases of pandas chunks
+    for invalid, check in [
+        (pd.concat([df, df.iloc[[0]]]), 'multiple_fields_uniqueness'),
+        (df.assign(Product=df['Product'].where(df.index != 12)), 'not_nullable'),
+        (df.assign(Y=df['Y'].astype(str).where(df.index != 7, 'x')), 'coerce_dtype(\'float64\')')
+    ]:
+        failure_cases = []
+        for arrow in [True, False]:
+            chunks = _ingestion.read(
+                file=datafile(invalid), file_format='.parquet', chunksize=5, dtype=contract.dtype, arrow=arrow
+            )
+            with pytest.raises(_exceptions.InvalidSchema) as e:
+                list(_ingestion.Validator(contract=contract).stream(chunks=chunks))
+            failure_cases += [e.value.failure_cases.reset_index(drop=True)]
+        assert check in set(failure_cases[0]['check'])
+        pd.testing.assert_frame_equal(failure_cases[0], failure_cases[1])
+
+
+@pytest.mark.parametrize('arrow', [True, False])
+def test_duplicates_are_detected_across_many_chunks(arrow: bool):
+    pytest.importorskip('pyarrow')
+    df = pd.DataFrame({
+        'Day': ['%02d/%02d/2024' % (day, month) for month in range(1, 13) for day in range(1, 29)] + ['03/01/2024'],
+        'Product': 'a',
+        'Y': 1.0
+    })
+    file = io.BytesIO()
+    df.to_parquet(file, index=False)
+    file.seek(0)
+    contract = _ingestion.Contract.infer(sample=_ingestion.sample(file=file, file_format='.parquet'))
+
+    # Every chunk is checked against the 64-bit hashes of the keys of all of the preceding chunks
+    validator = _ingestion.Validator(contract=contract)
+    chunks = _ingestion.read(file=file, file_format='.parquet', chunksize=7, dtype=contract.dtype, arrow=arrow)
+    with pytest.raises(_exceptions.InvalidSchema) as e:
+        list(validator.stream(chunks=chunks))
+    assert e.value.failure_cases[['column', 'failure_case', 'index']].values.tolist() == [
+        ['day', '03/01/2024', 336], ['product', 'a', 336]
+    ]
+    assert validator.rows == 336
+    assert validator._keys.dtype == numpy.uint64 and len(validator._keys) == 336
+    assert (numpy.diff(validator._keys.astype(object)) > 0).all()
+
+
+@pytest.mark.parametrize('arrow', [True, False])
+def test_key_hash_collisions_are_not_duplicates(arrow: bool, monkeypatch):
+    pytest.importorskip('pyarrow')
+    df = pd.DataFrame({'Day': ['%02d/01/2024' % (day) for day in range(1, 29)], 'Product': 'a', 'Y': 1.0})
+    file = io.BytesIO()
+    df.to_parquet(file, index=False)
+    file.seek(0)
+    contract = _ingestion.Contract.infer(sample=_ingestion.sample(file=file, file_format='.parquet'))
+
+    # Every key hashes to one of two 64-bit hashes, so that distinct keys collide across chunks
+    monkeypatch.setattr(
+        pd.util, 'hash_pandas_object',
+        lambda obj, index: pd.Series(numpy.arange(len(obj), dtype=numpy.uint64) % 2)
+    )
+    validator = _ingestion.Validator(contract=contract)
+    chunks = _ingestion.read(file=file, file_format='.parquet', chunksize=5, dtype=contract.dtype, arrow=arrow)
+    assert sum(len(chunk) for chunk in validator.stream(chunks=chunks)) == validator.rows == 28
+
+    # Colliding keys are confirmed against the key values before they are reported as duplicates
+    invalid = pd.concat([df, df.iloc[[3]]], ignore_index=True)
+    file = io.BytesIO()
+    invalid.to_parquet(file, index=False)
+    file.seek(0)
+    chunks = _ingestion.read(file=file, file_format='.parquet', chunksize=5, dtype=contract.dtype, arrow=arrow)
+    with pytest.raises(_exceptions.InvalidSchema) as e:
+        list(_ingestion.Validator(contract=contract).stream(chunks=chunks))
+    assert e.value.failure_cases[['column', 'failure_case', 'index']].values.tolist() == [
+        ['day', '04/01/2024', 28], ['product', 'a', 28]
+    ]
+
+
+@pytest.mark.parametrize('storage', ['sqlite', 'parquet'])
+def test_dataset_digest_verifies_columns(DB_FIXTURE: _generic.Connection, storage: str):
+    if storage == 'parquet':
+        pytest.importorskip('pyarrow')
+    DB_FIXTURE.create_table(table_name=_datasets.TABLE_NAME, schema=_datasets.schema(query_index='id'))
+    kwargs = {'Database': DB_FIXTURE, 'query_index': 'id', 'dataset_id': 'dataset-1'}
+    df = pd.DataFrame({'d': ['a', 'b', '7'], 'm': [1, None, 3], 'n': [None, None, None], 'b': [True, False, True]})
+    _datasets.write(df=iter([df.iloc[:2], df.iloc[2:]]), engine=storage, **kwargs)
+
+    # Digests are independent of the chunks and of the datatypes read back from storage
+    assert _ingestion.digest(chunks=[df]) == _ingestion.digest(chunks=_datasets.read(chunksize=1, **kwargs))
+    assert _datasets.verify(df=_datasets.read(columns=['d', 'n'], **kwargs), **kwargs) is True
+    assert _datasets.verify(df=_datasets.read(**kwargs).assign(m=[1, 2, 3]), **kwargs) is False
+    assert _datasets.verify(df=df.assign(x=1), **kwargs) is None
+
+    # Digests recorded without a version are checked with either of the earlier serializations
+    for version in [1, 2]:
+        DB_FIXTURE.execute(
+            query='UPDATE %s SET digest = ? WHERE id = ?;' % (_datasets.TABLE_NAME),
+            params=[json.dumps(_ingestion.digest(chunks=[df], version=version)), 'dataset-1']
+        )
+        assert _ingestion.digest(chunks=[df], version=version) != _ingestion.digest(chunks=[df], version=3 - version)
+        assert _datasets.verify(df=_datasets.read(**kwargs), **kwargs) is True
+        assert _datasets.verify(df=_datasets.read(**kwargs).assign(m=[1, 2, 3]), **kwargs) is False
+    DB_FIXTURE.execute(
+        query='UPDATE %s SET digest = ? WHERE id = ?;' % (_datasets.TABLE_NAME),
+        params=[json.dumps({'version': 3, 'columns': _ingestion.digest(chunks=[df])}), 'dataset-1']
+    )
+    assert _datasets.verify(df=df, **kwargs) is None
+
+    # Datafiles are hashed by their bytes, block-by-block
+    datafile = io.BytesIO(b'd,m\na,1\nb,2\n')
+    assert _ingestion.checksum(file=datafile, blocksize=4) == hashlib.sha256(datafile.getvalue()).hexdigest()
+    assert datafile.tell() == 0
+
+
+def test_dataset_catalog_upgrade_adds_missing_columns(DB_FIXTURE: _generic.Connection):
+    DB_FIXTURE.execute(
+        query='CREATE TABLE %s (id TEXT PRIMARY KEY, location TEXT, columns TEXT, rows INTEGER, bytes INTEGER);' % (
+            _datasets.TABLE_NAME
+        )
+    )
+    DB_FIXTURE.to_sql(df=pd.DataFrame({'m': [1, 2]}), table_name='dataset-1', index=False)
+    assert _datasets.upgrade(Database=DB_FIXTURE, query_index='id') == ['digest']
+    assert _datasets.upgrade(Database=DB_FIXTURE, query_index='id') == []
+    _datasets.register(Database=DB_FIXTURE, query_index='id', dataset_id='dataset-1', location='dataset-1')
+    assert _datasets.verify(
+        Database=DB_FIXTURE, query_index='id', dataset_id='dataset-1', df=pd.DataFrame({'m': [1, 2]})
+    ) is None
+
+
+@pytest.mark.parametrize('storage', ['sqlite', 'parquet'])
+def test_dataset_content_is_shared_and_reference_counted(DB_FIXTURE: _generic.Connection, storage: str):
+    if storage == 'parquet':
+        pytest.importorskip('pyarrow')
+    DB_FIXTURE.create_table(table_name=_datasets.TABLE_NAME, schema=_datasets.schema(query_index='id'))
+    kwargs = {'Database': DB_FIXTURE, 'query_index': 'id'}
+    df = pd.DataFrame({'d': ['a', 'b'], 'm': [1.0, 2.0]})
+
+    def unread():
+        raise AssertionError('The chunks of a shared dataset are not read.')
+        yield
+
+    location = _datasets.write(dataset_id='dataset-1', df=df, engine=storage, key='content-1', **kwargs)
+    assert _datasets.write(dataset_id='dataset-2', df=unread(), engine=storage, key='content-1', **kwargs) == location
+    _datasets.write(dataset_id='dataset-3', df=df, engine=storage, **kwargs)
+    assert _datasets.references(locations=[location], **kwargs) == {location: 2}
+    pd.testing.assert_frame_equal(_datasets.read(dataset_id='dataset-2', **kwargs), df)
+    assert _datasets.verify(dataset_id='dataset-2', df=df, **kwargs)
+
+    # The stored dataset is removed with its last reference
+    _datasets.drop(dataset_ids=['dataset-1', 'dataset-3'], **kwargs)
+    assert _datasets.exists(dataset_id='dataset-2', **kwargs)
+    assert not _datasets.exists(dataset_id='dataset-3', **kwargs)
+
+    # The stored dataset is kept when the drop is rolled back
+    with pytest.raises(RuntimeError):
+        with DB_FIXTURE.transaction():
+            _datasets.drop(dataset_ids=['dataset-2'], **kwargs)
+            raise RuntimeError
+    pd.testing.assert_frame_equal(_datasets.read(dataset_id='dataset-2', **kwargs), df)
+
+    _datasets.drop(dataset_ids=['dataset-2'], **kwargs)
+    assert not _storage.resolve(Database=DB_FIXTURE, location=location).exists(location=location)
+    assert _datasets.locations(**kwargs) == {}
+
+
+@pytest.mark.parametrize('storage', ['sqlite', 'parquet'])
+def test_dataset_is_recorded_with_its_metadata(DB_FIXTURE: _generic.Connection, storage: str):
+    if storage == 'parquet':
+        pytest.importorskip('pyarrow')
+    DB_FIXTURE.create_table(table_name=_datasets.TABLE_NAME, schema=_datasets.schema(query_index='id'))
+    DB_FIXTURE.execute(query='CREATE TABLE metadata (id TEXT PRIMARY KEY);')
+    kwargs = {'Database': DB_FIXTURE, 'query_index': 'id'}
+    df = pd.DataFrame({'d': ['a', 'b'], 'm': [1.0, 2.0]})
+
+    def write(dataset_id: str, key: str, record: str = '', df: pd.DataFrame = df) -> str:
+        return _datasets.write(
+            dataset_id=dataset_id,
+            df=df,
+            engine=storage,
+            key=key,
+            hook=(lambda: DB_FIXTURE.insert(table_name='metadata', row=Row(cols=['id'], vals=[record]))) if record else None,
+            **kwargs
+        )
+
+    def exists(key: str) -> bool:
+        location = _storage.get_engine(Database=DB_FIXTURE, name=storage).location(dataset_id=key)
+        return _storage.resolve(Database=DB_FIXTURE, location=location).exists(location=location)
+
+    # Shared datasets are linked and recorded within a committed transaction
+    location = write(dataset_id='dataset-1', key='content-1', record='dataset-1')
+    assert write(dataset_id='dataset-2', key='content-1', record='dataset-2') == location
+    assert not DB_FIXTURE.conn.in_transaction
+    assert DB_FIXTURE.execute(query='SELECT id FROM metadata ORDER BY id;').fetchall() == [('dataset-1',), ('dataset-2',)]
+
+    # A dataset whose metadata fails to be recorded is rolled back, and its stored dataset is removed
+    for key in ['content-3', 'content-1']:
+        with pytest.raises(sqlite3.IntegrityError):
+            write(dataset_id='dataset-3', key=key, record='dataset-1')
+        assert set(_datasets.locations(**kwargs)) == {'dataset-1', 'dataset-2'}
+    assert not exists(key='content-3')
+    assert exists(key='content-1')
+
+    # Re-writing datasets with different content removes their stored dataset once it is unreferenced
+    write(dataset_id='dataset-1', key='content-2', df=df.iloc[:1])
+    assert exists(key='content-1')
+    write(dataset_id='dataset-2', key='content-2', df=df.iloc[:1])
+    assert not exists(key='content-1')
+    assert set(_datasets.locations(**kwargs).values()) == {
+        _storage.get_engine(Database=DB_FIXTURE, name=storage).location(dataset_id='content-2')
+    }
+
+
+@pytest.mark.parametrize('storage', ['sqlite', 'parquet'])
+def test_writers_of_the_same_content_are_staged_apart(DB_FIXTURE: _generic.Connection, storage: str):
+    if storage == 'parquet':
+        pytest.importorskip('pyarrow')
+    DB_FIXTURE.create_table(table_name=_datasets.TABLE_NAME, schema=_datasets.schema(query_index='id'))
+    Engine = _storage.get_engine(Database=DB_FIXTURE, name=storage)
+    df = pd.DataFrame({'d': ['a', 'b'], 'm': [1.0, 2.0]})
+
+    # Concurrent writers stage their own dataset, and the second to install keeps the first
+    staged = [Engine.stage(dataset_id='content-1', df=df), Engine.stage(dataset_id='content-1', df=df.iloc[:1])]
+    assert staged[0] != staged[1] and all(Engine.exists(location=location) for location in staged)
+    with DB_FIXTURE.transaction():
+        location = Engine.install(staged=staged[0], dataset_id='content-1', exist_ok=True)
+    with DB_FIXTURE.transaction():
+        assert Engine.install(staged=staged[1], dataset_id='content-1', exist_ok=True) == location
+    assert not any(Engine.exists(location=location) for location in staged)
+    pd.testing.assert_frame_equal(Engine.read(location=location), df)
+
+    # A stored dataset that no catalogued dataset references is shared rather than rejected
+    _datasets.write(Database=DB_FIXTURE, query_index='id', dataset_id='dataset-1', df=df, engine=storage, key='content-1')
+    assert _datasets.locations(Database=DB_FIXTURE, query_index='id') == {'dataset-1': location}
+
+    # Datasets addressed by their dataset ID are replaced
+    with DB_FIXTURE.transaction():
+        Engine.install(staged=Engine.stage(dataset_id='content-1', df=df.iloc[:1]), dataset_id='content-1')
+    pd.testing.assert_frame_equal(Engine.read(location=location), df.iloc[:1])
+
+
+def test_dataset_reference_pushes_aggregation_down(DB_FIXTURE: _generic.Connection):
+    DB_FIXTURE.create_table(table_name=_datasets.TABLE_NAME, schema=_datasets.schema(query_index='id'))
+    df = pd.DataFrame({
+        'day': ['2024-01-02', '2024-01-01', '2024-1-1', '2024-01-02', None],
+        'd': ['a', 'a', 'a', None, 'b'],
+        'm': [1, 2, 3, 4, 5],
+        'n': [1.5, None, 3.5, 4.0, 5.0]
+    })
+    _datasets.write(Database=DB_FIXTURE, query_index='id', dataset_id='dataset-1', df=df, engine='sqlite')
+    reference = _datasets.Reference(Database=DB_FIXTURE, query_index='id', dataset_id='dataset-1', engine='pandas')
+    location = _datasets.locations(Database=DB_FIXTURE, query_index='id', dataset_ids=['dataset-1'])['dataset-1']
+
+    for kwargs in [
+        {'datetime': [['day', '%Y-%m-%d']], 'dimension': ['d'], 'metrics': ['m', 'n'], 'aggrules': ['Sum', 'Mean']},
+        {'datetime': [['day', '%Y-%m-%d']], 'dimension': None, 'metrics': ['n'], 'aggrules': ['Count']},
+        {'datetime': None, 'dimension': ['d'], 'metrics': ['m'], 'aggrules': ['Max']},
+        {'datetime': None, 'dimension': None, 'metrics': ['n'], 'aggrules': ['Min']}
+    ]:
+        summary = _storage.Sqlite(Database=DB_FIXTURE).aggregate(location=location, **kwargs)
+        pd.testing.assert_frame_equal(summary, aggregator.agg_df(df=df, **kwargs), check_dtype=False)
+        pd.testing.assert_frame_equal(aggregator.agg_df(df=reference, **kwargs), summary)
+
+    # Rules the storage engine lacks are aggregated with pandas
+    kwargs = {'datetime': None, 'dimension': ['d'], 'metrics': ['m'], 'aggrules': ['Median']}
+    with pytest.raises(_storage.Unsupported):
+        _storage.Sqlite(Database=DB_FIXTURE).aggregate(location=location, **kwargs)
+    pd.testing.assert_frame_equal(
+        aggregator.agg_df(df=reference, **kwargs), aggregator.agg_df(df=df, **kwargs), check_dtype=False
+    )
+    pd.testing.assert_frame_equal(
+        aggregator.describe_df(df=reference, dimension=['d'], metrics=['m'], aggrules=['Sum']),
+        aggregator.describe_df(df=df, dimension=['d'], metrics=['m'], aggrules=['Sum']),
+        check_dtype=False
+    )
+
+
+def test_dataset_metadata_is_selected_once(DB_FIXTURE: _generic.Connection, monkeypatch):
+    monkeypatch.setenv(_cache.ENVIRONMENT_VARIABLE, '1')
+    _cache.dispose()
+    Database = _generic.Connection(db_name='test', dir_name=DB_FIXTURE.dir_name)
+    columns = DatasetMetadata.columns(query_index='id')
+    Database.execute(query='CREATE TABLE data (%s);' % (', '.join(columns)))
+    values = {
+        'id': 'dataset-1', 'version': 2, 'file_name': 'data.csv', 'datetime': json.dumps([['day', '%Y-%m-%d']]),
+        'dimensions': '["d"]', 'metrics': '["m"]', 'selected_datetime': None, 'selected_dimensions': '[]',
+        'selected_metrics': '["m"]', 'selected_aggrules': '["Sum"]', 'sha256': 'abc'
+    }
+    Database.write(
+        query='INSERT INTO data (%s) VALUES (%s);' % (', '.join(values), ', '.join(['?'] * len(values))),
+        params=list(values.values())
+    )
+
+    metadata = _datasets.metadata(Database=Database, table_name='data', query_index='id', dataset_id='dataset-1')
+    assert metadata.dataset_id == 'dataset-1' and metadata.version == 2 and metadata.sha256 == 'abc'
+    assert metadata.datetime == [['day', '%Y-%m-%d']] and metadata.selected_datetime == []
+    assert metadata.selected_aggrules == ['Sum'] and metadata.final is None
+    assert not hasattr(metadata, '__dict__')
+    assert _datasets.metadata(Database=Database, table_name='data', query_index='id', dataset_id='dataset-1') == metadata
+    assert Database.cache_statistics()['hits'] == 1
+
+    # Updates to the data table are observed
+    Database.update(
+        table_name='data',
+        value=Value(col='selected_aggrules', val='["Mean"]'),
+        filtr=Filter(col='id', val='dataset-1')
+    )
+    assert _datasets.metadata(
+        Database=Database, table_name='data', query_index='id', dataset_id='dataset-1', cache=False
+    ).selected_aggrules == ['Mean']
+    with pytest.raises(_generic.NullReturnValue):
+        _datasets.metadata(Database=Database, table_name='data', query_index='id', dataset_id='dataset-2')
+    Database.close()
+    _cache.dispose()
+
+
+def test_scoped_query_joins_attached_databases(tmp_path, SCHEMA_FIXTURE: _generic.Schema):
+    Data = _generic.Connection(db_name='data', dir_name=str(tmp_path))
+    Data.create_table(table_name='test', schema=SCHEMA_FIXTURE)
+    Data.insert_many(
+        table_name='test',
+        rows={'id': ['1', '2', '3'], 'name': ['b', 'a', 'c'], 'value': ['1', '2', '3']}
+    )
+    Sessions = _generic.Connection(db_name='sessions', dir_name=str(tmp_path))
+    Sessions.execute(query='CREATE TABLE test (session_id TEXT, id TEXT);')
+    Sessions.write_many(query='INSERT INTO test VALUES (?, ?);', params=[('s1', '1'), ('s1', '2'), ('s2', '3')])
+
+    Scope = _generic.Connection(db_name='sessions', dir_name=str(tmp_path), attach=['data', 'sessions'])
+    assert Scope.pool is not Sessions.pool
+    assert Scope.schema(db_name='data') == 'data' and Scope.schema(db_name='sessions.db') == 'main'
+    kwargs = {
+        'db_name': 'data',
+        'table_name': 'test',
+        'query_index': 'id',
+        'scope_db_name': 'sessions',
+        'scope_query_index': 'session_id'
+    }
+    assert Scope.select_scoped_table_column_value(col='name', scope_value='s1', **kwargs) == ['a', 'b']
+    assert Scope.select_scoped_table_column_value(
+        col='id', scope_value='s1', filtr=Filter(col='name', val='b'), **kwargs
+    ) == ['1']
+    assert Scope.select_scoped_table_column_value(
+        col='value', scope_value='s1', return_dtype='int', aggregate='MAX', order=None, **kwargs
+    ) == [2]
+    assert Scope.select_scoped_multi_table_column_value(
+        cols=['id', 'value'], scope_value='s2', filtr=Filter(col='name', val='c'), **kwargs
+    ) == {'id': '3', 'value': '3'}
+    assert len(Scope.select_scoped_table(scope_value='s1', **kwargs)) == 2
+    with pytest.raises(_generic.NullReturnValue):
+        Scope.select_scoped_table_column_value(col='value', scope_value='s3', aggregate='MAX', **kwargs)
+    with pytest.raises(ValueError):
+        Scope.schema(db_name='analysis')
+    for Database in [Scope, Sessions, Data]:
+        Database.close()
+    _pool.dispose()
+
+
+def test_cascade_planner_deletes_orphan_closure(tmp_path):
+    Users = _generic.Connection(db_name='users', dir_name=str(tmp_path))
+    Sessions = _generic.Connection(db_name='sessions', dir_name=str(tmp_path))
+    Data = _generic.Connection(db_name='data', dir_name=str(tmp_path))
+    for Database, statements in {
+        Users: [
+            'CREATE TABLE users (user_id TEXT, name TEXT);',
+            'CREATE TABLE sessions (user_id TEXT, session_id TEXT);'
+        ],
+        Sessions: [
+            'CREATE TABLE sessions (session_id TEXT, name TEXT);',
+            'CREATE TABLE data (session_id TEXT, dataset_id TEXT);'
+        ],
+        Data: ['CREATE TABLE data (dataset_id TEXT, file_name TEXT);']
+    }.items():
+        for statement in statements:
+            Database.execute(query=statement)
+        Database.catalog.invalidate()
+
+    Users.write_many(query='INSERT INTO users VALUES (?, ?);', params=[('u1', 'a'), ('u2', 'b')])
+    Users.write_many(query='INSERT INTO sessions VALUES (?, ?);', params=[('u1', 's1'), ('u1', 's2'), ('u2', 's3')])
+    Sessions.write_many(query='INSERT INTO sessions VALUES (?, ?);', params=[('s1', 'a'), ('s2', 'b'), ('s3', 'c')])
+    Sessions.write_many(
+        query='INSERT INTO data VALUES (?, ?);',
+        params=[('s1', 'd1'), ('s2', 'd1'), ('s2', 'd2'), ('s3', 'd2'), ('s3', 'd3')]
+    )
+    Data.write_many(query='INSERT INTO data VALUES (?, ?);', params=[('d1', 'f1'), ('d2', 'f2'), ('d3', 'f3')])
+
+    dropped = []
+    Planner = (
+        _cascade.Planner()
+        .purge(query_index='user_id', Database=Users)
+        .purge(query_index='session_id', Database=Users)
+        .purge(query_index='session_id', Database=Sessions)
+        .purge(query_index='dataset_id', Database=Sessions)
+        .purge(query_index='dataset_id', Database=Data, callback=dropped.extend)
+        .cascade(query_index='user_id', dependent_query_index='session_id', Database=Users)
+        .cascade(query_index='session_id', dependent_query_index='dataset_id', Database=Sessions)
+    )
+
+    # Datasets shared with another user's session are kept, and planning does not acquire the write-lock
+    blocker = sqlite3.connect(os.path.join(str(tmp_path), 'users.db'))
+    blocker.execute('BEGIN IMMEDIATE;')
+    Users.conn.execute('PRAGMA busy_timeout = 50;')
+    plan = Planner.plan(query_index='user_id', values=['u1'])
+    blocker.rollback()
+    blocker.close()
+    assert plan == {'user_id': ['u1'], 'session_id': ['s1', 's2'], 'dataset_id': ['d1']}
+    assert [Database.db_name for Database, _ in Planner._order(plan=plan)] == ['data.db', 'sessions.db', 'users.db']
+
+    Planner.execute(plan=plan)
+    assert dropped == ['d1']
+    assert Users.select_table_column_value(
+        table_name='sessions', col='session_id', filtr=Filter(col='user_id', val='u2'), multi=True
+    ) == ['s3']
+    assert Sessions.select_num_table_records(table_name='data', filtr=Filter(col='session_id', val=['s1', 's2'])) == 0
+    assert Data.select_table_column_value(
+        table_name='data', col='dataset_id', filtr=Filter(col='file_name', val=['f1', 'f2', 'f3']), multi=True
+    ) == ['d2', 'd3']
+    assert not any(Database.conn.in_transaction for Database in [Users, Sessions, Data])
+
+    # Removals registered by callbacks to run after commit are discarded when the cascade is rolled back
+    removed = []
+
+    def remove(dataset_ids: list):
+        Data.after_commit(lambda: removed.extend(dataset_ids))
+        raise RuntimeError
+
+    Planner.levels['dataset_id'].callbacks[os.path.join(Data.dir_name, Data.db_name)] = [remove]
+    plan = Planner.plan(query_index='user_id', values=['u2'])
+    with pytest.raises(RuntimeError):
+        Planner.execute(plan=plan)
+    assert removed == []
+    assert Data.execute(query='SELECT dataset_id FROM data ORDER BY dataset_id;').fetchall() == [('d2',), ('d3',)]
+
+    for Database in [Users, Sessions, Data]:
+        Database.close()
+    _pool.dispose()
+
+
+def test_cascade_cleaner_removes_folders(tmp_path):
+    (tmp_path / 'workspace' / 'run').mkdir(parents=True)
+    (tmp_path / 'workspace' / 'run' / 'output.csv').write_text('a,b')
+    Cleaner = _cascade.get_cleaner()
+    assert Cleaner is _cascade.get_cleaner()
+    Cleaner.remove(paths=[tmp_path / 'workspace' / 'run', tmp_path / 'missing'])
+    Cleaner.join()
+    assert not (tmp_path / 'workspace' / 'run').exists()
+
+
+def test_read_cache_hits_until_table_written(monkeypatch, tmp_path, SCHEMA_FIXTURE: _generic.Schema):
+    monkeypatch.setenv('ASSEMBLIT_DB_CACHE_SIZE', '1')
+    _cache.dispose()
+    Database = _generic.Connection(db_name='cache', dir_name=str(tmp_path))
+    Database.create_table(table_name='test', schema=SCHEMA_FIXTURE)
+    Database.create_table(table_name='other', schema=SCHEMA_FIXTURE)
+    Database.insert(table_name='test', row=Row(cols=['id', 'name', 'value'], vals=['1', 'a', 'A']))
+
+    def select() -> str:
+        return Database.select_table_column_value(table_name='test', col='name', filtr=Filter(col='id', val='1'))
+
+    # Repeated reads are answered from the cache
+    assert select() == 'a'
+    assert select() == 'a'
+    assert Database.cache_statistics()['hits'] == 1
+    assert Database.cache_statistics()['misses'] == 1
+
+    # Writes to other tables do not invalidate the result
+    Database.insert(table_name='other', row=Row(cols=['id', 'name', 'value'], vals=['1', 'b', 'B']))
+    assert select() == 'a'
+    assert Database.cache_statistics()['hits'] == 2
+
+    # Writes to the table invalidate the result
+    Database.update(table_name='test', value=Value(col='name', val='c'), filtr=Filter(col='id', val='1'))
+    assert select() == 'c'
+    assert Database.cache_statistics()['misses'] == 2
+
+    # Writes executed outside of a transaction are committed before the result is invalidated
+    Database.execute(query="UPDATE test SET name = 'd' WHERE id = ?;", params=['1'])
+    assert not Database.conn.in_transaction
+    assert select() == 'd'
+
+    Database.close()
+    _cache.dispose()
+    _pool.dispose()
+
+
+def test_read_cache_parses_table_references():
+    assert _cache.tables('SELECT t.a FROM "data".test AS t INNER JOIN sessions s ON s.id = t.id;') == [
+        ('data', 'test'),
+        (None, 'sessions')
+    ]
+    assert _cache.is_write('INSERT OR REPLACE INTO test (id) VALUES (?);')
+    assert _cache.is_ddl('DROP TABLE IF EXISTS test;')
+
+    # Least-recently-used results are evicted beyond the capacity
+    Cache = _cache.Cache(max_bytes=10 ** 6, max_entries=1)
+    Cache.put(key='a', tables=[('db', 'test')], result=[(1,)], snapshot=Cache.snapshot(tables=[('db', 'test')]))
+    Cache.put(key='b', tables=[('db', 'test')], result=[(2,)], snapshot=Cache.snapshot(tables=[('db', 'test')]))
+    assert Cache.get(key='a', tables=[('db', 'test')]) == (False, None)
+    assert Cache.get(key='b', tables=[('db', 'test')]) == (True, [(2,)])
+    assert Cache.statistics()['evictions'] == 1
+
+
+def test_trace_collects_rerun_summary_and_slow_queries(monkeypatch, DB_FIXTURE: _generic.Connection):
+    Tracer = _trace.Tracer(threshold=0.0)
+    monkeypatch.setattr(DB_FIXTURE, 'tracer', Tracer)
+    summary = Tracer.begin()
+
+    DB_FIXTURE.insert(table_name='test', row=Row(cols=['id', 'name', 'value'], vals=['1', 'a', 'A']))
+    DB_FIXTURE.select_table_column_value(table_name='test', col='name', filtr=Filter(col='id', val='1'))
+    assert Tracer.end() is summary
+    assert summary.statements == 2
+    assert summary.rows == 2
+    assert summary.slow == 2
+    assert all(shape['callers'] == ['tests.test_database.test_trace_collects_rerun_summary_and_slow_queries']
+               for shape in summary.top())
+
+    # Statements beyond the threshold are appended to the slow-query log
+    with open(os.path.join(DB_FIXTURE.dir_name, _trace.LOG_NAME)) as file:
+        records = [json.loads(line) for line in file]
+    assert [i['rows'] for i in records] == [1, 1]
+
+    # Statements are not traced without a summary or threshold
+    Tracer.threshold = None
+    assert Tracer.span(database='test', query='SELECT 1;').tracer is None
+
+
+def test_writer_serializes_and_coalesces_writes(monkeypatch, tmp_path, SCHEMA_FIXTURE: _generic.Schema):
+    monkeypatch.setenv('ASSEMBLIT_DB_WRITER', 'True')
+    Database = _generic.Connection(db_name='writer', dir_name=str(tmp_path))
+    Database.create_table(table_name='test', schema=SCHEMA_FIXTURE)
+    assert Database.writer is _writer.get_writer(database=tmp_path / 'writer.db')
+
+    def insert(i: int):
+        Session = _generic.Connection(db_name='writer', dir_name=str(tmp_path))
+        Session.insert(table_name='test', row=Row(cols=['id', 'name', 'value'], vals=[str(i), 'a', 'A']))
+        Session.close()
+
+    threads = [threading.Thread(target=insert, args=(i,)) for i in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert Database.execute(query='SELECT COUNT(*) FROM test;').fetchone()[0] == 20
+
+    # A failed request does not roll back the other requests of its group
+    failed = Database.submit(statements=[('INSERT INTO missing (id) VALUES (?);', [('1',)])])
+    future = Database.submit(statements=[('DELETE FROM test WHERE id = ?;', [('1',), ('2',)])])
+    assert future.result() == 2
+    with pytest.raises(sqlite3.OperationalError):
+        failed.result()
+
+    # Requests that fail with other exceptions do not stop the writer
+    with pytest.raises(OverflowError):
+        Database.write(query='UPDATE test SET value = ? WHERE id = ?;', params=[2 ** 70, '3'])
+    Database.write(query='UPDATE test SET value = ? WHERE id = ?;', params=['B', '3'])
+    assert Database.execute(query="SELECT value FROM test WHERE id = '3';").fetchone()[0] == 'B'
+
+    statistics = Database.writer.statistics()
+    assert statistics['requests'] == 24
+    assert statistics['failures'] == 2
+
+    Database.close()
+    _writer.dispose()
+    _pool.dispose()
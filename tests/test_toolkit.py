@@ -6,6 +6,7 @@ import textwrap
 import pandas as pd
 import plotly.graph_objects
 from assemblit import toolkit
+from assemblit.toolkit import _dataframe
 from assemblit.toolkit._exceptions import InvalidAggregationRule
 
 
@@ -163,3 +164,21 @@ def test_clean_text_success():
         analytics-as-a-service (AaaS) web-applications.
     """
     assert toolkit.content.clean_text(text=text) == 'Assemblit is helping data analysts and scientists rapidly scale notebooks into analytics-as-a-service (AaaS) web-applications.'
+
+
+def test_dataframe_profile_success(DF: pd.DataFrame):
+    profile = _dataframe.profile(df=DF, sample_size=10)
+    assert profile.datetime == [('week', '%Y-%m-%d')]
+    assert profile.dimensions == ['product', 'place']
+    assert profile.metrics == ['y', 'price', 'tv', 'search']
+
+
+def test_dataframe_profile_confirms_sample_against_column():
+    df = pd.DataFrame({
+        'day': ['01/02/2024'] * 50 + ['02/13/2024'],
+        'month': ['Jan 01, 2024'] * 50 + [None],
+        'flag': [True] * 51
+    })
+    profile = _dataframe.profile(df=df, sample_size=5)
+    assert profile.datetime == [('day', '%m/%d/%Y')]
+    assert profile.dimensions == ['month', 'flag']